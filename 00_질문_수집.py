@@ -26,6 +26,50 @@ try:
 except ImportError:
     STATS_ENABLED = False
 
+# SQLite 스키마 및 집계 카운터
+from utils_db import (
+    COUNTER_TOTAL_LIKES,
+    COUNTER_TOTAL_QUESTIONS,
+    QUESTION_COLUMNS,
+    get_counters,
+    increment_question_likes,
+    init_db,
+    invalidate_counters,
+    refresh_question_counters,
+    reserve_question_ids,
+    start_trash_purger,
+    visits_counter_name,
+)
+
+# questions.db 스냅샷 백업 (관리자 페이지 방문과 관계없이 앱 시작 시 스케줄러 실행)
+from utils_backup import start_backup_scheduler
+
+# 데이터 변경 피드 (버전 카운터 + delta 로그)
+from utils_changes import (
+    CHANGE_UPSERT,
+    get_changed_ids_since,
+    get_data_version,
+    get_questions_snapshot,
+    record_change,
+    refresh_if_stale,
+)
+
+# 세션별 요청 제한 (질문 등록 / 좋아요)
+from utils_ratelimit import check_rate_limit
+
+# Google Sheets 미러 지연 쓰기 (좋아요는 모아서 한 번에 반영)
+from utils_mirror import configure_mirror, flush_mirror, schedule_mirror
+
+# 질문 카드 일괄 렌더링 (컴포넌트를 쓸 수 없을 때)
+from utils_cards import render_card_list_html
+
+# 질문 목록 컴포넌트 (정렬/검색/페이지 이동을 브라우저에서 처리)
+try:
+    from utils_question_list import COMPONENT_AVAILABLE, question_list
+    QUESTION_LIST_COMPONENT_ENABLED = COMPONENT_AVAILABLE
+except ImportError:
+    QUESTION_LIST_COMPONENT_ENABLED = False
+
 # Google Sheets 연동 (선택사항)
 try:
     from st_gsheets_connection import GSheetsConnection
@@ -46,6 +90,12 @@ if 'liked_questions' not in st.session_state:
     st.session_state.liked_questions = set()
 if 'new_question_id' not in st.session_state:
     st.session_state.new_question_id = None
+if 'seen_version' not in st.session_state:
+    st.session_state.seen_version = None
+if 'like_pills_nonce' not in st.session_state:
+    st.session_state.like_pills_nonce = 0
+if 'last_like_seq' not in st.session_state:
+    st.session_state.last_like_seq = None
 
 # 우리은행 블루 컬러
 WOORI_BLUE = "#004C97"
@@ -56,6 +106,12 @@ DATA_FILE = Path(__file__).parent / "questions.json"
 DB_FILE = Path(__file__).parent / "questions.db"
 WORKSHEET_NAME = "questions"
 
+# 질문 목록 한 페이지당 카드 수
+QUESTIONS_PER_PAGE = 20
+
+# 실시간 갱신 확인 주기 (초) - 버전 번호만 확인하므로 부담이 거의 없음
+LIVE_REFRESH_SECONDS = 5
+
 # Google Sheets 연결 (설정되어 있으면 사용)
 conn_gsheet = None
 SPREADSHEET_URL = None
@@ -101,22 +157,6 @@ if USE_GSHEETS:
         conn_gsheet = None
         SPREADSHEET_URL = None
 
-def init_db():
-    """SQLite 데이터베이스 초기화"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS questions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            question TEXT NOT NULL,
-            timestamp TEXT NOT NULL,
-            likes INTEGER DEFAULT 0
-        )
-    ''')
-    conn.commit()
-    conn.close()
-
 def has_service_account(gsheets_config: dict) -> bool:
     """Service Account 인증 설정 여부 확인"""
     required_keys = ["client_email", "private_key", "project_id"]
@@ -135,23 +175,28 @@ def normalize_question_ids(questions):
             q_id = 0
         if q_id > max_id:
             max_id = q_id
-    next_id = max_id + 1
+    next_id = None
     for q in questions:
         try:
             q_id = int(q.get("id", 0)) if q.get("id") is not None else 0
         except Exception:
             q_id = 0
         if q_id <= 0 or q_id in seen:
+            # 새 id는 삭제된 질문의 id와도 겹치지 않도록 예약해서 사용
+            if next_id is None:
+                next_id = reserve_question_ids(at_least=max_id + 1)
+            else:
+                next_id = reserve_question_ids(at_least=next_id + 1)
             q_id = next_id
-            next_id += 1
         seen.add(q_id)
         q["id"] = q_id
     return questions
 
 def load_questions():
     """질문 데이터 로드 - Google Sheets 우선, 없으면 SQLite, 마지막으로 JSON"""
-    # 1. Google Sheets 우선
+    # 1. Google Sheets 우선 (밀린 좋아요를 먼저 시트에 반영해야 예전 값으로 덮어쓰지 않음)
     if USE_GSHEETS and conn_gsheet:
+        flush_mirror()
         try:
             gsheets_config = st.secrets.get("connections", {}).get("gsheets", {})
             spreadsheet_url = gsheets_config.get("spreadsheet", "")
@@ -252,8 +297,11 @@ def save_to_sqlite(questions):
                 q.get('likes', 0)
             ))
         
+        # 집계 카운터도 같은 트랜잭션에서 갱신
+        refresh_question_counters(cursor)
         conn.commit()
         conn.close()
+        invalidate_counters()
     except Exception as e:
         st.error(f"SQLite 저장 오류: {e}")
 
@@ -322,11 +370,25 @@ def save_questions(questions):
     except Exception as e:
         st.error(f"파일 저장 오류: {e}")
 
+def write_sheets_mirror(rows):
+    """SQLite의 질문 목록으로 Google Sheets 워크시트를 덮어씀 (미러 지연 쓰기에서 호출)"""
+    df = pd.DataFrame(rows, columns=QUESTION_COLUMNS).fillna('')
+    spreadsheet_url = st.secrets.get("connections", {}).get("gsheets", {}).get("spreadsheet", "")
+    if spreadsheet_url:
+        conn_gsheet.update(spreadsheet=spreadsheet_url, worksheet=WORKSHEET_NAME, data=df)
+    else:
+        conn_gsheet.update(worksheet=WORKSHEET_NAME, data=df)
+    st.cache_data.clear()
+
+if USE_GSHEETS and conn_gsheet:
+    configure_mirror(write_sheets_mirror)
+
 def add_question(name, question):
     """새 질문 추가"""
     questions = load_questions()
     max_id = max([q.get("id", 0) for q in questions], default=0)
-    new_id = max_id + 1
+    # 삭제된 질문의 id는 다시 쓰지 않음 (SQLite에 기록된 최대 id 다음 번호)
+    new_id = reserve_question_ids(at_least=max_id + 1)
     new_question = {
         "id": new_id,
         "name": name,
@@ -336,22 +398,73 @@ def add_question(name, question):
     }
     questions.append(new_question)
     save_questions(questions)
+    record_change(CHANGE_UPSERT, rows=[new_question])
     st.session_state.new_question_id = new_id
     return new_id
 
-def like_question(question_id):
+def like_question(question_id, rerun=True):
     """질문 좋아요 (중복 방지)"""
     if question_id in st.session_state.liked_questions:
         return
     
-    questions = load_questions()
-    for q in questions:
-        if q["id"] == question_id:
-            q["likes"] = q.get("likes", 0) + 1
-            st.session_state.liked_questions.add(question_id)
-            break
-    save_questions(questions)
-    st.rerun()
+    allowed, retry_after = check_rate_limit("like")
+    if not allowed:
+        st.toast(f"⏳ 좋아요 요청이 너무 많습니다. {retry_after:.0f}초 후 다시 시도해주세요.")
+        return
+    
+    # SQLite에서 UPDATE 한 번으로 증가
+    liked = increment_question_likes(question_id)
+    if liked:
+        st.session_state.liked_questions.add(question_id)
+        record_change(CHANGE_UPSERT, rows=[liked])
+        # Google Sheets는 워크시트 단위로만 쓸 수 있으므로 클릭마다 쓰지 않고 모아서 한 번에 반영
+        schedule_mirror()
+    else:
+        # SQLite를 쓸 수 없으면 전체 로드 후 저장
+        questions = load_questions()
+        for q in questions:
+            if q["id"] == question_id:
+                q["likes"] = q.get("likes", 0) + 1
+                st.session_state.liked_questions.add(question_id)
+                liked = q
+                break
+        save_questions(questions)
+        if liked:
+            record_change(CHANGE_UPSERT, rows=[liked])
+    if rerun:
+        st.rerun()
+
+@st.fragment
+def render_question_list_component():
+    """질문 목록 컴포넌트 - 좋아요 이벤트가 오면 이 영역만 다시 실행"""
+    version, questions = get_questions_snapshot(load_questions)
+    like_event = question_list(
+        version,
+        questions,
+        st.session_state.liked_questions,
+        sort_option=st.session_state.sort_option,
+        new_id=st.session_state.new_question_id,
+        page_size=QUESTIONS_PER_PAGE,
+        like_seq=st.session_state.last_like_seq,
+        key="question_list"
+    )
+    st.session_state.new_question_id = None
+    if like_event and like_event.get("seq") != st.session_state.last_like_seq:
+        st.session_state.last_like_seq = like_event.get("seq")
+        like_question(like_event.get("id"), rerun=False)
+        # 처리 결과(요청 제한으로 버려진 좋아요 포함)를 컴포넌트에 바로 돌려줌
+        st.rerun(scope="fragment")
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def watch_question_changes():
+    """
+    데이터 버전이 바뀌었을 때만 화면 갱신 (평소에는 버전 번호만 확인)
+    - 일정 시간마다 저장소를 다시 읽어 Google Sheets에서 직접 고친 내용도 반영
+    """
+    refresh_if_stale(load_questions)
+    seen_version = st.session_state.seen_version
+    if seen_version is not None and get_data_version() != seen_version:
+        st.rerun()
 
 # 커스텀 CSS - 정리된 모던 디자인
 st.markdown(f"""
@@ -456,6 +569,18 @@ st.markdown(f"""
         animation: highlight 2s ease;
     }}
     
+    .question-card.updated-question {{
+        animation: highlight 2s ease;
+    }}
+    
+    .question-list .question-card {{
+        counter-increment: question-rank;
+    }}
+    
+    .question-rank::before {{
+        content: "#" counter(question-rank);
+    }}
+    
     @keyframes highlight {{
         0% {{ border-color: {WOORI_LIGHT_BLUE}; }}
         100% {{ border-color: rgba(255, 255, 255, 0.12); }}
@@ -539,6 +664,12 @@ st.markdown(f"""
 </style>
 """, unsafe_allow_html=True)
 
+# 휴지통 정리 스레드 (보관 기간이 지난 항목 영구 삭제, 프로세스당 한 번만 시작)
+start_trash_purger()
+
+# DB 스냅샷 백업 스레드 (프로세스당 한 번만 시작)
+start_backup_scheduler()
+
 # 방문 추적
 if STATS_ENABLED:
     try:
@@ -558,18 +689,23 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# KPI 박스 - 별도 구역
-all_questions = load_questions()
-total_likes = sum(q.get("likes", 0) for q in all_questions)
-today_visits = 0
-if STATS_ENABLED:
-    try:
-        from utils_stats import load_stats, get_daily_stats
-        stats = load_stats()
-        daily_stats = get_daily_stats(stats)
-        today_visits = daily_stats.get('total_visits', 0)  # 오늘 총 조회수
-    except:
-        pass
+# 질문 스냅샷 (데이터 버전이 바뀌었을 때만 저장소에서 다시 로드)
+data_version, all_questions = get_questions_snapshot(load_questions)
+if st.session_state.seen_version is None:
+    changed_ids = set()
+else:
+    changed_ids = get_changed_ids_since(st.session_state.seen_version) or set()
+
+# KPI 박스 - 별도 구역 (쓰기 때 갱신되는 집계 카운터를 메모리에서 읽음)
+kpi_counters = get_counters()
+if COUNTER_TOTAL_QUESTIONS in kpi_counters:
+    total_questions_count = kpi_counters[COUNTER_TOTAL_QUESTIONS]
+    total_likes = kpi_counters.get(COUNTER_TOTAL_LIKES, 0)
+else:
+    # SQLite를 사용할 수 없는 환경 (JSON 저장)
+    total_questions_count = len(all_questions)
+    total_likes = sum(q.get("likes", 0) for q in all_questions)
+today_visits = kpi_counters.get(visits_counter_name(), 0) if STATS_ENABLED else 0  # 오늘 총 조회수
 
 # KPI를 박스 안에 배치
 st.markdown(f"""
@@ -579,7 +715,7 @@ st.markdown(f"""
     <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; text-align: center;">
         <div>
             <div style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem; margin-bottom: 0.5rem;">📊 총 질문 수</div>
-            <div style="color: #ffffff; font-size: 2rem; font-weight: 700;">{len(all_questions)}</div>
+            <div style="color: #ffffff; font-size: 2rem; font-weight: 700;">{total_questions_count}</div>
         </div>
         <div>
             <div style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem; margin-bottom: 0.5rem;">👍 총 좋아요</div>
@@ -634,10 +770,14 @@ with col_form:
                 if len(question.strip()) > 1000:
                     st.error("⚠️ 질문은 1000자 이하로 작성해주세요.")
                 else:
-                    display_name = name.strip() if (use_name and name.strip()) else "익명"
-                    new_id = add_question(display_name, question.strip())
-                    st.success("✅ 질문이 등록되었습니다!")
-                    st.rerun()
+                    allowed, retry_after = check_rate_limit("submit")
+                    if not allowed:
+                        st.warning(f"⏳ 질문 등록이 너무 빠릅니다. {retry_after:.0f}초 후 다시 시도해주세요.")
+                    else:
+                        display_name = name.strip() if (use_name and name.strip()) else "익명"
+                        new_id = add_question(display_name, question.strip())
+                        st.success("✅ 질문이 등록되었습니다!")
+                        st.rerun()
             else:
                 st.error("⚠️ 질문 내용을 입력해주세요.")
 
@@ -645,112 +785,133 @@ with col_form:
 with col_list:
     st.markdown("### 📋 등록된 질문 목록")
     
-    # 검색 및 정렬 (통일된 스타일)
-    search_col, sort_col = st.columns([2, 1])
-    with search_col:
-        search_input = st.text_input(
-            "🔎 검색",
-            placeholder="키워드로 검색...",
-            key="search_main",
-            value=st.session_state.search_query,
-            label_visibility="collapsed"
-        )
-        if search_input != st.session_state.search_query:
-            st.session_state.search_query = search_input
-    
-    with sort_col:
-        sort_index = ["👍 좋아요 순", "🕒 최신순", "📝 작성자순"].index(st.session_state.sort_option)
-        sort_select = st.selectbox(
-            "정렬",
-            ["👍 좋아요 순", "🕒 최신순", "📝 작성자순"],
-            key="sort_main",
-            label_visibility="collapsed",
-            index=sort_index
-        )
-        if sort_select != st.session_state.sort_option:
-            st.session_state.sort_option = sort_select
-    
-    # 질문 필터링 및 정렬
-    questions = load_questions()
-    if st.session_state.search_query:
-        questions = [q for q in questions if st.session_state.search_query.lower() in q["question"].lower()]
-    
-    if st.session_state.sort_option == "👍 좋아요 순":
-        questions_sorted = sorted(questions, key=lambda x: x.get("likes", 0), reverse=True)
-    elif st.session_state.sort_option == "🕒 최신순":
-        questions_sorted = sorted(questions, key=lambda x: x.get("timestamp", ""), reverse=True)
-    elif st.session_state.sort_option == "📝 작성자순":
-        questions_sorted = sorted(questions, key=lambda x: x.get("name", "익명"))
+    if QUESTION_LIST_COMPONENT_ENABLED:
+        render_question_list_component()
     else:
-        questions_sorted = sorted(questions, key=lambda x: x.get("likes", 0), reverse=True)
-    
-    # 질문 목록 표시
-    if not questions:
+        # 검색 및 정렬 (통일된 스타일)
+        search_col, sort_col = st.columns([2, 1])
+        with search_col:
+            search_input = st.text_input(
+                "🔎 검색",
+                placeholder="키워드로 검색...",
+                key="search_main",
+                value=st.session_state.search_query,
+                label_visibility="collapsed"
+            )
+            if search_input != st.session_state.search_query:
+                st.session_state.search_query = search_input
+    
+        with sort_col:
+            sort_index = ["👍 좋아요 순", "🕒 최신순", "📝 작성자순"].index(st.session_state.sort_option)
+            sort_select = st.selectbox(
+                "정렬",
+                ["👍 좋아요 순", "🕒 최신순", "📝 작성자순"],
+                key="sort_main",
+                label_visibility="collapsed",
+                index=sort_index
+            )
+            if sort_select != st.session_state.sort_option:
+                st.session_state.sort_option = sort_select
+    
+        # 질문 필터링 및 정렬
+        questions = list(all_questions)
         if st.session_state.search_query:
-            st.warning(f"🔍 '{st.session_state.search_query}'에 대한 검색 결과가 없습니다.")
-            if st.button("🔍 검색 초기화", width="stretch"):
-                st.session_state.search_query = ""
-                st.rerun()
+            questions = [q for q in questions if st.session_state.search_query.lower() in q["question"].lower()]
+    
+        if st.session_state.sort_option == "👍 좋아요 순":
+            questions_sorted = sorted(questions, key=lambda x: x.get("likes", 0), reverse=True)
+        elif st.session_state.sort_option == "🕒 최신순":
+            questions_sorted = sorted(questions, key=lambda x: x.get("timestamp", ""), reverse=True)
+        elif st.session_state.sort_option == "📝 작성자순":
+            questions_sorted = sorted(questions, key=lambda x: x.get("name", "익명"))
         else:
-            # 빈 상태 UI 개선 (작고 명확하게)
-            st.markdown("""
-            <div class="empty-state">
-                <p style="color: rgba(255, 255, 255, 0.8); font-size: 1rem; margin-bottom: 1rem;">
-                    아직 등록된 질문이 없습니다
-                </p>
-                <p style="color: rgba(255, 255, 255, 0.5); font-size: 0.85rem; margin: 0;">
-                    왼쪽 폼에서 첫 번째 질문을 작성해보세요! 💡
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        # 검색 결과 표시
-        if st.session_state.search_query:
-            st.info(f"🔍 '{st.session_state.search_query}' 검색 결과: {len(questions_sorted)}개")
+            questions_sorted = sorted(questions, key=lambda x: x.get("likes", 0), reverse=True)
+    
+        # 질문 목록 표시
+        if not questions:
+            if st.session_state.search_query:
+                st.warning(f"🔍 '{st.session_state.search_query}'에 대한 검색 결과가 없습니다.")
+                if st.button("🔍 검색 초기화", width="stretch"):
+                    st.session_state.search_query = ""
+                    st.rerun()
+            else:
+                # 빈 상태 UI 개선 (작고 명확하게)
+                st.markdown("""
+                <div class="empty-state">
+                    <p style="color: rgba(255, 255, 255, 0.8); font-size: 1rem; margin-bottom: 1rem;">
+                        아직 등록된 질문이 없습니다
+                    </p>
+                    <p style="color: rgba(255, 255, 255, 0.5); font-size: 0.85rem; margin: 0;">
+                        왼쪽 폼에서 첫 번째 질문을 작성해보세요! 💡
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+        else:
+            # 검색 결과 표시
+            if st.session_state.search_query:
+                st.info(f"🔍 '{st.session_state.search_query}' 검색 결과: {len(questions_sorted)}개")
         
-        # 질문 개수 표시
-        total_questions = len(load_questions())
-        if len(questions_sorted) != total_questions:
-            st.caption(f"전체 {total_questions}개 중 {len(questions_sorted)}개 표시")
+            # 질문 개수 표시
+            total_questions = len(all_questions)
+            if len(questions_sorted) != total_questions:
+                st.caption(f"전체 {total_questions}개 중 {len(questions_sorted)}개 표시")
         
-        # 질문 카드 표시
-        for idx, q in enumerate(questions_sorted, 1):
-            name_display = q.get("name", "익명")
-            is_anonymous = name_display == "익명"
-            is_new = q['id'] == st.session_state.new_question_id
-            
-            card_class = "question-card new-question" if is_new else "question-card"
-            
-            st.markdown(f"""
-            <div class="{card_class}">
-                <div class="question-header">
-                    #{idx} {name_display}{'님' if not is_anonymous else ''}의 질문
-                </div>
-                <div class="question-text">
-                    {q["question"]}
-                </div>
-                <div class="question-meta">
-                    <span>🕒 {q["timestamp"]}</span>
-                    <span>👍 좋아요 {q.get("likes", 0)}개</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            col_like, col_space, col_id = st.columns([3, 7, 2])
-            with col_like:
-                if q['id'] in st.session_state.liked_questions:
-                    st.button("✅ 좋아요 완료", key=f"like_{q['id']}", width="stretch", disabled=True)
-                else:
-                    if st.button("👍 좋아요", key=f"like_{q['id']}", width="stretch"):
-                        like_question(q["id"])
-            with col_id:
-                st.caption(f"#{q['id']}")
-            
-            st.markdown("---")
+            # 페이지 나누기
+            total_pages = max(1, (len(questions_sorted) + QUESTIONS_PER_PAGE - 1) // QUESTIONS_PER_PAGE)
+            if st.session_state.get("list_page", 1) > total_pages:
+                st.session_state.list_page = total_pages
+            page = st.session_state.get("list_page", 1)
+            page_start = (page - 1) * QUESTIONS_PER_PAGE
+            page_questions = questions_sorted[page_start:page_start + QUESTIONS_PER_PAGE]
+        
+            # 질문 카드 표시 - 한 페이지를 하나의 HTML 블록으로 전송 (카드 HTML은 메모이즈)
+            card_classes = {}
+            for q in page_questions:
+                if q['id'] == st.session_state.new_question_id:
+                    card_classes[q['id']] = "question-card new-question"
+                elif q['id'] in changed_ids:
+                    card_classes[q['id']] = "question-card updated-question"
+            st.markdown(
+                render_card_list_html(
+                    page_questions,
+                    start_rank=page_start + 1,
+                    card_classes=card_classes,
+                    liked_ids=st.session_state.liked_questions,
+                ),
+                unsafe_allow_html=True
+            )
+        
+            # 좋아요 - 카드마다 버튼을 두지 않고 페이지당 하나의 선택 위젯 사용
+            like_options = [q['id'] for q in page_questions if q['id'] not in st.session_state.liked_questions]
+            if like_options:
+                liked_id = st.pills(
+                    "👍 좋아요 누르기",
+                    like_options,
+                    format_func=lambda q_id: f"👍 #{q_id}",
+                    selection_mode="single",
+                    key=f"like_pills_{st.session_state.like_pills_nonce}"
+                )
+                if liked_id is not None:
+                    # 다음 실행에서 선택 상태가 초기화되도록 위젯 키 교체
+                    st.session_state.like_pills_nonce += 1
+                    like_question(liked_id)
         
-        # 새 질문 하이라이트 초기화
-        if st.session_state.new_question_id:
-            st.session_state.new_question_id = None
+            if total_pages > 1:
+                st.number_input(
+                    f"페이지 (전체 {total_pages}쪽)",
+                    min_value=1,
+                    max_value=total_pages,
+                    step=1,
+                    key="list_page"
+                )
+        
+            # 새 질문 하이라이트 초기화
+            if st.session_state.new_question_id:
+                st.session_state.new_question_id = None
+    
+    # 이 세션이 화면에 반영한 데이터 버전 기록 후 변경 감시
+    st.session_state.seen_version = data_version
+    watch_question_changes()
 
 # 사이드바 - 메뉴 + 필터
 with st.sidebar:
@@ -759,26 +920,28 @@ with st.sidebar:
     st.page_link("pages/01_런치톡_후기.py", label="런치톡 후기", icon="📝")
     st.page_link("pages/02_관리자.py", label="관리자", icon="🔐")
     
-    st.markdown("---")
-    st.markdown("### 🔍 필터 및 정렬")
+    # 컴포넌트를 쓸 때는 검색/정렬을 브라우저에서 처리
+    if not QUESTION_LIST_COMPONENT_ENABLED:
+        st.markdown("---")
+        st.markdown("### 🔍 필터 및 정렬")
     
-    search_sidebar = st.text_input(
-        "🔎 질문 검색",
-        placeholder="키워드로 검색...",
-        key="search_sidebar",
-        value=st.session_state.search_query
-    )
-    if search_sidebar != st.session_state.search_query:
-        st.session_state.search_query = search_sidebar
+        search_sidebar = st.text_input(
+            "🔎 질문 검색",
+            placeholder="키워드로 검색...",
+            key="search_sidebar",
+            value=st.session_state.search_query
+        )
+        if search_sidebar != st.session_state.search_query:
+            st.session_state.search_query = search_sidebar
     
-    st.markdown("---")
+        st.markdown("---")
     
-    sort_index = ["👍 좋아요 순", "🕒 최신순", "📝 작성자순"].index(st.session_state.sort_option)
-    sort_sidebar = st.radio(
-        "정렬 기준",
-        ["👍 좋아요 순", "🕒 최신순", "📝 작성자순"],
-        key="sort_sidebar",
-        index=sort_index
-    )
-    if sort_sidebar != st.session_state.sort_option:
-        st.session_state.sort_option = sort_sidebar
+        sort_index = ["👍 좋아요 순", "🕒 최신순", "📝 작성자순"].index(st.session_state.sort_option)
+        sort_sidebar = st.radio(
+            "정렬 기준",
+            ["👍 좋아요 순", "🕒 최신순", "📝 작성자순"],
+            key="sort_sidebar",
+            index=sort_index
+        )
+        if sort_sidebar != st.session_state.sort_option:
+            st.session_state.sort_option = sort_sidebar
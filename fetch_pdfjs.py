@@ -0,0 +1,42 @@
+"""
+pdf.js 배포 파일을 components/pdf_viewer/pdfjs 폴더로 받아 두는 스크립트
+- 빌드 단계(Dockerfile)나 배포 전에 한 번 실행: python fetch_pdfjs.py
+- 받아 둔 뒤에는 뷰어가 외부 CDN 없이 동작
+"""
+
+import sys
+import urllib.request
+from pathlib import Path
+
+PDFJS_VERSION = "3.11.174"
+PDFJS_BASE_URL = f"https://cdnjs.cloudflare.com/ajax/libs/pdf.js/{PDFJS_VERSION}"
+PDFJS_FILES = ["pdf.min.js", "pdf.worker.min.js"]
+
+TARGET_DIR = Path(__file__).parent / "components" / "pdf_viewer" / "pdfjs"
+
+
+def fetch_pdfjs(force=False):
+    """pdf.js 파일 다운로드 (이미 있으면 건너뜀), 실패하면 False"""
+    TARGET_DIR.mkdir(parents=True, exist_ok=True)
+    ok = True
+    for name in PDFJS_FILES:
+        target = TARGET_DIR / name
+        if target.exists() and not force:
+            print(f"{name}: 이미 있음")
+            continue
+        try:
+            with urllib.request.urlopen(f"{PDFJS_BASE_URL}/{name}", timeout=30) as response:
+                data = response.read()
+        except Exception as e:
+            print(f"{name}: 다운로드 실패 ({e})")
+            ok = False
+            continue
+        partial = target.with_name(f".{name}.partial")
+        partial.write_bytes(data)
+        partial.replace(target)
+        print(f"{name}: {len(data):,} bytes")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if fetch_pdfjs(force="--force" in sys.argv) else 1)
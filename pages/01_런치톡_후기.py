@@ -4,12 +4,40 @@
 """
 
 from pathlib import Path
-import base64
-import re
+import html
+import json
+import time
 
 import streamlit as st
 import streamlit.components.v1 as components
 
+# PDF를 내용 해시 기반 정적 파일 URL로 제공
+from utils_static import publish_static_asset
+
+# 자체 호스팅 pdf.js 뷰어 컴포넌트 (Range 요청으로 필요한 페이지만 로드)
+from utils_pdf_viewer import pdf_viewer
+
+# summary / blog 파싱 결과 캐시 (파일이 바뀔 때만 다시 파싱)
+from utils_documents import load_document, parse_blog, parse_summary
+
+# PDF 페이지 썸네일 (PyMuPDF가 있을 때만)
+from utils_thumbnails import get_thumbnail_srcset, start_thumbnail_prerender
+
+# 녹취록 전문 검색 (SQLite FTS5)
+from utils_transcripts import (
+    count_segments,
+    ensure_transcript_index,
+    format_timestamp,
+    parse_timestamp,
+    read_segments,
+    search_transcripts,
+    segments_at,
+    segment_index_at,
+)
+
+# 런치톡 카탈로그 (lunch_talk_record의 런치톡별 자료 목록)
+from utils_catalog import all_asset_paths, asset_path, list_talks
+
 # 페이지 기본 설정
 st.set_page_config(
     page_title="런치톡 후기",
@@ -23,122 +51,70 @@ PASSWORD = "200fisa626"
 BASE_DIR = Path(__file__).parent.parent
 RECORD_DIR = BASE_DIR / "lunch_talk_record"
 
-SUMMARY_FILE = RECORD_DIR / "lunch_talk_summary.txt"
-BLOG_FILE = RECORD_DIR / "google_nootbook_blog.txt"
-AUDIO_FILE = RECORD_DIR / "금융_IT_자소서엔_기술_스택_말고_고민을_담아라.m4a"
-PDF_FILE = RECORD_DIR / "현직_선배의_금융_IT_공략집.pdf"
+# 런치톡 목록 (talk.json / 하위 폴더 단위, 파일이 바뀐 런치톡만 다시 읽음)
+TALKS = list_talks(RECORD_DIR)
 
-# 멘토 프로필 PDF (사진이 포함된 프로필 PDF라 가정)
-MENTOR_PDF_SONG = RECORD_DIR / "(우리FISA 6기) 런치톡 멘토 프로필_송지현 계장님.pdf"
-MENTOR_PDF_KIM = RECORD_DIR / "(우리FISA 6기) 런치톡 멘토 프로필_김혁준 계장님.pdf"
+# 모든 런치톡의 PDF 썸네일을 백그라운드에서 미리 렌더링 (프로세스당 한 번)
+start_thumbnail_prerender(all_asset_paths(".pdf", RECORD_DIR))
 
 
-def load_text(path: Path) -> str:
-    """텍스트 파일을 안전하게 읽기"""
-    try:
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-    except Exception:
-        pass
-    return ""
+def jump_to_audio(seconds: int) -> None:
+    """팟캐스트 플레이어 시작 위치 지정 후 팟캐스트 화면으로 이동 (버튼 콜백)"""
+    st.session_state["audio_start_seconds"] = int(seconds)
+    st.session_state["review_section"] = "audio"
+    st.toast(f"🎧 {format_timestamp(seconds)}부터 재생합니다.")
 
 
-def format_summary_text(raw: str) -> str:
+def open_transcript_at(seconds: int) -> None:
+    """녹취록 보기 화면에서 해당 시간 구간부터 보기 (버튼 콜백)"""
+    st.session_state["transcript_seek_seconds"] = int(seconds)
+    st.session_state["review_section"] = "transcript"
+
+
+def render_transcript_link(seconds: int, key: str, segment: dict | None) -> None:
     """
-    원본 summary 텍스트에서:
-    - '### 인터뷰 정보' 제목 제거
-    - 시간 표기([09:44] 등) 제거
-    - Q/A 블록을 조금 더 눈에 띄게 정리
+    시간 표기가 있는 Q/A 아래에 해당 녹취록 구간 표시
+    - 오디오가 녹취록과 같은 시간축일 때만(talk.json audio_matches_transcript) 오디오 이동 버튼도 표시
     """
-    if not raw.strip():
-        return ""
-
-    lines = raw.splitlines()
-    filtered = []
-    for line in lines:
-        stripped = line.strip()
-        # '인터뷰 정보' 제목은 제거
-        if stripped.startswith("### 인터뷰 정보"):
-            continue
-        # 시간 태그 제거
-        no_time = re.sub(r"\[\d{2}:\d{2}\]", "", line).rstrip()
-        filtered.append(no_time)
-
-    processed: list[str] = []
-    for line in filtered:
-        stripped = line.lstrip()
-
-        # 섹션 헤더는 그대로 (조금 띄워 주기)
-        if stripped.startswith("**["):
-            processed.append("")
-            processed.append(stripped)
-        # 질문: 굵게 한 줄로 강조
-        elif stripped.startswith("- **Q:"):
-            q_text = stripped[len("- ") :].strip()  # "- " 제거
-            processed.append("")
-            processed.append(q_text)  # 이미 **Q: ...** 형태
-            processed.append("")  # 질문과 답변 사이 공백 한 줄
-        # 답변: 말풍선 이모지 + bullet 로 줄마다 분리
-        elif stripped.startswith("- A:"):
-            a_text = stripped[len("- A:") :].strip()
-            processed.append(f"- 💬 {a_text}")
-        else:
-            processed.append(line)
-
-    return "\n".join(processed)
-
-
-def render_qa_body(body: str) -> None:
+    if AUDIO_MATCHES_TRANSCRIPT:
+        col_play, col_script = st.columns([1, 3])
+        with col_play:
+            st.button(
+                f"▶ {format_timestamp(seconds)}부터 듣기",
+                key=f"jump_{key}",
+                on_click=jump_to_audio,
+                args=(seconds,),
+            )
+    else:
+        col_script = st.container()
+    with col_script:
+        with st.expander(f"📜 녹취록 {format_timestamp(seconds)}"):
+            if segment is None:
+                st.caption("해당 시간의 녹취록 구간을 찾을 수 없습니다.")
+            else:
+                st.caption(f"{segment['timestamp']} · {segment['speaker']}")
+                st.markdown(segment["text"])
+                st.button(
+                    "📜 녹취록에서 이어 보기",
+                    key=f"open_transcript_{key}",
+                    on_click=open_transcript_at,
+                    args=(seconds,),
+                )
+
+
+def render_qa_blocks(
+    qa_blocks: list[tuple[str, list[str], int | None]], body: str, key: str, segments: dict
+) -> None:
     """
-    Summary 섹션 본문에서 Q/A 쌍을 찾아
-    - Q/A 한 묶음씩 카드 형태로 렌더링
+    Summary 섹션의 Q/A 쌍을
+    - Q/A 한 묶음씩 카드 형태로 렌더링 (Q/A가 없으면 본문 그대로)
+    - 시간 표기가 있으면 녹취록 구간(segments: 시간 -> 구간, 미리 한 번에 조회)과 이동 링크 추가
     """
-    lines = body.splitlines()
-    qa_blocks: list[tuple[str, str]] = []
-
-    def normalize_line(line: str) -> str:
-        return line.strip().strip("*").strip()
-
-    def is_q_line(line: str) -> bool:
-        return normalize_line(line).startswith("Q.")
-
-    def is_a_line(line: str) -> bool:
-        return normalize_line(line).startswith("A.")
-
-    i = 0
-    n = len(lines)
-    while i < n:
-        line = lines[i]
-        if is_q_line(line):
-            q_text = normalize_line(line)[2:].strip()
-            i += 1
-
-            # 공백 라인은 스킵
-            while i < n and not lines[i].strip():
-                i += 1
-
-            answer_parts: list[str] = []
-            if i < n and is_a_line(lines[i]):
-                first = normalize_line(lines[i])[2:].strip()
-                if first:
-                    answer_parts.append(first)
-                i += 1
-
-            while i < n and not is_q_line(lines[i]):
-                answer_parts.append(lines[i])
-                i += 1
-
-            answer = "\n".join(answer_parts).strip()
-            qa_blocks.append((q_text, answer))
-        else:
-            i += 1
-
     if not qa_blocks:
         st.markdown(body)
         return
 
-    for q_text, answer in qa_blocks:
-        answer_lines = [ln.strip() for ln in answer.splitlines() if ln.strip()]
+    for index, (q_text, answer_lines, seconds) in enumerate(qa_blocks):
         answer_html = "<br/>".join(answer_lines)
         qa_html = f"""
 <div class="qa-card">
@@ -147,58 +123,15 @@ def render_qa_body(body: str) -> None:
 </div>
 """
         st.markdown(qa_html, unsafe_allow_html=True)
-
-
-def format_blog_text(raw: str) -> str:
-    """
-    일반 텍스트 형태의 블로그 글을 마크다운 형태로 보기 좋게 변환.
-    - 첫 번째 줄: 큰 제목
-    - 구분선(----, ----)은 마크다운 수평선으로
-    - '1. [Takeaway ...]' 같은 라인은 섹션 제목으로 처리
-    """
-    if not raw.strip():
-        return ""
-
-    lines = raw.splitlines()
-    # 첫 번째 비어있지 않은 줄을 제목으로 사용
-    title_idx = None
-    for i, line in enumerate(lines):
-        if line.strip():
-            title_idx = i
-            break
-
-    markdown_parts = []
-
-    if title_idx is not None:
-        title = lines[title_idx].strip()
-        markdown_parts.append(f"## {title}")
-        markdown_parts.append("")  # 공백 줄
-
-    for i, line in enumerate(lines):
-        if title_idx is not None and i == title_idx:
-            continue  # 이미 제목으로 사용
-
-        stripped = line.strip()
-
-        # 긴 구분선 -> 수평선
-        if set(stripped) == {"-"} and len(stripped) >= 4:
-            markdown_parts.append("---")
-            continue
-
-        # 번호 매겨진 Takeaway 제목
-        if stripped and stripped[0].isdigit() and stripped[1:3] in [". ", ".)"]:
-            markdown_parts.append(f"### {stripped}")
-            continue
-
-        markdown_parts.append(line)
-
-    return "\n".join(markdown_parts)
+        if seconds is not None:
+            render_transcript_link(seconds, key=f"{key}_{index}", segment=segments.get(seconds))
 
 
 def pdf_to_html_embed(path: Path, height: int = 820) -> None:
     """
     PDF를 내장 iframe 뷰어로 임베드.
     - streamlit[pdf] 컴포넌트 없이도 동작하도록 st.pdf는 사용하지 않음
+    - PDF는 정적 파일 URL로 불러옴 (브라우저 캐시 사용, 재실행마다 base64 인코딩하지 않음)
     - 별도의 다운로드 버튼은 제공하지 않고, 페이지 내에서만 열람 가능하도록 구성
     (브라우저/환경 특성상 완전한 다운로드 차단은 기술적으로 불가능합니다.)
     """
@@ -207,9 +140,11 @@ def pdf_to_html_embed(path: Path, height: int = 820) -> None:
         return
 
     try:
-        with path.open("rb") as f:
-            pdf_bytes = f.read()
-        b64 = base64.b64encode(pdf_bytes).decode("utf-8")
+        pdf_url = publish_static_asset(path)
+        if pdf_viewer(pdf_url, height=height):
+            return
+
+        # 컴포넌트를 쓸 수 없을 때: CDN의 pdf.js로 그리는 기존 뷰어
 
         # pdf.js 기반 간단 뷰어
         html = f"""
@@ -224,7 +159,8 @@ def pdf_to_html_embed(path: Path, height: int = 820) -> None:
 
         <script src="https://cdnjs.cloudflare.com/ajax/libs/pdf.js/3.11.174/pdf.min.js"></script>
         <script>
-            const pdfData = atob("{b64}");
+            // 정적 파일 경로는 페이지 주소 기준 상대 경로 (baseUrlPath가 있어도 동작)
+            const pdfUrl = new URL({json.dumps(pdf_url)}, document.baseURI).href;
             const pdfjsLib = window['pdfjs-dist/build/pdf'];
             pdfjsLib.GlobalWorkerOptions.workerSrc = "https://cdnjs.cloudflare.com/ajax/libs/pdf.js/3.11.174/pdf.worker.min.js";
 
@@ -285,7 +221,7 @@ def pdf_to_html_embed(path: Path, height: int = 820) -> None:
             document.getElementById('prev').addEventListener('click', onPrevPage);
             document.getElementById('next').addEventListener('click', onNextPage);
 
-            const loadingTask = pdfjsLib.getDocument({{data: pdfData}});
+            const loadingTask = pdfjsLib.getDocument({{url: pdfUrl}});
             loadingTask.promise.then(function(pdf) {{
                 pdfDoc = pdf;
                 renderPage(pageNum);
@@ -297,38 +233,49 @@ def pdf_to_html_embed(path: Path, height: int = 820) -> None:
         st.error(f"PDF를 표시하는 중 오류가 발생했습니다: {e}")
 
 
-# 기존 요약에 보완 내용을 덧붙인 summary (원본 파일은 수정하지 않음)
-EXTRA_SUMMARY = """
-### 🔎 대화 맥락 & 추가 정리
-
-- 런치톡 분위기와 시작  
-  - 클라우드/AI 반의 반장 이야기, 반의 성향(다소 소심하지만 점점 친해지는 분위기), 아이스브레이킹 게임 등으로 친해지는 과정이 먼저 언급되었습니다.  
-  - 태국 음식점에서 세트 메뉴와 음료를 고르며 자연스럽게 대화를 시작했고, 편안한 점심 자리라는 분위기가 강조되었습니다.
+def render_pdf_preview(path: Path, key: str, height: int = 820) -> None:
+    """
+    PDF 첫 페이지를 가벼운 이미지로 먼저 보여주고, 요청할 때만 pdf.js 뷰어를 불러옴.
+    - 썸네일이 아직 없으면(렌더링 중이거나 PyMuPDF 미설치) 기존처럼 뷰어를 바로 표시
+    """
+    if not path.exists():
+        st.info(f"`{path.name}` 파일을 찾을 수 없습니다.")
+        return
 
-- 교육생들의 배경과 관계  
-  - AI·클라우드 등 과정별로 이미 취업한 친구, 인턴 경험이 있는 동기 등 다양한 배경의 교육생들이 함께했고, 서로의 진로와 고민을 공유하는 자리가 되었습니다.  
-  - 특히 이미 취업한 동기(석·박사, 인턴 경험 보유) 사례를 통해 “스펙만이 아니라 방향 설정과 지원 전략”이 중요하다는 메시지가 나왔습니다.
+    thumbnail = get_thumbnail_srcset(path)
+    if thumbnail is None:
+        pdf_to_html_embed(path, height=height)
+        return
 
-- 인턴십의 실제 모습  
-  - 금융권 인턴은 보안/권한 문제로 인해 “실제 개발 업무를 깊게 맡기기보다는 환경 이해와 공부 중심의 체험”에 가깝다는 현실적인 설명이 있었습니다.  
-  - 그럼에도 불구하고 현업 환경을 가까이에서 보고, 실무자와 직접 대화하는 경험 자체가 큰 자산이라는 점을 여러 번 강조했습니다.
+    src, srcset = thumbnail
+    if st.toggle("🔍 PDF 뷰어로 보기", key=f"pdf_viewer_{key}"):
+        pdf_to_html_embed(path, height=height)
+    else:
+        st.markdown(
+            f"""
+            <img src="{src}" srcset="{srcset}" sizes="(max-width: 768px) 100vw, 50vw"
+                 loading="lazy" decoding="async" alt="{path.stem}"
+                 style="width:100%; border-radius:12px; border:1px solid rgba(255,255,255,0.15); background:#fff;" />
+            """,
+            unsafe_allow_html=True,
+        )
 
-- 자소서·포트폴리오를 위한 기록 습관  
-  - 프로젝트를 하면서 노션, 엑셀, 업무일지 등으로 매일 기록해 두면 나중에 자소서나 면접 준비가 훨씬 수월하다는 팁이 나왔습니다.  
-  - “처음부터 완벽하게 구조를 잡으려 하지 말고, 일단 다 써놓고 나중에 분류/정리하라”는 현실적인 방법이 소개되었습니다.
 
-- 프로젝트 개수보다 ‘어필하고 싶은 프로젝트’가 더 중요  
-  - 포트폴리오에는 여러 프로젝트를 써도 되지만, 자소서와 면접에서 깊게 가져갈 프로젝트는 1~3개 정도로 집중하는 것이 좋다는 의견이 나왔습니다.  
-  - 실서비스 경험이 있다면 큰 강점이지만, 없더라도 “예외 상황 설계, 장애 시나리오, 안정성/비용을 고민한 흔적”을 녹여내면 충분히 경쟁력이 있다는 메시지가 나왔습니다.
+# 오디오 확장자 -> MIME 타입 (Streamlit 정적 경로는 오디오를 text/plain으로 보내므로 미디어 경로 사용)
+AUDIO_MIME_TYPES = {".m4a": "audio/mp4", ".mp3": "audio/mpeg", ".wav": "audio/wav", ".ogg": "audio/ogg"}
 
-- 실무에서 요구되는 태도(적극성·멀티태스킹)  
-  - 단순히 지시받은 일만 처리하는 것이 아니라, 그 뒤에 생길 수 있는 영향과 후속 이슈까지 미리 질문하고 고민하는 적극성이 중요하다고 했습니다.  
-  - 특히 인프라/보안 조직은 동시에 여러 건을 처리해야 할 때가 많아, 우선순위 판단과 멀티태스킹 능력이 실제로 큰 평가 요소가 된다고 언급했습니다.
 
-- 조직 문화와 ‘모나지 않음’의 중요성  
-  - 금융 IT는 보수적인 분위기가 강한 편이라, 너무 강한 자기 주장보다는 겸손하고 배우려는 태도가 신입에게 더 중요한 덕목으로 언급되었습니다.  
-  - “회사와 팀의 색깔에 맞춰 적응하려는 마음가짐”을 보여주면, 기술 역량이 조금 부족해도 함께 일하고 싶은 사람으로 보일 수 있다는 조언이 나왔습니다.
-"""
+def render_audio_player(path: Path, start_seconds: int = 0) -> None:
+    """
+    오디오 재생 (st.audio - Streamlit 미디어 경로가 올바른 MIME 타입과 Range 요청을 처리)
+    - 탐색(seek) 시 브라우저가 필요한 byte 범위만 다시 받음
+    - start_seconds: 재생 시작 위치
+    """
+    st.audio(
+        str(path),
+        format=AUDIO_MIME_TYPES.get(path.suffix.lower(), "audio/mp4"),
+        start_time=start_seconds,
+    )
 
 
 # 공통 스타일 (메인 페이지와 비슷한 다크/블루 테마)
@@ -464,6 +411,13 @@ st.markdown(
         color: rgba(255, 255, 255, 0.95);
         line-height: 1.7;
     }}
+    /* 녹취록 검색 결과 */
+    .qa-a mark {{
+        background: rgba(250, 204, 21, 0.35);
+        color: inherit;
+        padding: 0 0.1rem;
+        border-radius: 3px;
+    }}
     /* 기본 사이드바 네비게이션 숨김 */
     [data-testid="stSidebarNav"] {{
         display: none;
@@ -529,6 +483,46 @@ if not st.session_state.lunch_talk_unlocked:
     st.stop()
 
 
+if not TALKS:
+    st.error("`lunch_talk_record` 폴더에서 런치톡 기록을 찾을 수 없습니다.")
+    st.stop()
+
+
+def reset_talk_state():
+    """다른 런치톡을 고르면 이전 런치톡의 재생 위치는 버림"""
+    st.session_state.pop("audio_start_seconds", None)
+
+
+# 런치톡 선택 (여러 개일 때만 표시, 선택한 런치톡의 자료만 읽음)
+talks_by_id = {talk["id"]: talk for talk in TALKS}
+if len(TALKS) > 1:
+    with st.sidebar:
+        st.markdown("### 🗂 런치톡 선택")
+        selected_talk_id = st.selectbox(
+            "런치톡",
+            list(talks_by_id),
+            format_func=lambda talk_id: f"{talks_by_id[talk_id]['date']} · {talks_by_id[talk_id]['title']}",
+            key="selected_talk",
+            on_change=reset_talk_state,
+            label_visibility="collapsed",
+        )
+else:
+    selected_talk_id = TALKS[0]["id"]
+TALK = talks_by_id[selected_talk_id]
+
+SUMMARY_FILE = asset_path(TALK, "summary")
+BLOG_FILE = asset_path(TALK, "blog")
+AUDIO_FILE = asset_path(TALK, "audio")
+# prepare_audio.py로 만든 조각 단위 MP4 (있으면 원본 대신 사용, 빠른 재생 시작)
+AUDIO_STREAM_FILE = AUDIO_FILE.with_name(AUDIO_FILE.stem + ".stream.m4a") if AUDIO_FILE else None
+PDF_FILE = asset_path(TALK, "slides")
+# Summary의 [MM:SS] 시간 표기는 첫 번째 녹취록(원본 녹음) 기준
+TRANSCRIPT_FILES = [asset["path"] for asset in TALK["assets"]["transcripts"]]
+TRANSCRIPT_FILE = TRANSCRIPT_FILES[0] if TRANSCRIPT_FILES else None
+# 오디오가 원본 녹음일 때만 [MM:SS]로 오디오 이동 (AI 팟캐스트 등 다른 시간축이면 녹취록만 연결)
+AUDIO_MATCHES_TRANSCRIPT = bool(AUDIO_FILE) and TALK["audio_matches_transcript"]
+
+
 # 본문 헤더
 st.markdown(
     """
@@ -548,131 +542,103 @@ st.markdown(
 )
 
 
-# 탭 구성
-tab_intro, tab_summary, tab_blog, tab_audio, tab_pdf = st.tabs(
-    ["👥 멘토 소개", "📝 Summary 정리", "📰 블로그형 글", "🎧 런치톡 팟캐스트", "📑 자료집 슬라이드"]
-)
+if TALK["date"]:
+    st.caption(f"🗓 {TALK['date']} · {TALK['title']}")
 
+# 화면 구성 (st.tabs는 모든 탭 내용을 매번 만들기 때문에, 선택한 화면만 그리도록 선택 버튼 사용)
+SECTIONS = {
+    "intro": "👥 멘토 소개",
+    "summary": "📝 Summary 정리",
+    "blog": "📰 블로그형 글",
+    "search": "🔎 녹취록 검색",
+    "transcript": "📜 녹취록 보기",
+    "audio": "🎧 런치톡 팟캐스트",
+    "pdf": "📑 자료집 슬라이드",
+}
 
-with tab_intro:
-    st.markdown("### 👥 멘토 프로필")
-    st.markdown(
-        """
-우리 FISA 1기 수료 후 입사한 정보보안부 송지영 계장, 클라우드 엔지니어링부 김혁준 계장님의 런치톡입니다.  
-두 분 모두 교육생 시절의 고민부터 실제 입사까지의 여정을 솔직하게 나눠주셨어요.
-"""
-    )
-
-    col_a, col_b = st.columns(2)
-    with col_a:
-        st.subheader("🔐 정보보안부 송지영 계장")
-        st.caption("보안·안정성을 최우선으로 보는 금융 IT 보안 전문가")
-        st.markdown(
-            """
-- FISA 1기 수료 후 우리FIS 입사  
-- 정보보안부 근무, 보안 정책·시스템 운영  
-- 탄탄한 준비와 면접 연습(질문 200개 준비)의 대표 사례
-"""
-        )
 
-    with col_b:
-        st.subheader("☁️ 클라우드 엔지니어링부 김혁준 계장")
-        st.caption("비전공자로 시작해 개발·인프라를 모두 경험한 클라우드 엔지니어")
-        st.markdown(
-            """
-- 비전공자 출신으로 백엔드 개발을 거쳐 인프라로 전향  
-- 우리FIS 1기 수료 후 클라우드 엔지니어링부 입사  
-- 개발·인프라를 모두 아우르는 취업 전략과 기술 선택 인사이트 공유
-"""
-        )
-
-    st.markdown("---")
-    st.markdown("#### 📸 멘토 프로필 카드")
-
-    col_p1, col_p2 = st.columns(2)
-
-    with col_p1:
-        st.markdown("##### 🔐 송지현 계장님 프로필")
-        if MENTOR_PDF_SONG.exists():
-            pdf_to_html_embed(MENTOR_PDF_SONG, height=560)
-        else:
-            st.info(f"`{MENTOR_PDF_SONG.name}` 파일을 찾을 수 없습니다.")
+def render_intro_section() -> None:
+    """멘토 소개 화면"""
+    st.markdown("### 👥 멘토 프로필")
+    if TALK["intro"]:
+        st.markdown(TALK["intro"])
+
+    mentors = TALK["mentors"]
+    if mentors:
+        for col, mentor in zip(st.columns(len(mentors)), mentors):
+            with col:
+                st.subheader(mentor["name"])
+                if mentor["caption"]:
+                    st.caption(mentor["caption"])
+                if mentor["bio"]:
+                    st.markdown(mentor["bio"])
+
+        profiles = [mentor for mentor in mentors if mentor["profile"]]
+        if profiles:
+            st.markdown("---")
+            st.markdown("#### 📸 멘토 프로필 카드")
 
-    with col_p2:
-        st.markdown("##### ☁️ 김혁준 계장님 프로필")
-        if MENTOR_PDF_KIM.exists():
-            pdf_to_html_embed(MENTOR_PDF_KIM, height=560)
-        else:
-            st.info(f"`{MENTOR_PDF_KIM.name}` 파일을 찾을 수 없습니다.")
+            for index, (col, mentor) in enumerate(zip(st.columns(len(profiles)), profiles)):
+                with col:
+                    st.markdown(f"##### {mentor['profile_title']}")
+                    render_pdf_preview(mentor["profile"]["path"], key=f"mentor_{TALK['id']}_{index}", height=560)
+    else:
+        st.info("이 런치톡에는 멘토 소개가 없습니다.")
 
 
-with tab_summary:
+def render_summary_section() -> None:
+    """Summary 화면"""
     st.markdown("### 📝 런치톡 Summary")
 
-    original = load_text(SUMMARY_FILE)
-    if not original:
-        st.error("`lunch_talk_summary.txt` 파일을 찾을 수 없거나 내용이 비어 있습니다.")
+    summary_doc = load_document(SUMMARY_FILE, parse_summary) if SUMMARY_FILE else None
+    if not summary_doc:
+        st.error(f"`{SUMMARY_FILE.name if SUMMARY_FILE else 'summary'}` 파일을 찾을 수 없거나 내용이 비어 있습니다.")
     else:
-        # HTML 줄바꿈 태그(<br/>) 등은 제거하고, 섹션별로 나눈 뒤
-        # 섹션 제목만 콜아웃 박스로, 본문(Q/A)은 기본 텍스트로 표시
-        clean = re.sub(r"<br\s*/?>", "", original)
-        # 마크다운 굵게(** **) 제거
-        clean = re.sub(r"\*\*(.*?)\*\*", r"\1", clean)
-        sections = re.split(r"^## ", clean, flags=re.MULTILINE)
-
         # 첫 블록은 제목 및 인터뷰 개요 (그대로 출력)
-        preface = sections[0].strip()
+        preface = summary_doc["preface"]
         if preface:
             st.markdown(preface)
             st.markdown("---")
 
-        # 이후 각 섹션은 Notion 콜아웃처럼 박스 형태로 렌더링
-        for sec in sections[1:]:
-            sec = sec.strip()
-            if not sec:
-                continue
-            lines = sec.splitlines()
-            if not lines:
-                continue
-
-            heading = lines[0].strip()
-            body_lines = lines[1:]
-            body = "\n".join(body_lines).strip()
-            if not body:
-                continue
+        # 시간 표기가 있는 Q/A의 녹취록 구간을 찾을 수 있도록 색인 (바뀐 경우에만)
+        # 구간은 연결 하나로 한 번에 조회해서 Q/A 카드에 나눠 줌
+        segments = {}
+        if summary_doc["timeline"]:
+            ensure_transcript_index(TRANSCRIPT_FILES)
+            if TRANSCRIPT_FILE:
+                segments = segments_at(TRANSCRIPT_FILE, [entry["seconds"] for entry in summary_doc["timeline"]])
+            with st.expander("⏱ 시간순 목차"):
+                st.markdown("\n".join(
+                    f"- `{format_timestamp(entry['seconds'])}` {entry['question']}"
+                    for entry in summary_doc["timeline"]
+                ))
 
+        # 이후 각 섹션은 Notion 콜아웃처럼 박스 형태로 렌더링
+        for section_index, sec in enumerate(summary_doc["sections"]):
             # 섹션 제목 콜아웃 박스
             st.markdown(
                 f"""
 <div class="summary-callout">
-💡 {heading}
+💡 {sec["heading"]}
 </div>
 """,
                 unsafe_allow_html=True,
             )
 
             # 섹션 본문(Q/A)은 Q/A 한 쌍씩 박스 형태로 렌더링
-            render_qa_body(body)
+            render_qa_blocks(sec["qa"], sec["body"], key=f"summary_{section_index}", segments=segments)
             st.markdown("")  # 섹션 간 여백
 
 
-with tab_blog:
+def render_blog_section() -> None:
+    """블로그형 글 화면"""
     st.markdown("### 📰 블로그형 정리")
-    blog_text = load_text(BLOG_FILE)
-
-    if blog_text.strip():
-        pretty_blog = format_blog_text(blog_text)
+    blog_doc = load_document(BLOG_FILE, parse_blog) if BLOG_FILE else None
 
+    if blog_doc:
         # 제목(첫 줄)과 나머지 본문을 분리해서 카드 형태로 렌더링
-        lines = pretty_blog.splitlines()
-        title = ""
-        body_lines = []
-        for line in lines:
-            if line.strip().startswith("## ") and not title:
-                title = line.strip().lstrip("#").strip()
-            else:
-                body_lines.append(line)
-        body_md = "\n".join(body_lines).strip()
+        title = blog_doc["title"]
+        body_md = blog_doc["body_md"]
 
         # 메인 카드
         st.markdown(
@@ -697,23 +663,189 @@ with tab_blog:
             unsafe_allow_html=True,
         )
     else:
-        st.warning("`google_nootbook_blog.txt` 파일이 비어 있거나 내용을 찾을 수 없습니다. 파일에 내용을 채워두면 이 탭에서 자동으로 보여드립니다.")
+        st.warning(f"`{BLOG_FILE.name if BLOG_FILE else 'blog'}` 파일이 비어 있거나 내용을 찾을 수 없습니다. 파일에 내용을 채워두면 이 탭에서 자동으로 보여드립니다.")
+
+
+@st.fragment
+def render_search_section() -> None:
+    """녹취록 검색 화면 (검색어 입력 시 이 화면만 다시 실행)"""
+    st.markdown("### 🔎 녹취록 검색")
+    st.caption("런치톡 녹취록 전체에서 키워드를 찾아 해당 구간과 시간을 보여줍니다. (띄어쓰기로 여러 단어 검색)")
 
+    search_query = st.text_input(
+        "검색어",
+        placeholder="예: 자기소개서, 면접 질문, 클라우드",
+        key="transcript_query",
+    )
+    if not TRANSCRIPT_FILES:
+        st.info("이 런치톡에는 녹취록이 없습니다.")
+    elif search_query.strip():
+        # 녹취록이 바뀐 경우에만 다시 색인 (평소에는 해시 비교만)
+        ensure_transcript_index(TRANSCRIPT_FILES)
+        started = time.perf_counter()
+        hits = search_transcripts(search_query, paths=TRANSCRIPT_FILES)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        st.caption(f"검색 결과 {len(hits)}건 · {elapsed_ms:.1f}ms")
+        if not hits:
+            st.info("일치하는 구간이 없습니다. 다른 검색어로 찾아보세요.")
+        for hit in hits:
+            speaker = f" · {hit['speaker']}" if hit["speaker"] else ""
+            st.markdown(
+                f"""
+<div class="qa-card">
+  <div class="qa-q">🕒 {hit["timestamp"]}{speaker} <span class="summary-a-label">· {hit["file"]}</span></div>
+  <div class="qa-a">{hit["snippet_html"]}</div>
+</div>
+""",
+                unsafe_allow_html=True,
+            )
+
+
+# 녹취록 보기 한 페이지의 구간 수
+TRANSCRIPT_PAGE_SIZE = 20
+
+
+def shift_transcript_page(page_key: str, delta: int) -> None:
+    """녹취록 페이지 이동 (버튼 콜백, 범위는 화면에서 다시 맞춤)"""
+    st.session_state[page_key] = st.session_state.get(page_key, 1) + delta
+
+
+@st.fragment
+def render_transcript_section() -> None:
+    """녹취록 보기 화면 (보이는 페이지의 구간만 파일에서 읽어 렌더링)"""
+    st.markdown("### 📜 녹취록 보기")
+    if not TRANSCRIPT_FILES:
+        st.info("이 런치톡에는 녹취록이 없습니다.")
+        return
 
-with tab_audio:
+    transcript_path = TRANSCRIPT_FILES[0]
+    if len(TRANSCRIPT_FILES) > 1:
+        transcript_path = st.selectbox(
+            "녹취록 파일",
+            TRANSCRIPT_FILES,
+            format_func=lambda path: path.stem,
+            key=f"transcript_file_{TALK['id']}",
+        )
+
+    total = count_segments(transcript_path)
+    if total == 0:
+        st.info("녹취록 내용이 비어 있습니다.")
+        return
+    page_count = (total + TRANSCRIPT_PAGE_SIZE - 1) // TRANSCRIPT_PAGE_SIZE
+    page_key = f"transcript_page_{TALK['id']}_{transcript_path.name}"
+
+    # Summary에서 넘어온 경우 해당 시간 구간이 있는 페이지로
+    seek_seconds = st.session_state.pop("transcript_seek_seconds", None)
+    if seek_seconds is not None:
+        st.session_state[page_key] = segment_index_at(transcript_path, seek_seconds) // TRANSCRIPT_PAGE_SIZE + 1
+
+    col_time, col_go = st.columns([3, 1], vertical_alignment="bottom")
+    with col_time:
+        jump_text = st.text_input("시간으로 이동", placeholder="예: 12:30 또는 1:05:00", key=f"{page_key}_jump")
+    with col_go:
+        if st.button("⏩ 이동", key=f"{page_key}_go", width="stretch"):
+            jump_seconds = parse_timestamp(jump_text)
+            if jump_seconds is None:
+                st.warning("시간은 MM:SS 또는 H:MM:SS 형식으로 입력하세요.")
+            else:
+                st.session_state[page_key] = segment_index_at(transcript_path, jump_seconds) // TRANSCRIPT_PAGE_SIZE + 1
+
+    page = min(max(int(st.session_state.get(page_key, 1)), 1), page_count)
+    st.session_state[page_key] = page
+    col_prev, col_page, col_next = st.columns([1, 2, 1], vertical_alignment="center")
+    with col_prev:
+        st.button(
+            "◀ 이전", key=f"{page_key}_prev", disabled=page <= 1, width="stretch",
+            on_click=shift_transcript_page, args=(page_key, -1),
+        )
+    with col_next:
+        st.button(
+            "다음 ▶", key=f"{page_key}_next", disabled=page >= page_count, width="stretch",
+            on_click=shift_transcript_page, args=(page_key, 1),
+        )
+
+    segments = read_segments(transcript_path, (page - 1) * TRANSCRIPT_PAGE_SIZE, TRANSCRIPT_PAGE_SIZE)
+    with col_page:
+        st.caption(
+            f"{page} / {page_count} 페이지 · "
+            f"{segments[0]['timestamp']} ~ {segments[-1]['timestamp']} · 전체 {total}개 구간"
+        )
+
+    for segment in segments:
+        speaker = f" · {segment['speaker']}" if segment["speaker"] else ""
+        text_html = html.escape(segment["text"]).replace("\n", "<br/>")
+        st.markdown(
+            f"""
+<div class="qa-card">
+  <div class="qa-q">🕒 {segment["timestamp"]}{speaker}</div>
+  <div class="qa-a">{text_html}</div>
+</div>
+""",
+            unsafe_allow_html=True,
+        )
+
+
+def render_audio_section() -> None:
+    """팟캐스트 화면"""
     st.markdown("### 🎧 런치톡 팟캐스트 듣기")
     st.caption("런치톡 내용을 토대로 AI 팟캐스트를 만들어봤습니다. 이동하면서 한번 들어보세요!")
 
-    if AUDIO_FILE.exists():
+    if AUDIO_FILE and AUDIO_FILE.exists():
         with st.container():
-            st.audio(str(AUDIO_FILE), format="audio/mpeg")
-    else:
+            audio_start = st.session_state.get("audio_start_seconds", 0)
+            if audio_start:
+                st.caption(f"⏱ Summary에서 선택한 {format_timestamp(audio_start)}부터 재생합니다.")
+            render_audio_player(
+                AUDIO_STREAM_FILE if AUDIO_STREAM_FILE.exists() else AUDIO_FILE,
+                start_seconds=audio_start,
+            )
+    elif AUDIO_FILE:
         st.error(f"오디오 파일을 찾을 수 없습니다: {AUDIO_FILE.name}")
+    else:
+        st.info("이 런치톡에는 오디오가 없습니다.")
 
 
-with tab_pdf:
-    st.markdown("### 📑 현직 선배의 금융 IT 공략집 (PDF)")
-    if PDF_FILE.exists():
+def render_pdf_section() -> None:
+    """자료집 PDF 화면"""
+    if PDF_FILE and PDF_FILE.exists():
+        st.markdown(f"### 📑 {PDF_FILE.stem.replace('_', ' ')} (PDF)")
         pdf_to_html_embed(PDF_FILE, height=980)
-    else:
+    elif PDF_FILE:
+        st.markdown("### 📑 자료집 슬라이드")
         st.error(f"PDF 파일을 찾을 수 없습니다: {PDF_FILE.name}")
+    else:
+        st.markdown("### 📑 자료집 슬라이드")
+        st.info("이 런치톡에는 자료집이 없습니다.")
+
+
+def keep_section_selected() -> None:
+    """선택된 버튼을 다시 눌러 선택이 풀리면 이전 화면을 유지"""
+    if st.session_state.review_section is None:
+        st.session_state.review_section = st.session_state.get("last_review_section", "intro")
+    st.session_state.last_review_section = st.session_state.review_section
+
+
+if st.session_state.get("review_section") not in SECTIONS:
+    st.session_state.review_section = "intro"
+
+st.segmented_control(
+    "화면 선택",
+    options=list(SECTIONS),
+    format_func=SECTIONS.get,
+    key="review_section",
+    on_change=keep_section_selected,
+    label_visibility="collapsed",
+)
+
+# 선택한 화면만 그림 (나머지 화면의 문서 파싱 / PDF / 오디오는 만들지 않음)
+SECTION_RENDERERS = {
+    "intro": render_intro_section,
+    "summary": render_summary_section,
+    "blog": render_blog_section,
+    "search": render_search_section,
+    "transcript": render_transcript_section,
+    "audio": render_audio_section,
+    "pdf": render_pdf_section,
+}
+SECTION_RENDERERS[st.session_state.review_section]()
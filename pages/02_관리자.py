@@ -18,6 +18,82 @@ try:
 except ImportError:
     STATS_ENABLED = False
 
+# SQLite 스키마 및 집계 카운터
+from utils_db import (
+    COUNTER_TOTAL_LIKES,
+    QUESTION_COLUMNS,
+    TRASH_RETENTION_DAYS,
+    count_filtered_questions,
+    count_matching_questions,
+    count_questions,
+    count_trash,
+    delete_matching_questions,
+    delete_questions_by_ids,
+    fetch_questions_page,
+    fetch_trash_page,
+    get_author_stats,
+    get_counters,
+    get_hourly_question_counts,
+    get_question_metrics,
+    init_db,
+    invalidate_counters,
+    iter_question_rows,
+    purge_trash,
+    refresh_question_counters,
+    reserve_question_ids,
+    restore_questions,
+    start_trash_purger,
+    update_questions,
+)
+
+# 요청 제한 현황
+from utils_ratelimit import get_rate_limit_stats, get_session_key
+
+# 질문 일괄 가져오기
+from utils_import import IMPORT_FORMATS, detect_import_format, import_questions
+
+# questions.db 스냅샷 백업
+from utils_backup import (
+    create_snapshot,
+    get_backup_settings,
+    list_snapshots,
+    prune_snapshots,
+    restore_snapshot,
+    start_backup_scheduler,
+)
+
+# 관리자 감사 로그
+from utils_audit import (
+    AUDIT_ACTIONS,
+    audited,
+    count_audit_entries,
+    fetch_audit_page,
+    wait_for_audit_writes,
+)
+
+# 데이터 내보내기 (요청 시 생성, 데이터 버전별 캐시)
+from utils_export import EXPORT_FORMATS, export_visits_xlsx, get_export
+
+# 저장소 상태 점검 (백그라운드)
+from utils_health import (
+    HEALTH_CHECK_INTERVAL_SECONDS,
+    HEALTH_CHECK_TIMEOUT_SECONDS,
+    configure_health_checks,
+    get_health_results,
+    make_csv_export_probe,
+    make_json_probe,
+    make_sheets_probe,
+    probe_sqlite,
+    run_health_checks,
+    start_health_monitor,
+)
+
+# 데이터 변경 피드 (메인 페이지 실시간 갱신용)
+from utils_changes import CHANGE_DELETE, CHANGE_RESET, CHANGE_UPSERT, cached_by_version, record_change, refresh_if_stale
+
+# Google Sheets 미러 지연 쓰기 (메인 페이지의 밀린 좋아요)
+from utils_mirror import flush_mirror
+
 # Google Sheets 연동
 try:
     from st_gsheets_connection import GSheetsConnection
@@ -37,22 +113,7 @@ WOORI_LIGHT_BLUE = "#0066CC"
 DATA_FILE = Path(__file__).parent.parent / "questions.json"
 DB_FILE = Path(__file__).parent.parent / "questions.db"
 WORKSHEET_NAME = "questions"
-
-def init_db():
-    """SQLite 데이터베이스 초기화"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS questions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            question TEXT NOT NULL,
-            timestamp TEXT NOT NULL,
-            likes INTEGER DEFAULT 0
-        )
-    ''')
-    conn.commit()
-    conn.close()
+EXPORT_PREVIEW_ROWS = 100  # 내보내기 탭 미리보기 행 수
 
 def save_to_sqlite(questions):
     """SQLite에 데이터 저장"""
@@ -73,8 +134,11 @@ def save_to_sqlite(questions):
                 q.get('timestamp', ''),
                 q.get('likes', 0)
             ))
+        # 집계 카운터도 같은 트랜잭션에서 갱신
+        refresh_question_counters(cursor)
         conn.commit()
         conn.close()
+        invalidate_counters()
     except Exception as e:
         st.error(f"SQLite 저장 오류: {e}")
 
@@ -140,23 +204,28 @@ def normalize_question_ids(questions):
             q_id = 0
         if q_id > max_id:
             max_id = q_id
-    next_id = max_id + 1
+    next_id = None
     for q in questions:
         try:
             q_id = int(q.get("id", 0)) if q.get("id") is not None else 0
         except Exception:
             q_id = 0
         if q_id <= 0 or q_id in seen:
+            # 새 id는 삭제된 질문의 id와도 겹치지 않도록 예약해서 사용
+            if next_id is None:
+                next_id = reserve_question_ids(at_least=max_id + 1)
+            else:
+                next_id = reserve_question_ids(at_least=next_id + 1)
             q_id = next_id
-            next_id += 1
         seen.add(q_id)
         q["id"] = q_id
     return questions
 
 def load_questions():
     """질문 데이터 로드 - Google Sheets 우선, 없으면 SQLite, 마지막으로 JSON"""
-    # 1. Google Sheets 우선
+    # 1. Google Sheets 우선 (밀린 좋아요를 먼저 시트에 반영해야 예전 값으로 덮어쓰지 않음)
     if USE_GSHEETS and conn_gsheet:
+        flush_mirror()
         try:
             gsheets_config = st.secrets.get("connections", {}).get("gsheets", {})
             spreadsheet_url = gsheets_config.get("spreadsheet", "")
@@ -265,6 +334,8 @@ def save_questions(questions):
             
             st.cache_data.clear()
             save_to_sqlite(questions)
+            # 관리자 작업은 전체 재작성이므로 접속 중인 세션에 전체 갱신을 알림
+            record_change(CHANGE_RESET)
             return
         except Exception as e:
             # 에러 메시지 표시
@@ -283,6 +354,7 @@ def save_questions(questions):
                 json.dump(questions, f, ensure_ascii=False, indent=2)
         except:
             pass
+        record_change(CHANGE_RESET)
         return
     except Exception as e:
         st.error(f"데이터 저장 오류: {e}")
@@ -293,6 +365,33 @@ def save_questions(questions):
             json.dump(questions, f, ensure_ascii=False, indent=2)
     except Exception as e:
         st.error(f"파일 저장 오류: {e}")
+    record_change(CHANGE_RESET)
+
+def sync_remote_mirror():
+    """
+    SQLite에서 직접 바꾼 내용을 Google Sheets / JSON 백업에 한 번에 반영
+    - Sheets 연결(GSheetsConnection)은 워크시트 단위 update만 지원해서 바뀐 행만 보낼 수 없음
+      → 변경분 대신 SQLite 내용으로 시트 전체를 한 번 덮어씀 (Sheets를 다시 읽지는 않음)
+    """
+    rows = [dict(zip(QUESTION_COLUMNS, row)) for row in iter_question_rows()]
+    if USE_GSHEETS and conn_gsheet:
+        try:
+            df = pd.DataFrame(rows, columns=QUESTION_COLUMNS).fillna('')
+            gsheets_config = st.secrets.get("connections", {}).get("gsheets", {})
+            spreadsheet_url = gsheets_config.get("spreadsheet", "")
+            if spreadsheet_url:
+                conn_gsheet.update(spreadsheet=spreadsheet_url, worksheet=WORKSHEET_NAME, data=df)
+            else:
+                conn_gsheet.update(worksheet=WORKSHEET_NAME, data=df)
+            st.cache_data.clear()
+        except Exception as e:
+            st.error(f"Google Sheets 동기화 오류: {e}")
+    # JSON 백업도 맞춰 둠 (SQLite가 비었을 때 예전 데이터가 되살아나지 않도록)
+    try:
+        with open(DATA_FILE, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+    except:
+        pass
 
 # 페이지 설정
 st.set_page_config(
@@ -509,39 +608,207 @@ def check_admin():
     
     return True
 
-def delete_question(question_id):
-    """질문 삭제"""
-    questions = load_questions()
-    questions = [q for q in questions if q['id'] != question_id]
-    # ID 재정렬
-    for idx, q in enumerate(questions, 1):
-        q['id'] = idx
-    save_questions(questions)
-    st.success(f"✅ 질문 #{question_id}이(가) 삭제되었습니다")
-    st.rerun()
+def render_predicate_delete(key, predicate, description):
+    """
+    조건 일괄 삭제 버튼 - 대상 개수를 COUNT로 미리 보여주고, 두 번 클릭하면 삭제
+    - 확인 상태에 첫 클릭 때의 조건을 함께 저장 → 그 사이 조건을 바꾸면 확인이 풀림
+    """
+    confirm_key = f"confirm_{key}"
+    signature = json.dumps(predicate, sort_keys=True, default=str)
+    if st.session_state.get(confirm_key) not in (None, False, signature):
+        st.session_state[confirm_key] = False
+    confirmed = st.session_state.get(confirm_key) == signature
+    preview_count = count_matching_questions(predicate)
+    st.caption(f"현재 대상: {preview_count}개")
+    
+    if st.button("일괄 삭제 실행", key=key, type="secondary"):
+        if confirmed:
+            with audited("batch_delete", get_session_key(), predicate) as audit:
+                deleted_ids = delete_matching_questions(predicate)
+                record_change(CHANGE_DELETE, ids=deleted_ids)
+                sync_remote_mirror()
+                audit["ids"] = deleted_ids
+            st.success(f"✅ {description} {len(deleted_ids)}개가 휴지통으로 이동했습니다")
+            st.session_state[confirm_key] = False
+            st.rerun()
+        elif preview_count > 0:
+            st.session_state[confirm_key] = signature
+            confirmed = True
+            st.warning(f"⚠️ {description} {preview_count}개가 삭제됩니다. 다시 클릭하면 삭제됩니다.")
+        else:
+            st.info("해당 조건에 맞는 질문이 없습니다.")
+    
+    if confirmed:
+        if st.button("취소", key=f"cancel_{key}"):
+            st.session_state[confirm_key] = False
+            st.rerun()
 
-def export_to_csv():
-    """CSV로 내보내기"""
-    questions = load_questions()
-    if not questions:
-        return None
+def render_batch_delete_controls(key_prefix):
+    """좋아요 / 날짜 기준 일괄 삭제 UI"""
+    col_likes, col_date = st.columns(2)
     
-    df = pd.DataFrame(questions)
-    return df.to_csv(index=False, encoding='utf-8-sig')
+    with col_likes:
+        st.markdown("**좋아요 기준 일괄 삭제**")
+        max_likes = st.number_input(
+            "좋아요가 이 값 이하인 질문 삭제",
+            min_value=0,
+            value=0,
+            key=f"{key_prefix}_likes",
+            help="예: 0을 입력하면 좋아요가 0개인 질문만 삭제"
+        )
+        render_predicate_delete(
+            f"{key_prefix}_by_likes",
+            {"max_likes": int(max_likes)},
+            f"좋아요 {max_likes}개 이하인 질문"
+        )
+    
+    with col_date:
+        st.markdown("**날짜 기준 일괄 삭제**")
+        older_than_days = st.number_input(
+            "몇 일 이전 질문 삭제",
+            min_value=1,
+            value=7,
+            key=f"{key_prefix}_days",
+            help="예: 7을 입력하면 7일 이전 질문이 삭제"
+        )
+        render_predicate_delete(
+            f"{key_prefix}_by_date",
+            {"older_than_days": int(older_than_days)},
+            f"{older_than_days}일 이전 질문"
+        )
 
-def export_to_excel():
-    """Excel로 내보내기"""
-    questions = load_questions()
-    if not questions:
-        st.warning("내보낼 질문이 없습니다")
-        return None
+def render_trash():
+    """휴지통 - 삭제된 질문 복원 / 영구 삭제"""
+    trash_count = count_trash()
+    st.caption(f"삭제된 질문은 {TRASH_RETENTION_DAYS}일 동안 보관된 뒤 자동으로 영구 삭제됩니다. (현재 {trash_count}개)")
+    if not trash_count:
+        return
+    
+    trash_rows = fetch_trash_page(limit=100)
+    trash_df = pd.DataFrame(trash_rows, columns=['trash_id'] + QUESTION_COLUMNS + ['deleted_at'])
+    trash_df.insert(0, '선택', False)
+    edited_trash = st.data_editor(
+        trash_df,
+        key="trash_editor",
+        hide_index=True,
+        width="stretch",
+        disabled=['trash_id'] + QUESTION_COLUMNS + ['deleted_at'],
+        column_config={
+            "선택": st.column_config.CheckboxColumn("선택"),
+            "trash_id": None,
+            "id": st.column_config.NumberColumn("ID"),
+            "name": st.column_config.TextColumn("작성자"),
+            "question": st.column_config.TextColumn("질문", width="large"),
+            "timestamp": st.column_config.TextColumn("작성 시간"),
+            "likes": st.column_config.NumberColumn("좋아요"),
+            "deleted_at": st.column_config.TextColumn("삭제 시간"),
+        }
+    )
+    selected_trash_ids = [int(i) for i in edited_trash.loc[edited_trash['선택'], 'trash_id']]
+    
+    col_restore, col_purge = st.columns(2)
+    with col_restore:
+        if st.button(f"♻️ 선택 복원 ({len(selected_trash_ids)}개)", key="trash_restore", disabled=not selected_trash_ids, width="stretch"):
+            with audited("trash_restore", get_session_key()) as audit:
+                restored = restore_questions(selected_trash_ids)
+                record_change(CHANGE_UPSERT, rows=restored)
+                sync_remote_mirror()
+                audit["ids"] = [q['id'] for q in restored]
+            st.success(f"✅ 질문 {len(restored)}개가 복원되었습니다")
+            st.rerun()
+    with col_purge:
+        if st.button("🧹 휴지통 비우기", key="trash_purge", type="secondary", width="stretch"):
+            if st.session_state.get("confirm_trash_purge", False):
+                with audited("trash_purge", get_session_key()) as audit:
+                    purged = purge_trash()
+                    audit["count"] = purged
+                st.session_state.confirm_trash_purge = False
+                st.success(f"✅ {purged}개가 영구 삭제되었습니다")
+                st.rerun()
+            else:
+                st.session_state.confirm_trash_purge = True
+                st.warning("⚠️ 휴지통의 질문이 모두 영구 삭제됩니다. 다시 클릭하면 삭제됩니다.")
     
-    df = pd.DataFrame(questions)
-    from io import BytesIO
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='질문목록')
-    return output.getvalue()
+    if st.session_state.get("confirm_trash_purge", False):
+        if st.button("취소", key="cancel_trash_purge"):
+            st.session_state.confirm_trash_purge = False
+            st.rerun()
+
+def _build_question_stats_frame(questions):
+    """SQLite를 쓸 수 없을 때 pandas로 같은 집계 계산"""
+    df = pd.DataFrame(questions, columns=QUESTION_COLUMNS)
+    df['name'] = df['name'].fillna('익명')
+    df['likes'] = pd.to_numeric(df['likes'], errors='coerce').fillna(0).astype(int)
+    metrics = {
+        "total": len(df),
+        "likes": int(df['likes'].sum()),
+        "anonymous": int((df['name'] == '익명').sum()),
+    }
+    author_rows = [
+        (name, int(row['count']), int(row['sum']), round(float(row['mean']), 1))
+        for name, row in df.groupby('name')['likes'].agg(['count', 'sum', 'mean']).iterrows()
+    ]
+    author_rows.sort(key=lambda r: (-r[1], r[0]))
+    parsed = pd.to_datetime(df['timestamp'], format="%Y-%m-%d %H:%M:%S", errors='coerce').dropna()
+    hour_rows = sorted(parsed.dt.hour.value_counts().items())
+    return metrics, author_rows, hour_rows
+
+def get_question_stats(loader):
+    """
+    질문 통계 (요약 지표 / 작성자별 / 시간대별)
+    - SQLite GROUP BY로 집계하고 데이터 버전별로 캐시 (탭 이동 때마다 다시 계산하지 않음)
+    - loader: SQLite를 쓸 수 없을 때만 호출해서 전체 질문을 읽음
+    """
+    def builder():
+        try:
+            metrics = get_question_metrics()
+            author_rows = get_author_stats()
+            hour_rows = get_hourly_question_counts()
+        except Exception:
+            metrics, author_rows, hour_rows = _build_question_stats_frame(loader())
+        return {
+            "metrics": metrics,
+            "authors": pd.DataFrame(author_rows, columns=["작성자", "질문 수", "총 좋아요", "평균 좋아요"]),
+            "hours": pd.DataFrame(
+                [{"시간대": f"{hour:02d}:00-{hour+1:02d}:00", "질문 수": count} for hour, count in hour_rows],
+                columns=["시간대", "질문 수"]
+            ),
+        }
+    
+    return cached_by_version(("question_stats",), builder)
+
+def build_health_probes():
+    """현재 설정에 맞는 저장소 점검 대상"""
+    probes = {
+        "SQLite": probe_sqlite,
+        "JSON 백업": make_json_probe(DATA_FILE),
+    }
+    if USE_GSHEETS and conn_gsheet:
+        try:
+            gsheets_config = st.secrets.get("connections", {}).get("gsheets", {})
+            if has_service_account(gsheets_config):
+                probes["Google Sheets (Service Account)"] = make_sheets_probe(
+                    lambda: conn_gsheet.read(worksheet=WORKSHEET_NAME, ttl=0, usecols=[0], nrows=1)
+                )
+            elif SPREADSHEET_URL:
+                import re
+                match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', SPREADSHEET_URL)
+                if match:
+                    csv_export_url = f"https://docs.google.com/spreadsheets/d/{match.group(1)}/export?format=csv&gid=0"
+                    probes["Google Sheets (CSV export)"] = make_csv_export_probe(csv_export_url)
+        except Exception:
+            pass
+    return probes
+
+# 저장소 상태 점검 스레드
+configure_health_checks(build_health_probes())
+start_health_monitor()
+
+# 휴지통 정리 스레드 (보통 메인 페이지에서 이미 시작됨 - 관리자 페이지로 바로 들어온 경우 대비)
+start_trash_purger()
+
+# DB 스냅샷 백업 스레드 (보통 메인 페이지에서 이미 시작됨 - 관리자 페이지로 바로 들어온 경우 대비)
+start_backup_scheduler()
 
 # 관리자 인증 확인
 if check_admin():
@@ -567,15 +834,33 @@ if check_admin():
     st.markdown("---")
     
     # 탭 구성
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 질문 관리", "📊 통계", "📥 데이터 내보내기", "⚙️ 설정"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 질문 관리", "📊 통계", "📥 내보내기 / 가져오기", "⚙️ 설정", "🧾 감사 로그"])
     
-    questions = load_questions()
+    # Google Sheets를 직접 고친 내용은 일정 시간마다 한 번 다시 읽어 반영 (통계/내보내기 캐시도 무효화)
+    refresh_if_stale(load_questions)
+    
+    # 전체 질문은 읽지 않고 SQLite에서 개수만 조회 (전체 로드는 내보내기/동기화 등 명시적 작업에서만)
+    # SQLite가 비어 있으면 세션마다 한 번만 Google Sheets에서 채워 둠
+    total_questions = count_questions()
+    if not total_questions and not st.session_state.get("admin_initial_pull"):
+        st.session_state.admin_initial_pull = True
+        total_questions = len(load_questions())
+    total_questions = total_questions or 0
     
     # 탭 1: 질문 관리
     with tab1:
         st.header("📋 질문 관리")
         
-        if not questions:
+        if USE_GSHEETS and conn_gsheet:
+            st.caption("Google Sheets를 직접 수정했다면 다시 불러와야 이 화면에 반영됩니다.")
+            if st.button("🔄 Google Sheets에서 다시 불러오기", key="pull_remote_questions"):
+                with st.spinner("Google Sheets에서 질문을 불러오는 중..."):
+                    load_questions()
+                    record_change(CHANGE_RESET)
+                st.session_state.admin_grid_nonce = st.session_state.get("admin_grid_nonce", 0) + 1
+                st.rerun()
+        
+        if not total_questions:
             st.markdown("""
             <div style="background: rgba(255, 255, 255, 0.08); backdrop-filter: blur(40px); -webkit-backdrop-filter: blur(40px);
                         padding: 2rem; border-radius: 16px; border: 1px solid rgba(255, 255, 255, 0.15);
@@ -593,158 +878,130 @@ if check_admin():
             with col2:
                 filter_likes = st.selectbox("좋아요 필터", ["전체", "5개 이상", "10개 이상"])
             
-            # 질문 필터링
-            filtered_questions = questions
-            if search_admin:
-                filtered_questions = [q for q in filtered_questions if search_admin.lower() in q["question"].lower()]
-            if filter_likes == "5개 이상":
-                filtered_questions = [q for q in filtered_questions if q.get("likes", 0) >= 5]
-            elif filter_likes == "10개 이상":
-                filtered_questions = [q for q in filtered_questions if q.get("likes", 0) >= 10]
+            # 질문 필터링 (SQLite에서 개수만 조회)
+            min_likes = {"5개 이상": 5, "10개 이상": 10}.get(filter_likes)
+            filtered_count = count_filtered_questions(search_admin, min_likes)
             
             col_metric1, col_metric2, col_metric3 = st.columns(3)
             with col_metric1:
-                st.metric("총 질문 수", len(questions))
+                st.metric("총 질문 수", total_questions)
             with col_metric2:
-                st.metric("필터링된 질문 수", len(filtered_questions))
+                st.metric("필터링된 질문 수", filtered_count)
             with col_metric3:
-                total_likes_admin = sum(q.get("likes", 0) for q in questions)
+                total_likes_admin = get_counters().get(COUNTER_TOTAL_LIKES, 0)
                 st.metric("총 좋아요", total_likes_admin)
             
             st.markdown("---")
             
             # 일괄 삭제 옵션
             with st.expander("🗑️ 일괄 삭제 옵션", expanded=False):
-                col_batch1, col_batch2 = st.columns(2)
-                
-                with col_batch1:
-                    st.markdown("**좋아요 기준 일괄 삭제**")
-                    batch_delete_likes = st.number_input(
-                        "좋아요가 이 값 이하인 질문 삭제",
-                        min_value=0,
-                        value=0,
-                        key="batch_delete_likes",
-                        help="예: 0을 입력하면 좋아요가 0개인 질문만 삭제"
-                    )
-                    if st.button("일괄 삭제 실행", key="batch_delete_by_likes", type="secondary"):
-                        if st.session_state.get("confirm_batch_delete_likes", False):
-                            deleted_count = 0
-                            remaining_questions = []
-                            for q in questions:
-                                if q.get("likes", 0) <= batch_delete_likes:
-                                    deleted_count += 1
-                                else:
-                                    remaining_questions.append(q)
-                            
-                            # ID 재정렬
-                            for idx, q in enumerate(remaining_questions, 1):
-                                q['id'] = idx
-                            
-                            save_questions(remaining_questions)
-                            st.success(f"✅ 좋아요 {batch_delete_likes}개 이하인 질문 {deleted_count}개가 삭제되었습니다")
-                            st.session_state.confirm_batch_delete_likes = False
-                            st.rerun()
-                        else:
-                            count = sum(1 for q in questions if q.get("likes", 0) <= batch_delete_likes)
-                            if count > 0:
-                                st.session_state.confirm_batch_delete_likes = True
-                                st.warning(f"⚠️ 좋아요 {batch_delete_likes}개 이하인 질문 {count}개가 삭제됩니다. 다시 클릭하면 삭제됩니다.")
-                            else:
-                                st.info("해당 조건에 맞는 질문이 없습니다.")
-                    
-                    if st.session_state.get("confirm_batch_delete_likes", False):
-                        if st.button("취소", key="cancel_batch_delete_likes"):
-                            st.session_state.confirm_batch_delete_likes = False
-                            st.rerun()
-                
-                with col_batch2:
-                    st.markdown("**날짜 기준 일괄 삭제**")
-                    batch_delete_days = st.number_input(
-                        "몇 일 이전 질문 삭제",
-                        min_value=1,
-                        value=7,
-                        key="batch_delete_days",
-                        help="예: 7을 입력하면 7일 이전 질문이 삭제"
-                    )
-                    if st.button("일괄 삭제 실행", key="batch_delete_by_date", type="secondary"):
-                        if st.session_state.get("confirm_batch_delete_date", False):
-                            cutoff_date = datetime.now() - timedelta(days=batch_delete_days)
-                            deleted_count = 0
-                            remaining_questions = []
-                            for q in questions:
-                                try:
-                                    q_date = datetime.strptime(q.get("timestamp", ""), "%Y-%m-%d %H:%M:%S")
-                                    if q_date < cutoff_date:
-                                        deleted_count += 1
-                                    else:
-                                        remaining_questions.append(q)
-                                except:
-                                    remaining_questions.append(q)
-                            
-                            # ID 재정렬
-                            for idx, q in enumerate(remaining_questions, 1):
-                                q['id'] = idx
-                            
-                            save_questions(remaining_questions)
-                            st.success(f"✅ {batch_delete_days}일 이전 질문 {deleted_count}개가 삭제되었습니다")
-                            st.session_state.confirm_batch_delete_date = False
-                            st.rerun()
-                        else:
-                            cutoff_date = datetime.now() - timedelta(days=batch_delete_days)
-                            count = 0
-                            for q in questions:
-                                try:
-                                    q_date = datetime.strptime(q.get("timestamp", ""), "%Y-%m-%d %H:%M:%S")
-                                    if q_date < cutoff_date:
-                                        count += 1
-                                except:
-                                    pass
-                            if count > 0:
-                                st.session_state.confirm_batch_delete_date = True
-                                st.warning(f"⚠️ {batch_delete_days}일 이전 질문 {count}개가 삭제됩니다. 다시 클릭하면 삭제됩니다.")
-                            else:
-                                st.info("해당 조건에 맞는 질문이 없습니다.")
-                    
-                    if st.session_state.get("confirm_batch_delete_date", False):
-                        if st.button("취소", key="cancel_batch_delete_date"):
-                            st.session_state.confirm_batch_delete_date = False
-                            st.rerun()
+                render_batch_delete_controls("batch_delete")
             
             st.markdown("---")
             
-            # 질문 목록 표시
-            for q in filtered_questions:
-                with st.expander(f"질문 #{q['id']} - {q.get('name', '익명')}님 ({q.get('likes', 0)}👍)", expanded=False):
-                    col1, col2 = st.columns([4, 1])
-                    with col1:
-                        st.markdown(f"**작성자:** {q.get('name', '익명')}")
-                        st.markdown(f"**작성 시간:** {q['timestamp']}")
-                        st.markdown(f"**좋아요:** {q.get('likes', 0)}개")
-                        st.markdown("---")
-                        st.markdown(f"**질문 내용:**")
-                        st.write(q['question'])
-                    
-                    with col2:
-                        # 삭제 확인
-                        delete_key = f"delete_{q['id']}"
-                        confirm_key = f"confirm_delete_{q['id']}"
-                        
-                        if st.session_state.get(confirm_key, False):
-                            col_yes, col_no = st.columns(2)
-                            with col_yes:
-                                if st.button("✅ 확인", key=f"yes_{q['id']}", width="stretch"):
-                                    delete_question(q['id'])
-                                    st.session_state[confirm_key] = False
-                            with col_no:
-                                if st.button("❌ 취소", key=f"no_{q['id']}", width="stretch"):
-                                    st.session_state[confirm_key] = False
-                                    st.rerun()
-                        else:
-                            if st.button("🗑️ 삭제", key=delete_key, type="secondary", width="stretch"):
-                                st.session_state[confirm_key] = True
-                                st.rerun()
-                
-                st.markdown("---")
+            # 질문 목록 - 현재 페이지만 조회하는 편집 그리드
+            if 'admin_grid_nonce' not in st.session_state:
+                st.session_state.admin_grid_nonce = 0
+            
+            col_size, col_page = st.columns(2)
+            with col_size:
+                page_size = st.selectbox("페이지당 질문 수", [20, 50, 100], key="admin_page_size")
+            total_pages = max(1, (filtered_count + page_size - 1) // page_size)
+            if st.session_state.get("admin_page", 1) > total_pages:
+                st.session_state.admin_page = total_pages
+            with col_page:
+                page = st.number_input(
+                    f"페이지 (전체 {total_pages}쪽)",
+                    min_value=1,
+                    max_value=total_pages,
+                    step=1,
+                    key="admin_page"
+                )
+            
+            page_rows = fetch_questions_page(
+                search_admin,
+                min_likes,
+                limit=page_size,
+                offset=(page - 1) * page_size
+            )
+            grid_df = pd.DataFrame(page_rows, columns=QUESTION_COLUMNS)
+            grid_df.insert(0, "선택", False)
+            edited_df = st.data_editor(
+                grid_df,
+                column_config={
+                    "선택": st.column_config.CheckboxColumn("선택", default=False),
+                    "id": st.column_config.NumberColumn("ID", disabled=True),
+                    "name": st.column_config.TextColumn("작성자", required=True),
+                    "question": st.column_config.TextColumn("질문 내용", width="large", required=True),
+                    "timestamp": st.column_config.TextColumn("작성 시간", disabled=True),
+                    "likes": st.column_config.NumberColumn("좋아요", min_value=0, step=1, required=True),
+                },
+                hide_index=True,
+                num_rows="fixed",
+                width="stretch",
+                key=f"admin_grid_{st.session_state.admin_grid_nonce}_{page}_{page_size}_{search_admin}_{filter_likes}"
+            )
+            
+            selected_ids = edited_df.loc[edited_df["선택"], "id"].astype(int).tolist()
+            original_by_id = {row['id']: row for row in page_rows}
+            changed_rows = []
+            for row in edited_df[QUESTION_COLUMNS].to_dict('records'):
+                row = {
+                    'id': int(row['id']),
+                    'name': str(row['name']),
+                    'question': str(row['question']),
+                    'timestamp': str(row['timestamp']),
+                    'likes': int(row['likes']),
+                }
+                original = original_by_id.get(row['id'])
+                if original and any(row[col] != original[col] for col in ['name', 'question', 'likes']):
+                    changed_rows.append(row)
+            
+            # 선택 삭제 확인 상태에는 확인한 id 목록을 저장 → 선택/페이지/필터가 바뀌면 확인이 풀림
+            delete_signature = sorted(selected_ids)
+            if st.session_state.get("confirm_grid_delete") not in (None, False, delete_signature):
+                st.session_state.confirm_grid_delete = False
+            delete_confirmed = bool(selected_ids) and st.session_state.get("confirm_grid_delete") == delete_signature
+            
+            col_save, col_delete = st.columns(2)
+            with col_save:
+                if st.button(f"💾 변경 사항 저장 ({len(changed_rows)}개)", key="grid_save", disabled=not changed_rows, width="stretch"):
+                    with audited("grid_update", get_session_key()) as audit:
+                        update_questions(changed_rows)
+                        record_change(CHANGE_UPSERT, rows=changed_rows)
+                        sync_remote_mirror()
+                        audit["ids"] = [row['id'] for row in changed_rows]
+                    st.session_state.admin_grid_nonce += 1
+                    st.success(f"✅ 질문 {len(changed_rows)}개가 수정되었습니다")
+                    st.rerun()
+            with col_delete:
+                if st.button(f"🗑️ 선택 삭제 ({len(selected_ids)}개)", key="grid_delete", type="secondary", disabled=not selected_ids, width="stretch"):
+                    if delete_confirmed:
+                        with audited("grid_delete", get_session_key()) as audit:
+                            deleted_count = delete_questions_by_ids(selected_ids)
+                            record_change(CHANGE_DELETE, ids=selected_ids)
+                            sync_remote_mirror()
+                            audit["ids"] = selected_ids
+                            audit["count"] = deleted_count
+                        st.session_state.confirm_grid_delete = False
+                        st.session_state.admin_grid_nonce += 1
+                        st.success(f"✅ 질문 {deleted_count}개가 휴지통으로 이동했습니다")
+                        st.rerun()
+                    else:
+                        st.session_state.confirm_grid_delete = delete_signature
+                        delete_confirmed = True
+                        st.warning(f"⚠️ 선택한 질문 {len(selected_ids)}개가 삭제됩니다. 다시 클릭하면 삭제됩니다.")
+            
+            if delete_confirmed:
+                if st.button("취소", key="cancel_grid_delete"):
+                    st.session_state.confirm_grid_delete = False
+                    st.rerun()
+        
+        st.markdown("---")
+        
+        # 휴지통 (질문이 없어도 복원할 수 있도록 항상 표시)
+        with st.expander("♻️ 휴지통", expanded=False):
+            render_trash()
     
     # 탭 2: 통계
     with tab2:
@@ -797,6 +1054,20 @@ if check_admin():
                         ])
                         st.bar_chart(time_df.set_index("시간대"))
                     
+                    # 방문 기록 내보내기 (요청 시에만 생성)
+                    if st.button("📥 방문 기록 Excel 준비", key="prepare_visits_export"):
+                        try:
+                            visits_xlsx = export_visits_xlsx(stats)
+                            st.download_button(
+                                label="📥 방문 기록 Excel 다운로드",
+                                data=visits_xlsx,
+                                file_name=f"visits_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                                mime=EXPORT_FORMATS["xlsx"]["mime"],
+                                key="download_visits_export"
+                            )
+                        except ImportError:
+                            st.error("Excel 내보내기를 사용하려면 openpyxl 패키지가 필요합니다")
+                    
                     st.markdown("---")
             except Exception as e:
                 st.warning(f"방문자 통계 로드 오류: {e}")
@@ -811,9 +1082,16 @@ if check_admin():
             </div>
             """, unsafe_allow_html=True)
         
+        # 요청 제한 현황
+        st.subheader("🚦 요청 제한 현황")
+        st.caption("세션별 토큰 버킷으로 질문 등록/좋아요 속도를 제한합니다 (앱 재시작 시 초기화)")
+        st.dataframe(pd.DataFrame(get_rate_limit_stats()), width="stretch", hide_index=True)
+        
+        st.markdown("---")
+        
         # 질문 통계
         st.subheader("📝 질문 통계")
-        if not questions:
+        if not total_questions:
             st.markdown("""
             <div style="background: rgba(255, 255, 255, 0.08); backdrop-filter: blur(40px); -webkit-backdrop-filter: blur(40px);
                         padding: 2rem; border-radius: 16px; border: 1px solid rgba(255, 255, 255, 0.15);
@@ -824,74 +1102,42 @@ if check_admin():
             </div>
             """, unsafe_allow_html=True)
         else:
+            question_stats = get_question_stats(load_questions)
+            metrics = question_stats["metrics"]
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("총 질문 수", len(questions))
+                st.metric("총 질문 수", metrics["total"])
             
             with col2:
-                total_likes = sum(q.get("likes", 0) for q in questions)
-                st.metric("총 좋아요 수", total_likes)
+                st.metric("총 좋아요 수", metrics["likes"])
             
             with col3:
-                avg_likes = total_likes / len(questions) if questions else 0
+                avg_likes = metrics["likes"] / metrics["total"] if metrics["total"] else 0
                 st.metric("평균 좋아요", f"{avg_likes:.1f}")
             
             with col4:
-                anonymous_count = sum(1 for q in questions if q.get("name") == "익명")
-                st.metric("익명 질문", anonymous_count)
+                st.metric("익명 질문", metrics["anonymous"])
             
             st.markdown("---")
             
             # 작성자별 통계
             st.subheader("📊 작성자별 통계")
-            author_stats = {}
-            for q in questions:
-                author = q.get("name", "익명")
-                if author not in author_stats:
-                    author_stats[author] = {"count": 0, "likes": 0}
-                author_stats[author]["count"] += 1
-                author_stats[author]["likes"] += q.get("likes", 0)
-            
-            author_df = pd.DataFrame([
-                {
-                    "작성자": author,
-                    "질문 수": stats["count"],
-                    "총 좋아요": stats["likes"],
-                    "평균 좋아요": round(stats["likes"] / stats["count"], 1)
-                }
-                for author, stats in author_stats.items()
-            ]).sort_values("질문 수", ascending=False)
-            
-            st.dataframe(author_df, width="stretch", hide_index=True)
+            st.dataframe(question_stats["authors"], width="stretch", hide_index=True)
             
             st.markdown("---")
             
             # 시간대별 통계
             st.subheader("🕒 시간대별 질문 수")
-            time_stats = {}
-            for q in questions:
-                timestamp = q.get("timestamp", "")
-                if timestamp:
-                    try:
-                        hour = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").hour
-                        time_range = f"{hour:02d}:00-{hour+1:02d}:00"
-                        time_stats[time_range] = time_stats.get(time_range, 0) + 1
-                    except:
-                        pass
-            
-            if time_stats:
-                time_df = pd.DataFrame([
-                    {"시간대": k, "질문 수": v}
-                    for k, v in sorted(time_stats.items())
-                ])
+            time_df = question_stats["hours"]
+            if not time_df.empty:
                 st.bar_chart(time_df.set_index("시간대"))
     
     # 탭 3: 데이터 내보내기
     with tab3:
         st.header("📥 데이터 내보내기")
         
-        if not questions:
+        if not total_questions:
             st.markdown("""
             <div style="background: rgba(255, 193, 7, 0.1); backdrop-filter: blur(40px); -webkit-backdrop-filter: blur(40px);
                         padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(255, 193, 7, 0.2);
@@ -907,47 +1153,107 @@ if check_admin():
                         padding: 1.5rem; border-radius: 12px; border: 1px solid rgba(0, 102, 204, 0.2);
                         text-align: center; margin-bottom: 1.5rem;">
                 <p style="color: #ffffff; font-size: 1.1rem; margin: 0;">
-                    총 {len(questions)}개의 질문을 내보낼 수 있습니다
+                    총 {total_questions}개의 질문을 내보낼 수 있습니다
                 </p>
             </div>
             """, unsafe_allow_html=True)
             
-            col1, col2 = st.columns(2)
+            st.caption("💡 파일은 준비 버튼을 눌렀을 때만 만들어지고, 데이터가 바뀌기 전까지 재사용됩니다.")
             
-            with col1:
-                st.subheader("📄 CSV 파일로 내보내기")
-                csv_data = export_to_csv()
-                if csv_data:
-                    st.download_button(
-                        label="📥 CSV 다운로드",
-                        data=csv_data,
-                        file_name=f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        width="stretch"
-                    )
+            if 'prepared_exports' not in st.session_state:
+                st.session_state.prepared_exports = set()
             
-            with col2:
-                st.subheader("📊 Excel 파일로 내보내기")
-                try:
-                    excel_data = export_to_excel()
-                    if excel_data:
+            export_cols = st.columns(len(EXPORT_FORMATS))
+            for export_col, (fmt, info) in zip(export_cols, EXPORT_FORMATS.items()):
+                with export_col:
+                    st.subheader(info["label"])
+                    if fmt not in st.session_state.prepared_exports:
+                        if st.button("⚙️ 파일 준비", key=f"prepare_export_{fmt}", width="stretch"):
+                            st.session_state.prepared_exports.add(fmt)
+                            st.rerun()
+                        continue
+                    try:
+                        export_data = get_export(fmt)
+                    except ImportError:
+                        if fmt == "xlsx":
+                            st.error("Excel 내보내기를 사용하려면 openpyxl 패키지가 필요합니다")
+                            st.code("pip install openpyxl")
+                        else:
+                            st.error("Parquet 내보내기를 사용하려면 pyarrow 패키지가 필요합니다")
+                            st.code("pip install pyarrow")
+                        continue
+                    if export_data:
                         st.download_button(
-                            label="📥 Excel 다운로드",
-                            data=excel_data,
-                            file_name=f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            label=f"📥 {info['ext'].upper()} 다운로드",
+                            data=export_data,
+                            file_name=f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{info['ext']}",
+                            mime=info["mime"],
+                            key=f"download_export_{fmt}",
                             width="stretch"
                         )
-                except ImportError:
-                    st.error("Excel 내보내기를 사용하려면 openpyxl 패키지가 필요합니다")
-                    st.code("pip install openpyxl")
+                    else:
+                        st.warning("내보낼 질문이 없습니다")
             
             st.markdown("---")
             
             # 미리보기
             st.subheader("📋 데이터 미리보기")
-            df = pd.DataFrame(questions)
+            st.caption(f"앞쪽 {min(EXPORT_PREVIEW_ROWS, total_questions)}개만 표시합니다 (전체는 내보내기 파일에서 확인)")
+            df = pd.DataFrame(fetch_questions_page(limit=EXPORT_PREVIEW_ROWS), columns=QUESTION_COLUMNS)
             st.dataframe(df, width="stretch", hide_index=True)
+        
+        st.markdown("---")
+        
+        # 가져오기 (질문이 없어도 사용할 수 있도록 항상 표시)
+        st.subheader("📤 데이터 가져오기")
+        st.caption("CSV / Excel / JSON / JSONL 파일의 id, name, question, timestamp, likes 열을 읽어 질문을 추가합니다. 같은 작성자·질문·작성 시간의 질문은 건너뜁니다.")
+        uploaded_file = st.file_uploader(
+            "가져올 파일",
+            type=list(IMPORT_FORMATS),
+            key=f"import_file_{st.session_state.get('import_nonce', 0)}"
+        )
+        if uploaded_file is not None:
+            import_fmt = detect_import_format(uploaded_file.name)
+            if st.button("📤 가져오기 실행", key="run_import", width="stretch"):
+                progress_bar = st.progress(0.0, text="가져오는 중...")
+                
+                def update_import_progress(fraction, processed):
+                    progress_bar.progress(
+                        min(1.0, fraction or 0.0),
+                        text=f"가져오는 중... ({processed:,}행 처리)"
+                    )
+                
+                try:
+                    with audited("import", get_session_key(), {"file": uploaded_file.name}) as audit:
+                        summary = import_questions(uploaded_file, import_fmt, progress=update_import_progress)
+                        # 도중에 중단되어도 이미 저장된 batch는 미러/변경 피드에 반영
+                        if summary["inserted"]:
+                            record_change(CHANGE_RESET)
+                            sync_remote_mirror()
+                        audit["ids"] = summary["ids"]
+                        audit["error"] = summary["failed"]
+                except ImportError:
+                    st.error("Excel 가져오기를 사용하려면 openpyxl 패키지가 필요합니다")
+                    st.code("pip install openpyxl")
+                except Exception as e:
+                    st.error(f"가져오기 오류: {e}")
+                else:
+                    st.session_state.import_summary = {k: v for k, v in summary.items() if k != "ids"}
+                    st.session_state.import_nonce = st.session_state.get('import_nonce', 0) + 1
+                    st.rerun()
+        
+        import_summary = st.session_state.get("import_summary")
+        if import_summary:
+            if import_summary.get("failed"):
+                st.error(f"가져오기 오류: {import_summary['failed']} (이미 추가된 질문은 저장되었습니다)")
+            st.success(
+                f"✅ {import_summary['inserted']}개 추가 · 중복 {import_summary['duplicates']}개 건너뜀 · "
+                f"오류 {import_summary['invalid']}개"
+            )
+            if import_summary["errors"]:
+                with st.expander("오류 행 보기"):
+                    for error in import_summary["errors"]:
+                        st.text(error)
     
     # 탭 4: 설정
     with tab4:
@@ -1006,9 +1312,8 @@ if check_admin():
             st.info("💡 **해결 방법**: Google Sheets를 연동하거나 SQLite를 사용하세요.")
         
         # 현재 저장된 질문 수 표시
-        questions_count = len(load_questions())
         st.markdown("---")
-        st.metric("현재 저장된 질문 수", f"{questions_count}개")
+        st.metric("현재 저장된 질문 수", f"{total_questions}개")
         
         # Google Sheets 연결 테스트 및 디버깅
         st.markdown("---")
@@ -1114,179 +1419,85 @@ worksheet = "questions"
                             spreadsheet_id = match.group(1)
                             csv_export_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=csv&gid=0"
                             st.info(f"📥 CSV Export URL: `{csv_export_url}`")
-                            
-                            # CSV export URL 직접 테스트
-                            try:
-                                import urllib.request
-                                with urllib.request.urlopen(csv_export_url) as response:
-                                    csv_data = response.read().decode('utf-8')
-                                    st.success(f"✅ CSV Export URL 접근 성공! (데이터 길이: {len(csv_data)} bytes)")
-                            except Exception as e:
-                                st.error(f"❌ CSV Export URL 접근 실패: {e}")
-                                st.warning("⚠️ 공개 설정이 제대로 되지 않았거나, CSV export가 비활성화되어 있을 수 있습니다.")
             except Exception as e:
                 st.warning(f"URL 확인 중 오류: {e}")
-            
-            if st.button("연결 테스트", key="test_gsheets"):
-                try:
-                    gsheets_config = st.secrets.get("connections", {}).get("gsheets", {})
-                    spreadsheet_url = gsheets_config.get("spreadsheet", "")
-                    if has_service_account(gsheets_config):
-                        df_read = conn_gsheet.read(worksheet=WORKSHEET_NAME, ttl=0)
-                        st.success(f"✅ 읽기 성공 (Service Account): {len(df_read) if df_read is not None and not df_read.empty else 0}개 행")
-                    else:
-                        if spreadsheet_url:
-                            import re
-                            match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', spreadsheet_url)
-                            if match:
-                                spreadsheet_id = match.group(1)
-                                csv_export_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=csv&gid=0"
-                                df_read = pd.read_csv(csv_export_url)
-                                st.success(f"✅ 읽기 성공 (CSV Export URL 사용): {len(df_read) if df_read is not None and not df_read.empty else 0}개 행")
-                            else:
-                                st.error("❌ spreadsheet_id를 추출할 수 없습니다.")
-                                st.stop()
-                        else:
-                            st.error("❌ Secrets에 spreadsheet URL이 없습니다.")
-                            st.stop()
-                    
-                    # 쓰기 테스트 (테스트 데이터)
-                    test_data = pd.DataFrame([{
-                        'id': 999,
-                        'name': '테스트',
-                        'question': '연결 테스트',
-                        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        'likes': 0
-                    }])
-                    
-                    # 기존 데이터와 합치기
-                    if df_read is not None and not df_read.empty:
-                        # 테스트 데이터 제거 (이미 있으면)
-                        df_read = df_read[df_read['id'] != 999]
-                        combined_df = pd.concat([df_read, test_data], ignore_index=True)
-                    else:
-                        combined_df = test_data
-                    
-                    if has_service_account(gsheets_config):
-                        conn_gsheet.update(worksheet=WORKSHEET_NAME, data=combined_df)
-                        st.success("✅ 쓰기 성공 (Service Account)")
-                    else:
-                        st.warning("⚠️ 공개 시트는 쓰기 불가합니다. Service Account가 필요합니다.")
-                        st.info("💡 현재는 읽기만 테스트되었습니다. 쓰기는 SQLite에 저장됩니다.")
-                        st.success("✅ 읽기 테스트 완료! 실제 데이터는 SQLite에 저장됩니다.")
-                except Exception as e:
-                    import traceback
-                    st.error(f"❌ 연결 실패: {str(e)}")
-                    with st.expander("상세 에러 정보"):
-                        st.code(traceback.format_exc())
         else:
             st.warning("⚠️ Google Sheets 연결이 설정되지 않았습니다")
         
+        # 저장소 상태 (백그라운드 점검 결과만 표시, 화면을 그릴 때 네트워크를 기다리지 않음)
         st.markdown("---")
+        st.subheader("🩺 저장소 상태")
+        st.caption(
+            f"{HEALTH_CHECK_INTERVAL_SECONDS}초마다 백그라운드에서 점검합니다 "
+            f"(점검당 제한 시간 {HEALTH_CHECK_TIMEOUT_SECONDS}초, 읽기 전용)"
+        )
+        if st.button("🔄 지금 점검", key="run_health_checks"):
+            run_health_checks()
+        st.dataframe(
+            pd.DataFrame(get_health_results()),
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "최근 응답 시간": st.column_config.LineChartColumn("최근 응답 시간 (ms)", y_min=0),
+            }
+        )
         
-        st.subheader("🗑️ 질문 관리 기능")
-        
-        # 질문 일괄 삭제 옵션
-        col_del1, col_del2 = st.columns(2)
+        # DB 백업 / 복원
+        st.markdown("---")
+        st.subheader("💾 DB 백업")
+        backup_settings = get_backup_settings()
+        st.caption(
+            f"{backup_settings['interval_minutes']}분마다 questions.db 스냅샷을 만들고 "
+            f"최근 {backup_settings['keep']}개를 보관합니다 (backups 폴더, gzip 압축)"
+        )
+        if st.button("💾 지금 백업", key="create_snapshot"):
+            with audited("backup", get_session_key()):
+                snapshot_name = create_snapshot()
+                prune_snapshots()
+            if snapshot_name:
+                st.success(f"✅ 백업 완료: {snapshot_name}")
+            else:
+                st.info("백업할 DB 파일이 없습니다.")
         
-        with col_del1:
-            st.markdown("**좋아요가 적은 질문 삭제**")
-            delete_likes_threshold = st.number_input(
-                "좋아요가 이 값 이하인 질문 삭제",
-                min_value=0,
-                value=0,
-                key="delete_likes_threshold",
-                help="예: 0을 입력하면 좋아요가 0개인 질문만 삭제됩니다"
+        snapshots = list_snapshots()
+        if snapshots:
+            st.dataframe(
+                pd.DataFrame([
+                    {"스냅샷": s["name"], "생성 시간": s["created_at"], "크기(KB)": round(s["size"] / 1024, 1)}
+                    for s in snapshots
+                ]),
+                width="stretch",
+                hide_index=True
             )
-            if st.button("좋아요 기준으로 삭제", key="delete_by_likes", type="secondary"):
-                if st.session_state.get("confirm_delete_by_likes", False):
-                    questions = load_questions()
-                    deleted_count = 0
-                    remaining_questions = []
-                    for q in questions:
-                        if q.get("likes", 0) <= delete_likes_threshold:
-                            deleted_count += 1
-                        else:
-                            remaining_questions.append(q)
-                    
-                    # ID 재정렬
-                    for idx, q in enumerate(remaining_questions, 1):
-                        q['id'] = idx
-                    
-                    save_questions(remaining_questions)
-                    st.success(f"✅ 좋아요 {delete_likes_threshold}개 이하인 질문 {deleted_count}개가 삭제되었습니다")
-                    st.session_state.confirm_delete_by_likes = False
-                    st.rerun()
-                else:
-                    questions = load_questions()
-                    count = sum(1 for q in questions if q.get("likes", 0) <= delete_likes_threshold)
-                    if count > 0:
-                        st.session_state.confirm_delete_by_likes = True
-                        st.warning(f"⚠️ 좋아요 {delete_likes_threshold}개 이하인 질문 {count}개가 삭제됩니다. 다시 클릭하면 삭제됩니다.")
+            restore_name = st.selectbox("복원할 스냅샷", [s["name"] for s in snapshots], key="restore_snapshot_name")
+            if st.button("⏪ 이 시점으로 복원", key="restore_snapshot", type="secondary"):
+                if st.session_state.get("confirm_restore_snapshot", False):
+                    try:
+                        with audited("restore_snapshot", get_session_key(), {"snapshot": restore_name}) as audit:
+                            audit["count"] = restore_snapshot(restore_name)
+                            record_change(CHANGE_RESET)
+                            sync_remote_mirror()
+                    except Exception as e:
+                        st.error(f"복원 오류: {e}")
                     else:
-                        st.info("해당 조건에 맞는 질문이 없습니다.")
-            
-            if st.session_state.get("confirm_delete_by_likes", False):
-                if st.button("취소", key="cancel_delete_by_likes"):
-                    st.session_state.confirm_delete_by_likes = False
-                    st.rerun()
-        
-        with col_del2:
-            st.markdown("**오래된 질문 삭제**")
-            delete_days = st.number_input(
-                "몇 일 이전 질문 삭제",
-                min_value=1,
-                value=7,
-                key="delete_days",
-                help="예: 7을 입력하면 7일 이전 질문이 삭제됩니다"
-            )
-            if st.button("날짜 기준으로 삭제", key="delete_by_date", type="secondary"):
-                if st.session_state.get("confirm_delete_by_date", False):
-                    questions = load_questions()
-                    from datetime import timedelta
-                    cutoff_date = datetime.now() - timedelta(days=delete_days)
-                    deleted_count = 0
-                    remaining_questions = []
-                    for q in questions:
-                        try:
-                            q_date = datetime.strptime(q.get("timestamp", ""), "%Y-%m-%d %H:%M:%S")
-                            if q_date < cutoff_date:
-                                deleted_count += 1
-                            else:
-                                remaining_questions.append(q)
-                        except:
-                            remaining_questions.append(q)
-                    
-                    # ID 재정렬
-                    for idx, q in enumerate(remaining_questions, 1):
-                        q['id'] = idx
-                    
-                    save_questions(remaining_questions)
-                    st.success(f"✅ {delete_days}일 이전 질문 {deleted_count}개가 삭제되었습니다")
-                    st.session_state.confirm_delete_by_date = False
-                    st.rerun()
+                        st.session_state.confirm_restore_snapshot = False
+                        st.success(f"✅ {restore_name} 시점으로 복원되었습니다")
+                        st.rerun()
                 else:
-                    questions = load_questions()
-                    from datetime import timedelta
-                    cutoff_date = datetime.now() - timedelta(days=delete_days)
-                    count = 0
-                    for q in questions:
-                        try:
-                            q_date = datetime.strptime(q.get("timestamp", ""), "%Y-%m-%d %H:%M:%S")
-                            if q_date < cutoff_date:
-                                count += 1
-                        except:
-                            pass
-                    if count > 0:
-                        st.session_state.confirm_delete_by_date = True
-                        st.warning(f"⚠️ {delete_days}일 이전 질문 {count}개가 삭제됩니다. 다시 클릭하면 삭제됩니다.")
-                    else:
-                        st.info("해당 조건에 맞는 질문이 없습니다.")
+                    st.session_state.confirm_restore_snapshot = True
+                    st.warning("⚠️ 질문과 휴지통이 선택한 시점으로 바뀝니다 (감사 로그와 조회수는 유지, 현재 상태는 pre_restore 스냅샷으로 남습니다). 다시 클릭하면 복원됩니다.")
             
-            if st.session_state.get("confirm_delete_by_date", False):
-                if st.button("취소", key="cancel_delete_by_date"):
-                    st.session_state.confirm_delete_by_date = False
+            if st.session_state.get("confirm_restore_snapshot", False):
+                if st.button("취소", key="cancel_restore_snapshot"):
+                    st.session_state.confirm_restore_snapshot = False
                     st.rerun()
+        else:
+            st.info("아직 만들어진 스냅샷이 없습니다.")
+        
+        st.markdown("---")
+        
+        st.subheader("🗑️ 질문 관리 기능")
+        render_batch_delete_controls("delete")
         
         st.markdown("---")
         
@@ -1301,8 +1512,9 @@ worksheet = "questions"
                 if st.session_state.get("confirm_reset_stats", False):
                     try:
                         from utils_stats import load_stats, save_stats
-                        stats = []
-                        save_stats(stats)
+                        with audited("reset_stats", get_session_key()):
+                            stats = []
+                            save_stats(stats)
                         st.success("✅ 조회수 통계가 초기화되었습니다")
                         st.session_state.confirm_reset_stats = False
                         st.rerun()
@@ -1322,16 +1534,17 @@ worksheet = "questions"
             st.caption("모든 질문의 좋아요 수를 0으로 초기화합니다")
             if st.button("좋아요 초기화", key="reset_likes", type="secondary"):
                 if st.session_state.get("confirm_reset_likes", False):
-                    questions = load_questions()
-                    for q in questions:
-                        q['likes'] = 0
-                    save_questions(questions)
+                    with audited("reset_likes", get_session_key()) as audit:
+                        questions = load_questions()
+                        for q in questions:
+                            q['likes'] = 0
+                        save_questions(questions)
+                        audit["count"] = len(questions)
                     st.success("✅ 모든 질문의 좋아요가 초기화되었습니다")
                     st.session_state.confirm_reset_likes = False
                     st.rerun()
                 else:
-                    questions = load_questions()
-                    total_likes = sum(q.get("likes", 0) for q in questions)
+                    total_likes = get_counters().get(COUNTER_TOTAL_LIKES, 0)
                     if total_likes > 0:
                         st.session_state.confirm_reset_likes = True
                         st.warning(f"⚠️ 총 {total_likes}개의 좋아요가 모두 0으로 초기화됩니다. 다시 클릭하면 초기화됩니다.")
@@ -1372,14 +1585,18 @@ worksheet = "questions"
                     padding: 1rem; border-radius: 12px; border: 1px solid rgba(220, 53, 69, 0.2);
                     margin-bottom: 1rem;">
             <p style="color: #ffffff; font-size: 1rem; margin: 0; font-weight: 600;">
-                ⚠️ 주의: 이 작업은 되돌릴 수 없습니다!
+                ⚠️ 주의: 모든 질문이 휴지통으로 이동합니다! (보관 기간 안에는 질문 관리 탭의 휴지통에서 복원 가능)
             </p>
         </div>
         """, unsafe_allow_html=True)
         
         if st.button("전체 질문 삭제", type="secondary"):
             if st.session_state.get("confirm_delete", False):
-                save_questions([])
+                with audited("delete_all", get_session_key(), {"all": True}) as audit:
+                    deleted_ids = delete_matching_questions({"all": True})
+                    record_change(CHANGE_DELETE, ids=deleted_ids)
+                    sync_remote_mirror()
+                    audit["ids"] = deleted_ids
                 st.session_state.confirm_delete = False
                 st.markdown("""
                 <div style="background: rgba(40, 167, 69, 0.15); backdrop-filter: blur(40px); -webkit-backdrop-filter: blur(40px);
@@ -1407,3 +1624,67 @@ worksheet = "questions"
             if st.button("취소"):
                 st.session_state.confirm_delete = False
                 st.rerun()
+    
+    # 탭 5: 감사 로그
+    with tab5:
+        st.header("🧾 감사 로그")
+        st.caption("관리자 변경 작업 기록 (추가만 되고 수정/삭제되지 않음)")
+        
+        # 방금 한 작업이 보이도록 대기 중인 기록 저장을 잠시 기다림
+        wait_for_audit_writes()
+        
+        col_range, col_actions = st.columns([1, 2])
+        with col_range:
+            today = datetime.now().date()
+            audit_range = st.date_input(
+                "기간",
+                value=(today - timedelta(days=7), today),
+                key="audit_range"
+            )
+        with col_actions:
+            audit_actions = st.multiselect(
+                "작업 종류",
+                options=list(AUDIT_ACTIONS),
+                format_func=lambda action: AUDIT_ACTIONS[action],
+                key="audit_actions",
+                placeholder="전체"
+            )
+        
+        # 기간 선택 중에는 끝 날짜가 없을 수 있음
+        if isinstance(audit_range, (list, tuple)):
+            range_start = audit_range[0] if len(audit_range) > 0 else None
+            range_end = audit_range[1] if len(audit_range) > 1 else range_start
+        else:
+            range_start = range_end = audit_range
+        audit_start = range_start.strftime("%Y-%m-%d") if range_start else None
+        audit_end = (range_end + timedelta(days=1)).strftime("%Y-%m-%d") if range_end else None
+        
+        audit_total = count_audit_entries(audit_start, audit_end, audit_actions)
+        audit_page_size = 50
+        audit_pages = max(1, (audit_total + audit_page_size - 1) // audit_page_size)
+        if st.session_state.get("audit_page", 1) > audit_pages:
+            st.session_state.audit_page = audit_pages
+        
+        col_count, col_page = st.columns([2, 1])
+        with col_count:
+            st.metric("기록 수", audit_total)
+        with col_page:
+            audit_page = st.number_input(
+                f"페이지 (전체 {audit_pages}쪽)",
+                min_value=1,
+                max_value=audit_pages,
+                step=1,
+                key="audit_page"
+            )
+        
+        audit_rows = fetch_audit_page(
+            audit_start,
+            audit_end,
+            audit_actions,
+            limit=audit_page_size,
+            offset=(audit_page - 1) * audit_page_size
+        )
+        if audit_rows:
+            st.dataframe(pd.DataFrame(audit_rows), width="stretch", hide_index=True)
+        else:
+            st.info("해당 조건의 감사 기록이 없습니다.")
@@ -0,0 +1,67 @@
+"""
+런치톡 팟캐스트 오디오를 스트리밍용으로 다시 묶는 스크립트 (ffmpeg 필요, 선택 사항)
+- 재인코딩 없이(-c copy) 짧은 조각(fragment) 단위의 MP4로 다시 저장
+  → 메타데이터(moov)가 파일 맨 앞에 오고 조각마다 재생에 필요한 정보가 있어서
+    브라우저는 첫 조각만 받으면 바로 재생 시작 (녹음 길이와 관계없이 시작 시간이 일정)
+- 결과 파일(<이름>.stream.m4a)이 있으면 팟캐스트 탭이 원본 대신 사용 (st.audio로 재생)
+- 배포 전에 한 번 실행: python prepare_audio.py [오디오 파일 ...]
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+RECORD_DIR = Path(__file__).parent / "lunch_talk_record"
+STREAM_SUFFIX = ".stream.m4a"
+
+# 조각 길이 (마이크로초) - 짧을수록 첫 재생이 빠르지만 파일이 조금 커짐
+FRAGMENT_DURATION_US = 2_000_000
+
+
+def stream_path_for(path):
+    """원본 오디오에 대응하는 스트리밍용 파일 경로"""
+    path = Path(path)
+    return path.with_name(path.stem + STREAM_SUFFIX)
+
+
+def prepare_audio(path, force=False):
+    """
+    오디오를 조각 단위 MP4로 변환 (이미 최신이면 건너뜀)
+    - 반환: 결과 파일 경로, 실패하면 None
+    """
+    path = Path(path)
+    target = stream_path_for(path)
+    if not force and target.exists() and target.stat().st_mtime >= path.stat().st_mtime:
+        print(f"{path.name}: 이미 최신")
+        return target
+
+    partial = target.with_name(f".{target.name}.partial.m4a")
+    command = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-i", str(path),
+        "-vn", "-c:a", "copy",
+        "-movflags", "+frag_keyframe+empty_moov+default_base_moof",
+        "-frag_duration", str(FRAGMENT_DURATION_US),
+        str(partial),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"{path.name}: 변환 실패 ({result.stderr.strip()})")
+        partial.unlink(missing_ok=True)
+        return None
+    partial.replace(target)
+    print(f"{path.name} -> {target.name}: {target.stat().st_size:,} bytes")
+    return target
+
+
+if __name__ == "__main__":
+    if shutil.which("ffmpeg") is None:
+        print("ffmpeg가 설치되어 있지 않아 변환할 수 없습니다 (원본 파일을 그대로 사용)")
+        sys.exit(0)
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    sources = [Path(arg) for arg in args] or [
+        p for p in sorted(RECORD_DIR.glob("*.m4a")) if not p.name.endswith(STREAM_SUFFIX)
+    ]
+    ok = all(prepare_audio(source, force="--force" in sys.argv) is not None for source in sources)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,230 @@
+"""
+관리자 감사 로그 유틸리티
+- 관리자 변경 작업(삭제, 수정, 복원, 초기화 등)을 추가 전용 SQLite 테이블에 기록
+- 기록은 큐에 넣고 백그라운드 스레드가 모아서 저장 (변경 작업을 느리게 하지 않음)
+- 도중에 실패한 작업도 오류 내용과 함께 기록 (일부만 반영된 변경도 흔적이 남도록)
+- 시간 범위 / 작업 종류로 조회 (인덱스 사용, 페이지 단위)
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from utils_db import connect
+
+# 작업 종류 -> 표시 이름
+AUDIT_ACTIONS = {
+    "grid_update": "질문 수정",
+    "grid_delete": "선택 삭제",
+    "batch_delete": "조건 일괄 삭제",
+    "delete_all": "전체 삭제",
+    "trash_restore": "휴지통 복원",
+    "trash_purge": "휴지통 비우기",
+    "import": "가져오기",
+    "backup": "DB 백업",
+    "restore_snapshot": "DB 복원",
+    "reset_stats": "조회수 초기화",
+    "reset_likes": "좋아요 초기화",
+}
+
+# 기록 하나에 저장할 최대 id 수 (개수는 항상 전체를 저장)
+AUDIT_MAX_IDS = 1000
+
+logger = logging.getLogger(__name__)
+
+_queue = queue.Queue()
+_writer_lock = threading.Lock()
+_writer_thread = None
+_table_ready = False
+
+
+def _ensure_table(conn):
+    """감사 로그 테이블 / 인덱스 생성"""
+    global _table_ready
+    if _table_ready:
+        return
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS admin_audit (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL,
+            session TEXT,
+            action TEXT NOT NULL,
+            predicate TEXT,
+            affected_ids TEXT,
+            affected_count INTEGER DEFAULT 0,
+            duration_ms REAL,
+            error TEXT
+        )
+    ''')
+    # 오류 열 도입 전 테이블이면 열만 추가 (NULL = 성공)
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(admin_audit)')}
+    if "error" not in columns:
+        conn.execute('ALTER TABLE admin_audit ADD COLUMN error TEXT')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_admin_audit_created_at ON admin_audit(created_at)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_admin_audit_action ON admin_audit(action, created_at)')
+    conn.commit()
+    _table_ready = True
+
+
+def reset_audit_table_state():
+    """테이블 확인 상태 초기화 (DB 파일을 바꾸거나 복원한 뒤 호출 → 다음 기록 때 테이블을 다시 확인)"""
+    global _table_ready
+    _table_ready = False
+
+
+def _write_batch(entries):
+    """쌓인 기록을 한 트랜잭션으로 저장"""
+    conn = connect()
+    try:
+        _ensure_table(conn)
+        conn.executemany('''
+            INSERT INTO admin_audit (
+                created_at, session, action, predicate, affected_ids, affected_count, duration_ms, error
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', entries)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _writer_loop():
+    """큐에서 기록을 꺼내 모아서 저장"""
+    while True:
+        entries = [_queue.get()]
+        while True:
+            try:
+                entries.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_batch(entries)
+        except Exception:
+            logger.exception("감사 기록 %d건 저장 실패", len(entries))
+        finally:
+            for _ in entries:
+                _queue.task_done()
+
+
+def _start_writer():
+    """저장 스레드 시작 (프로세스당 한 번만)"""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is not None and _writer_thread.is_alive():
+            return
+        _writer_thread = threading.Thread(target=_writer_loop, name="audit-writer", daemon=True)
+        _writer_thread.start()
+
+
+def log_admin_action(action, session=None, predicate=None, ids=None, count=None, duration_ms=None, error=None):
+    """감사 기록 추가 (큐에 넣기만 하고 바로 반환, error: 실패한 작업의 오류 내용)"""
+    ids = [int(i) for i in ids] if ids is not None else []
+    if count is None:
+        count = len(ids)
+    _queue.put((
+        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        session,
+        action,
+        json.dumps(predicate, ensure_ascii=False) if predicate is not None else None,
+        json.dumps(ids[:AUDIT_MAX_IDS]) if ids else None,
+        int(count),
+        round(duration_ms, 1) if duration_ms is not None else None,
+        error,
+    ))
+    _start_writer()
+
+
+@contextmanager
+def audited(action, session=None, predicate=None):
+    """
+    작업 시간을 재서 감사 기록을 남기는 컨텍스트
+    - with audited("grid_delete", session) as entry: entry["ids"] = 삭제된 id 목록
+    - 블록 안에서 예외가 나면 오류 내용과 함께 기록한 뒤 예외를 그대로 전달
+    - 예외 없이 일부만 실패한 작업은 entry["error"]에 오류 내용을 넣음
+    """
+    entry = {"ids": None, "count": None, "error": None}
+    start = time.perf_counter()
+    error = None
+    try:
+        yield entry
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        log_admin_action(
+            action,
+            session=session,
+            predicate=predicate,
+            ids=entry["ids"],
+            count=entry["count"],
+            duration_ms=(time.perf_counter() - start) * 1000,
+            error=error or entry["error"],
+        )
+
+
+def wait_for_audit_writes(timeout=1.0):
+    """대기 중인 기록이 저장될 때까지 잠시 기다림 (조회 직전에 호출)"""
+    deadline = time.monotonic() + timeout
+    while _queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _audit_filter(start=None, end=None, actions=None):
+    """시간 범위 / 작업 종류 조건을 WHERE 절과 파라미터로 변환"""
+    clauses = []
+    params = []
+    if start:
+        clauses.append("created_at >= ?")
+        params.append(start)
+    if end:
+        clauses.append("created_at < ?")
+        params.append(end)
+    if actions:
+        clauses.append("action IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(list(actions)))
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def count_audit_entries(start=None, end=None, actions=None):
+    """조건에 맞는 감사 기록 수"""
+    where, params = _audit_filter(start, end, actions)
+    conn = connect()
+    try:
+        _ensure_table(conn)
+        return conn.execute(f'SELECT COUNT(*) FROM admin_audit {where}', params).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def fetch_audit_page(start=None, end=None, actions=None, limit=50, offset=0):
+    """조건에 맞는 감사 기록 한 페이지 (최신 순)"""
+    where, params = _audit_filter(start, end, actions)
+    conn = connect()
+    try:
+        _ensure_table(conn)
+        cursor = conn.execute(f'''
+            SELECT created_at, session, action, predicate, affected_ids, affected_count, duration_ms, error
+            FROM admin_audit {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ? OFFSET ?
+        ''', params + [int(limit), int(offset)])
+        return [
+            {
+                "시간": row[0],
+                "세션": (row[1] or "")[:8],
+                "작업": AUDIT_ACTIONS.get(row[2], row[2]),
+                "결과": f"❌ {row[7]}" if row[7] else "✅ 성공",
+                "조건": row[3] or "",
+                "대상 수": row[5],
+                "대상 ID": row[4] or "",
+                "소요 시간(ms)": row[6],
+            }
+            for row in cursor.fetchall()
+        ]
+    finally:
+        conn.close()
@@ -0,0 +1,247 @@
+"""
+questions.db 스냅샷 백업 유틸리티
+- SQLite 온라인 백업 API로 일관된 스냅샷 생성 (페이지 단위로 나눠 복사해 좋아요/질문 저장을 막지 않음)
+- 스냅샷은 gzip으로 압축해 backups 폴더에 보관, 개수 제한을 넘으면 오래된 것부터 삭제
+- secrets의 [backup] interval_minutes / keep 으로 주기와 보관 개수 조정 가능
+- 관리자 페이지에서 선택한 시점으로 복원 (질문 / 휴지통 테이블만 - 감사 로그와 조회수는 그대로 둠)
+"""
+
+import gzip
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import streamlit as st
+
+from utils_audit import reset_audit_table_state
+from utils_db import DB_FILE, connect, init_db, invalidate_counters, refresh_question_counters
+
+BACKUP_DIR = Path(__file__).parent / "backups"
+BACKUP_PREFIX = "questions_"
+BACKUP_SUFFIX = ".db.gz"
+
+DEFAULT_BACKUP_SETTINGS = {"interval_minutes": 60, "keep": 24}
+
+# 한 번에 복사할 페이지 수 / 단계 사이 대기 시간 (그 사이에 다른 연결이 쓰기 가능)
+BACKUP_STEP_PAGES = 64
+BACKUP_STEP_SLEEP = 0.005
+# 복사 중에 다른 연결이 쓰면 처음부터 다시 복사됨 - 이 횟수를 넘으면 한 번에 복사
+BACKUP_MAX_RESTARTS = 3
+
+_backup_lock = threading.Lock()
+_scheduler_lock = threading.Lock()
+_scheduler_thread = None
+
+
+def get_backup_settings():
+    """백업 주기 / 보관 개수 (secrets 설정이 있으면 기본값을 덮어씀)"""
+    settings = dict(DEFAULT_BACKUP_SETTINGS)
+    try:
+        settings.update(dict(st.secrets.get("backup", {})))
+    except Exception:
+        pass
+    return settings
+
+
+class _BackupRestarted(Exception):
+    """페이지 단위 복사가 너무 자주 다시 시작됨"""
+
+
+def _copy_database(source, target):
+    """
+    온라인 백업 API로 복사
+    - 먼저 페이지 단위로 나눠 복사 (단계 사이에 좋아요/질문 저장이 끼어들 수 있음)
+    - 쓰기가 계속 들어와 복사가 반복해서 다시 시작되면, 한 단계로 짧게 복사
+    """
+    state = {"remaining": None, "restarts": 0}
+
+    def progress(status, remaining, total):
+        if state["remaining"] is not None and remaining > state["remaining"]:
+            state["restarts"] += 1
+            if state["restarts"] > BACKUP_MAX_RESTARTS:
+                raise _BackupRestarted()
+        state["remaining"] = remaining
+
+    try:
+        source.backup(target, pages=BACKUP_STEP_PAGES, progress=progress, sleep=BACKUP_STEP_SLEEP)
+    except _BackupRestarted:
+        source.backup(target)
+
+
+def list_snapshots():
+    """보관 중인 스냅샷 목록 (최신 순)"""
+    if not BACKUP_DIR.exists():
+        return []
+    snapshots = []
+    for path in BACKUP_DIR.glob(f"{BACKUP_PREFIX}*{BACKUP_SUFFIX}"):
+        stat = path.stat()
+        snapshots.append({
+            "name": path.name,
+            "path": path,
+            "size": stat.st_size,
+            "created_at": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+            "mtime": stat.st_mtime,
+        })
+    snapshots.sort(key=lambda s: s["mtime"], reverse=True)
+    return snapshots
+
+
+def prune_snapshots(keep=None):
+    """보관 개수를 넘는 오래된 스냅샷 삭제, 삭제한 개수 반환"""
+    if keep is None:
+        keep = int(get_backup_settings()["keep"])
+    removed = 0
+    for snapshot in list_snapshots()[max(1, int(keep)):]:
+        try:
+            snapshot["path"].unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def create_snapshot(label=None):
+    """
+    현재 DB의 스냅샷 생성 (온라인 백업 API + gzip)
+    - DB 파일이 없으면 None, 성공하면 스냅샷 파일 이름 반환
+    """
+    if not Path(DB_FILE).exists():
+        return None
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    name = f"{BACKUP_PREFIX}{stamp}{'_' + label if label else ''}{BACKUP_SUFFIX}"
+
+    with _backup_lock:
+        fd, raw_path = tempfile.mkstemp(suffix=".db", dir=BACKUP_DIR)
+        os.close(fd)
+        try:
+            source = connect()
+            target = sqlite3.connect(raw_path)
+            try:
+                _copy_database(source, target)
+            finally:
+                target.close()
+                source.close()
+
+            partial_path = BACKUP_DIR / f"{name}.partial"
+            with open(raw_path, "rb") as raw, gzip.open(partial_path, "wb", compresslevel=6) as packed:
+                shutil.copyfileobj(raw, packed)
+            os.replace(partial_path, BACKUP_DIR / name)
+        finally:
+            if os.path.exists(raw_path):
+                os.remove(raw_path)
+    return name
+
+
+def _validate_database(path):
+    """복원할 DB 검사 (무결성 + questions 테이블 존재)"""
+    conn = sqlite3.connect(path)
+    try:
+        result = conn.execute('PRAGMA integrity_check').fetchone()[0]
+        if result != "ok":
+            raise ValueError(f"스냅샷 무결성 검사 실패: {result}")
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'questions'"
+        ).fetchone()
+        if not has_table:
+            raise ValueError("스냅샷에 questions 테이블이 없습니다")
+    finally:
+        conn.close()
+
+
+def _table_columns(conn, schema, table):
+    """첨부한 DB의 테이블 컬럼 목록 (테이블이 없으면 빈 목록)"""
+    return [row[1] for row in conn.execute(f'PRAGMA {schema}.table_info({table})')]
+
+
+def _copy_question_tables(raw_path):
+    """
+    스냅샷의 questions / question_trash만 현재 DB로 복사 (한 트랜잭션)
+    - admin_audit(추가 전용 감사 로그)와 조회수 카운터는 덮어쓰지 않음
+    - 질문 수 / 좋아요 카운터는 복사한 내용으로 다시 계산, 최대 id 기록은 줄어들지 않음
+    - 복원된 질문 수 반환
+    """
+    init_db()
+    conn = connect()
+    try:
+        conn.execute('ATTACH DATABASE ? AS snapshot', (str(raw_path),))
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute('DELETE FROM main.questions')
+        cursor.execute('''
+            INSERT INTO main.questions (id, name, question, timestamp, likes)
+            SELECT id, name, question, timestamp, likes FROM snapshot.questions
+        ''')
+        restored = cursor.rowcount
+        cursor.execute('DELETE FROM main.question_trash')
+        # 예전 스냅샷은 휴지통이 없거나 trash_id 없는 스키마일 수 있음
+        if 'deleted_at' in _table_columns(conn, 'snapshot', 'question_trash'):
+            cursor.execute('''
+                INSERT INTO main.question_trash (id, name, question, timestamp, likes, deleted_at)
+                SELECT id, name, question, timestamp, likes, deleted_at FROM snapshot.question_trash
+                ORDER BY deleted_at
+            ''')
+        refresh_question_counters(cursor)
+        conn.commit()
+        conn.execute('DETACH DATABASE snapshot')
+    finally:
+        conn.close()
+    return restored
+
+
+def restore_snapshot(name):
+    """
+    스냅샷으로 질문 데이터 복원, 복원된 질문 수 반환
+    - 복원 전 현재 상태를 pre_restore 스냅샷으로 남김
+    - 질문 / 휴지통 테이블만 한 트랜잭션으로 바꿔 넣음 (감사 로그는 이어서 유지)
+    """
+    path = BACKUP_DIR / Path(name).name
+    if not path.exists():
+        raise FileNotFoundError(f"스냅샷이 없습니다: {name}")
+
+    create_snapshot(label="pre_restore")
+    with _backup_lock:
+        fd, raw_path = tempfile.mkstemp(suffix=".db", dir=BACKUP_DIR)
+        os.close(fd)
+        try:
+            with gzip.open(path, "rb") as packed, open(raw_path, "wb") as raw:
+                shutil.copyfileobj(packed, raw)
+            _validate_database(raw_path)
+            restored = _copy_question_tables(raw_path)
+        finally:
+            if os.path.exists(raw_path):
+                os.remove(raw_path)
+    invalidate_counters()
+    reset_audit_table_state()
+    return restored
+
+
+def _scheduler_loop():
+    """주기적으로 스냅샷 생성 (마지막 스냅샷 시각 기준이라 재시작해도 주기 유지)"""
+    while True:
+        interval = max(1, float(get_backup_settings()["interval_minutes"])) * 60
+        snapshots = list_snapshots()
+        elapsed = time.time() - snapshots[0]["mtime"] if snapshots else interval
+        if elapsed >= interval:
+            try:
+                create_snapshot()
+                prune_snapshots()
+            except Exception:
+                pass
+            elapsed = 0
+        time.sleep(max(30, interval - elapsed))
+
+
+def start_backup_scheduler():
+    """백업 스레드 시작 (프로세스당 한 번만)"""
+    global _scheduler_thread
+    with _scheduler_lock:
+        if _scheduler_thread is not None and _scheduler_thread.is_alive():
+            return
+        _scheduler_thread = threading.Thread(target=_scheduler_loop, name="db-backup", daemon=True)
+        _scheduler_thread.start()
@@ -0,0 +1,72 @@
+"""
+질문 카드 HTML 렌더링 유틸리티
+- 카드 HTML을 (id, 좋아요 수, 행 버전) 기준으로 메모이즈
+- 한 페이지의 카드 목록을 하나의 HTML 블록으로 묶어 전송
+"""
+
+import html
+import threading
+from collections import OrderedDict
+
+from utils_changes import get_row_version
+
+# 메모이즈할 카드 HTML 최대 개수
+CARD_CACHE_SIZE = 2000
+
+_cache_lock = threading.Lock()
+_card_cache = OrderedDict()
+
+
+def _escape_text(text):
+    """HTML 이스케이프 + 줄바꿈 보존 (빈 줄이 마크다운 HTML 블록을 끊지 않도록)"""
+    return html.escape(str(text)).replace("\r\n", "\n").replace("\n", "&#10;")
+
+
+def _format_card(q, card_class, liked):
+    """질문 카드 한 장의 HTML 생성 (순번은 CSS counter로 표시)"""
+    name_display = html.escape(str(q.get("name", "익명")))
+    is_anonymous = name_display == "익명"
+    liked_mark = " · ✅ 좋아요 완료" if liked else ""
+    return (
+        f'<div class="{card_class}">'
+        f'<div class="question-header"><span class="question-rank"></span> '
+        f'{name_display}{"님" if not is_anonymous else ""}의 질문</div>'
+        f'<div class="question-text">{_escape_text(q.get("question", ""))}</div>'
+        f'<div class="question-meta">'
+        f'<span>🕒 {html.escape(str(q.get("timestamp", "")))}</span>'
+        f'<span>👍 좋아요 {q.get("likes", 0)}개{liked_mark} · #{q.get("id")}</span>'
+        f'</div></div>'
+    )
+
+
+def get_card_html(q, card_class="question-card", liked=False):
+    """메모이즈된 카드 HTML 반환 (내용이 바뀐 카드만 다시 생성)"""
+    key = (q.get("id"), q.get("likes", 0), get_row_version(q.get("id")), card_class, liked)
+    with _cache_lock:
+        cached = _card_cache.get(key)
+        if cached is not None:
+            _card_cache.move_to_end(key)
+            return cached
+
+    card_html = _format_card(q, card_class, liked)
+
+    with _cache_lock:
+        _card_cache[key] = card_html
+        while len(_card_cache) > CARD_CACHE_SIZE:
+            _card_cache.popitem(last=False)
+    return card_html
+
+
+def render_card_list_html(questions, start_rank=1, card_classes=None, liked_ids=None):
+    """한 페이지 분량의 카드 목록을 하나의 HTML 블록으로 결합"""
+    card_classes = card_classes or {}
+    liked_ids = liked_ids or set()
+    cards = "".join(
+        get_card_html(
+            q,
+            card_classes.get(q.get("id"), "question-card"),
+            q.get("id") in liked_ids,
+        )
+        for q in questions
+    )
+    return f'<div class="question-list" style="counter-reset: question-rank {start_rank - 1};">{cards}</div>'
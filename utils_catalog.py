@@ -0,0 +1,227 @@
+"""
+런치톡 기록 카탈로그 유틸리티
+- lunch_talk_record/ 아래에서 런치톡 단위(폴더 하나 = 런치톡 하나)로 자료를 찾아 목록으로 관리
+  - 폴더에 talk.json(매니페스트)이 있으면 그 내용대로 (lunch_talk_record/ 자체도 하나의 런치톡이 될 수 있음)
+  - 매니페스트가 없는 하위 폴더는 파일 이름/확장자로 자료 종류를 추정
+- 자료마다 크기 / 수정 시간 / 내용 해시를 보관
+- 폴더의 파일 목록(이름, 수정 시간, 크기)이 바뀐 런치톡만 다시 읽음 → 재실행마다 전체를 다시 훑지 않음
+- 자료 내용(요약 파싱, PDF 렌더링 등)은 런치톡을 선택했을 때 각 화면에서 읽음
+- audio_matches_transcript: 오디오가 첫 번째 녹취록과 같은 녹음(같은 시간축)일 때만 true
+  (요약의 [MM:SS]에서 오디오로 바로 이동하는 버튼을 보여줌, 기본값 false)
+
+talk.json 예시:
+{
+    "id": "2026-02-fisa-1",
+    "title": "우리 FISA 1차 런치톡",
+    "date": "2026-02-09",
+    "intro": "멘토 소개 문단 (마크다운)",
+    "assets": {
+        "summary": "lunch_talk_summary.txt",
+        "blog": "blog.txt",
+        "audio": "podcast.m4a",
+        "slides": "slides.pdf",
+        "transcripts": ["transcript.txt"]
+    },
+    "audio_matches_transcript": false,
+    "mentors": [
+        {"name": "🔐 정보보안부 OOO 계장", "caption": "한 줄 소개", "bio": "- 경력 (마크다운)",
+         "profile_title": "프로필 카드 제목", "profile": "profile.pdf"}
+    ]
+}
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+from utils_static import cached_file_digest
+from utils_transcripts import SEGMENT_HEADER_RE
+
+RECORD_DIR = Path(__file__).parent / "lunch_talk_record"
+MANIFEST_NAME = "talk.json"
+
+# 자료 종류 (매니페스트 assets의 키)
+SINGLE_ASSET_ROLES = ("summary", "blog", "audio", "slides")
+LIST_ASSET_ROLES = ("transcripts",)
+
+AUDIO_EXTENSIONS = (".m4a", ".mp3", ".wav", ".ogg")
+# prepare_audio.py가 만드는 스트리밍용 파일 (원본 오디오로 취급하지 않음)
+AUDIO_STREAM_SUFFIX = ".stream.m4a"
+
+_lock = threading.Lock()
+_talks = {}  # 폴더 경로 -> (파일 목록 서명, 런치톡 정보)
+
+
+def _folder_signature(folder):
+    """폴더의 파일 목록 서명 ((이름, 수정 시간, 크기) 정렬 목록) - 바뀐 폴더만 다시 읽기 위해 사용"""
+    entries = []
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_file() and not entry.name.startswith("."):
+                stat = entry.stat()
+                entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _asset(folder, name):
+    """자료 정보: {"path", "name", "size", "mtime_ns", "digest"} (파일이 없으면 size 0, digest None)"""
+    path = folder / name
+    try:
+        stat = path.stat()
+    except OSError:
+        return {"path": path, "name": path.name, "size": 0, "mtime_ns": 0, "digest": None}
+    return {
+        "path": path,
+        "name": path.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "digest": cached_file_digest(path),
+    }
+
+
+def _is_transcript(path):
+    """녹취록 파일 여부 (첫 부분에 구간 헤더가 있는 텍스트)"""
+    try:
+        with path.open(encoding="utf-8") as f:
+            return SEGMENT_HEADER_RE.search(f.read(200)) is not None
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _infer_manifest(folder):
+    """매니페스트가 없는 폴더의 자료 종류를 파일 이름/확장자로 추정"""
+    files = sorted(p for p in folder.iterdir() if p.is_file() and not p.name.startswith("."))
+    texts = [p for p in files if p.suffix.lower() in (".txt", ".md")]
+    pdfs = [p for p in files if p.suffix.lower() == ".pdf"]
+    audios = [
+        p for p in files
+        if p.suffix.lower() in AUDIO_EXTENSIONS and not p.name.endswith(AUDIO_STREAM_SUFFIX)
+    ]
+
+    transcripts = [p.name for p in texts if _is_transcript(p)]
+    summary = next((p.name for p in texts if "summary" in p.name.lower() or "요약" in p.name), None)
+    blog = next((p.name for p in texts if "blog" in p.name.lower() or "블로그" in p.name), None)
+    profiles = [p for p in pdfs if "프로필" in p.name or "profile" in p.name.lower()]
+    slides = next((p.name for p in pdfs if p not in profiles), None)
+
+    return {
+        "title": folder.name,
+        "assets": {
+            "summary": summary,
+            "blog": blog,
+            "audio": audios[0].name if audios else None,
+            "slides": slides,
+            "transcripts": transcripts,
+        },
+        "mentors": [{"name": p.stem, "profile": p.name} for p in profiles],
+    }
+
+
+def _load_talk(folder):
+    """폴더 하나를 런치톡 정보로 변환"""
+    manifest_path = folder / MANIFEST_NAME
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    else:
+        manifest = _infer_manifest(folder)
+
+    declared = manifest.get("assets") or {}
+    assets = {role: _asset(folder, declared[role]) if declared.get(role) else None for role in SINGLE_ASSET_ROLES}
+    for role in LIST_ASSET_ROLES:
+        assets[role] = [_asset(folder, name) for name in declared.get(role) or []]
+
+    mentors = [
+        {
+            "name": mentor.get("name", ""),
+            "caption": mentor.get("caption", ""),
+            "bio": mentor.get("bio", ""),
+            "profile_title": mentor.get("profile_title") or mentor.get("name", ""),
+            "profile": _asset(folder, mentor["profile"]) if mentor.get("profile") else None,
+        }
+        for mentor in manifest.get("mentors") or []
+    ]
+
+    return {
+        "id": manifest.get("id") or folder.name,
+        "title": manifest.get("title") or folder.name,
+        "date": manifest.get("date", ""),
+        "intro": manifest.get("intro", ""),
+        "audio_matches_transcript": bool(manifest.get("audio_matches_transcript", False)),
+        "dir": folder,
+        "assets": assets,
+        "mentors": mentors,
+    }
+
+
+def _talk_folders(root):
+    """런치톡 폴더 후보: 매니페스트가 있는 기록 폴더 자체 + 하위 폴더"""
+    folders = [root] if (root / MANIFEST_NAME).exists() else []
+    folders.extend(
+        p for p in sorted(root.iterdir())
+        if p.is_dir() and not p.name.startswith((".", "_"))
+    )
+    return folders
+
+
+def list_talks(root=RECORD_DIR):
+    """
+    런치톡 목록 (최근 날짜 순)
+    - 파일 목록이 바뀐 폴더만 다시 읽고 나머지는 메모리의 결과를 그대로 사용
+    - 매니페스트를 읽지 못한 폴더는 건너뜀
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return []
+
+    talks = []
+    seen = set()
+    for folder in _talk_folders(root):
+        key = str(folder.resolve())
+        seen.add(key)
+        try:
+            signature = _folder_signature(folder)
+        except OSError:
+            continue
+        with _lock:
+            cached = _talks.get(key)
+        if cached and cached[0] == signature:
+            talk = cached[1]
+        else:
+            try:
+                talk = _load_talk(folder)
+            except (OSError, ValueError, KeyError, AttributeError):
+                continue
+            with _lock:
+                _talks[key] = (signature, talk)
+        if any(talk["assets"][role] for role in SINGLE_ASSET_ROLES + LIST_ASSET_ROLES) or talk["mentors"]:
+            talks.append(talk)
+
+    # 사라진 폴더는 캐시에서 제거
+    with _lock:
+        for key in [k for k in _talks if k not in seen and k.startswith(str(root.resolve()))]:
+            del _talks[key]
+
+    return sorted(talks, key=lambda talk: (talk["date"], talk["title"]), reverse=True)
+
+
+def get_talk(talk_id, root=RECORD_DIR):
+    """id로 런치톡 찾기 (없으면 None)"""
+    return next((talk for talk in list_talks(root) if talk["id"] == talk_id), None)
+
+
+def asset_path(talk, role):
+    """자료 경로 (매니페스트에 없는 자료면 None)"""
+    asset = talk["assets"].get(role)
+    return asset["path"] if asset else None
+
+
+def all_asset_paths(suffix, root=RECORD_DIR):
+    """모든 런치톡의 해당 확장자 자료 경로 (썸네일 미리 렌더링 등)"""
+    paths = []
+    for talk in list_talks(root):
+        assets = [talk["assets"][role] for role in SINGLE_ASSET_ROLES if talk["assets"][role]]
+        assets += [a for role in LIST_ASSET_ROLES for a in talk["assets"][role]]
+        assets += [m["profile"] for m in talk["mentors"] if m["profile"]]
+        paths.extend(a["path"] for a in assets if a["digest"] and a["path"].suffix.lower() == suffix)
+    return paths
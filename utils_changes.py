@@ -0,0 +1,217 @@
+"""
+질문 데이터 변경 피드 유틸리티
+- 프로세스 전역 데이터 버전 카운터
+- 버전별 변경(delta) 로그
+- 버전 기준으로 캐시되는 질문 스냅샷
+- 일정 시간마다 저장소를 다시 읽어 외부 변경(Google Sheets 직접 수정 등) 확인
+
+모든 세션이 같은 Python 프로세스를 공유하므로 모듈 전역 상태로 관리합니다.
+"""
+
+import threading
+import time
+from collections import deque
+
+# 변경 로그에 보관할 최대 버전 수 (이보다 오래된 세션은 전체 재로드)
+CHANGE_LOG_SIZE = 500
+
+# 이 시간(초)이 지나면 저장소를 다시 읽어 이 프로세스 밖에서 바뀐 내용이 있는지 확인
+SNAPSHOT_MAX_AGE_SECONDS = 60
+
+# 변경 종류
+CHANGE_UPSERT = "upsert"  # 질문 추가/수정 (좋아요 포함)
+CHANGE_DELETE = "delete"  # 질문 삭제
+CHANGE_RESET = "reset"    # 전체 재작성 (관리자 일괄 작업 등)
+
+_lock = threading.RLock()
+_version = 0
+_change_log = deque(maxlen=CHANGE_LOG_SIZE)
+_snapshot = {"version": -1, "questions": None}
+_row_versions = {}  # 질문 id -> 마지막으로 바뀐 버전
+_reset_version = 0  # 마지막 전체 재작성 버전
+_version_cache = {}  # 키 -> (버전, 값)
+_remote = {"checked_at": None, "fingerprint": None}  # 저장소를 마지막으로 읽은 시각 / 그때의 내용 서명
+
+
+def get_data_version():
+    """현재 데이터 버전"""
+    return _version
+
+
+def record_change(kind, rows=None, ids=None):
+    """
+    데이터 변경 기록 후 새 버전 반환
+    - upsert: rows에 변경된 질문 dict 목록
+    - delete: ids에 삭제된 질문 id 목록
+    - reset: 변경 범위를 알 수 없는 전체 재작성
+    """
+    global _version, _reset_version
+    with _lock:
+        _version += 1
+        entry = {
+            "version": _version,
+            "kind": kind,
+            "rows": [dict(r) for r in rows] if rows else [],
+            "ids": list(ids) if ids else [r.get("id") for r in rows or []],
+        }
+        _change_log.append(entry)
+        if kind == CHANGE_RESET:
+            _reset_version = _version
+            _row_versions.clear()
+        else:
+            for q_id in entry["ids"]:
+                _row_versions[q_id] = _version
+        _apply_to_snapshot(entry)
+        if _snapshot["questions"] is None:
+            # 스냅샷 없이 바뀐 내용은 서명으로 비교할 수 없음 → 다음 확인 때 바뀐 것으로 처리
+            _remote["fingerprint"] = None
+        return _version
+
+
+def get_changes_since(version):
+    """
+    주어진 버전 이후의 변경 목록 반환
+    - 로그에서 이미 밀려났거나 reset이 포함되어 있으면 None (전체 재로드 필요)
+    """
+    with _lock:
+        if version >= _version:
+            return []
+        if not _change_log or _change_log[0]["version"] > version + 1:
+            return None
+        changes = [c for c in _change_log if c["version"] > version]
+    if any(c["kind"] == CHANGE_RESET for c in changes):
+        return None
+    return changes
+
+
+def get_changed_ids_since(version):
+    """주어진 버전 이후 변경된 질문 id 집합 (None이면 전체 변경)"""
+    changes = get_changes_since(version)
+    if changes is None:
+        return None
+    changed = set()
+    for c in changes:
+        changed.update(c["ids"])
+    return changed
+
+
+def get_row_version(question_id):
+    """질문 한 건이 마지막으로 바뀐 버전 (카드 HTML 캐시 키로 사용)"""
+    return max(_row_versions.get(question_id, 0), _reset_version)
+
+
+def _apply_to_snapshot(entry):
+    """캐시된 스냅샷에 변경 사항을 바로 반영 (lock 안에서 호출)"""
+    questions = _snapshot["questions"]
+    if questions is None or _snapshot["version"] != entry["version"] - 1:
+        _snapshot["questions"] = None
+        return
+    if entry["kind"] == CHANGE_RESET:
+        _snapshot["questions"] = None
+        return
+
+    by_id = {q.get("id"): q for q in questions}
+    if entry["kind"] == CHANGE_DELETE:
+        for q_id in entry["ids"]:
+            by_id.pop(q_id, None)
+    else:
+        for row in entry["rows"]:
+            by_id[row.get("id")] = dict(row)
+    _snapshot["questions"] = sorted(by_id.values(), key=lambda q: q.get("id", 0))
+    _snapshot["version"] = entry["version"]
+
+
+def _fingerprint(questions):
+    """질문 목록 내용 서명 (외부 변경 여부 비교용)"""
+    return hash(tuple(sorted(
+        (q.get("id"), q.get("name"), q.get("question"), str(q.get("timestamp")), q.get("likes"))
+        for q in questions
+    )))
+
+
+def refresh_if_stale(loader, max_age=SNAPSHOT_MAX_AGE_SECONDS):
+    """
+    마지막으로 저장소를 읽은 지 max_age초가 지났으면 loader()로 다시 읽어 외부 변경 확인
+    - 내용이 바뀌었으면 reset으로 기록 → 스냅샷 / 버전별 캐시가 무효화되고 각 세션이 다시 그림
+    - 프로세스 전체에서 주기당 한 번만 읽음 (나머지 세션은 시각만 확인하고 반환)
+    - 다시 읽었으면 True
+    """
+    now = time.monotonic()
+    with _lock:
+        checked_at = _remote["checked_at"]
+        if checked_at is None:
+            # 처음에는 기준 시각만 기록 (첫 화면 로드에서 이미 저장소를 읽음)
+            _remote["checked_at"] = now
+            return False
+        if now - checked_at < max_age:
+            return False
+        _remote["checked_at"] = now
+        version = _version
+
+    questions = loader() or []
+    fingerprint = _fingerprint(questions)
+
+    with _lock:
+        if version != _version:
+            # 읽는 동안 이 프로세스에서 변경이 있었음 → 다음 확인 때 다시 읽음
+            _remote["checked_at"] = float("-inf")
+            return True
+        # 비교 기준: 이 프로세스의 변경까지 반영된 스냅샷, 없으면 마지막으로 읽은 내용
+        if _snapshot["questions"] is not None and _snapshot["version"] == _version:
+            baseline = _fingerprint(_snapshot["questions"])
+        else:
+            baseline = _remote["fingerprint"]
+        if fingerprint == baseline:
+            _remote["fingerprint"] = fingerprint
+            return True
+        new_version = record_change(CHANGE_RESET)
+        _remote["fingerprint"] = fingerprint
+        _snapshot["version"] = new_version
+        _snapshot["questions"] = [dict(q) for q in questions]
+    return True
+
+
+def get_questions_snapshot(loader):
+    """
+    버전 기준으로 캐시된 질문 목록 반환 (version, questions)
+    - 버전이 그대로면 저장소를 다시 읽지 않음 (SNAPSHOT_MAX_AGE_SECONDS마다 외부 변경만 확인)
+    - 캐시가 없거나 무효화되면 loader()로 전체 로드
+    """
+    refresh_if_stale(loader)
+    with _lock:
+        if _snapshot["questions"] is not None and _snapshot["version"] == _version:
+            return _version, [dict(q) for q in _snapshot["questions"]]
+        version = _version
+
+    questions = loader() or []
+
+    with _lock:
+        _remote["checked_at"] = time.monotonic()
+        _remote["fingerprint"] = _fingerprint(questions)
+        # 로드하는 동안 다른 세션이 변경했다면 캐시하지 않음
+        if version == _version:
+            _snapshot["version"] = version
+            _snapshot["questions"] = [dict(q) for q in questions]
+    return version, questions
+
+
+def invalidate_snapshot():
+    """스냅샷 캐시 무효화 (외부에서 데이터가 바뀐 경우)"""
+    with _lock:
+        _snapshot["questions"] = None
+
+
+def cached_by_version(key, builder):
+    """데이터 버전이 그대로면 이전에 만든 결과를 재사용 (내보내기 파일, 집계 등)"""
+    with _lock:
+        version = _version
+        cached = _version_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    value = builder()
+
+    with _lock:
+        if version == _version:
+            _version_cache[key] = (version, value)
+    return value
@@ -0,0 +1,604 @@
+"""
+SQLite 공통 유틸리티
+- questions 테이블 스키마
+- 집계 카운터(총 질문 수, 총 좋아요, 일별 조회수) 테이블
+- 삭제된 질문을 보관하는 휴지통 테이블 (복원 / 보관 기간이 지나면 백그라운드 정리)
+- 질문 id는 한 번 쓰면 삭제되어도 다시 주지 않음 (최대 id 기록을 counters에 보관)
+
+카운터는 데이터를 바꾸는 쓰기 작업과 같은 트랜잭션에서 갱신하고,
+읽기는 프로세스 메모리에서 바로 처리합니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 데이터베이스 파일 경로 (각 페이지의 DB_FILE과 동일)
+DB_FILE = Path(__file__).parent / "questions.db"
+
+# questions 테이블 컬럼 순서
+QUESTION_COLUMNS = ['id', 'name', 'question', 'timestamp', 'likes']
+
+# 작성 시간 형식 ("%Y-%m-%d %H:%M:%S")이 맞는 행만 날짜 조건에 포함
+TIMESTAMP_GLOB = '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9]'
+
+# 카운터 이름
+COUNTER_TOTAL_QUESTIONS = "total_questions"
+COUNTER_TOTAL_LIKES = "total_likes"
+COUNTER_QUESTION_ID_HIGH_WATER = "question_id_high_water"  # 지금까지 쓴 가장 큰 질문 id
+VISITS_COUNTER_PREFIX = "visits:"
+
+# 휴지통 보관 기간 / 정리 주기
+TRASH_RETENTION_DAYS = 7
+TRASH_PURGE_INTERVAL_SECONDS = 3600
+
+_counters_lock = threading.Lock()
+_counters = None  # 메모리 캐시 (None이면 다음 조회 때 DB에서 로드)
+
+_purger_lock = threading.Lock()
+_purger_thread = None
+
+
+def connect():
+    """SQLite 연결 생성 (동시 접속 시 잠금 대기)"""
+    return sqlite3.connect(DB_FILE, timeout=10)
+
+
+def init_db():
+    """SQLite 데이터베이스 초기화"""
+    conn = connect()
+    cursor = conn.cursor()
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            question TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            likes INTEGER DEFAULT 0
+        )
+    ''')
+    # 일괄 삭제 조건(좋아요/작성 시간)용 인덱스
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_questions_likes ON questions(likes)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_questions_timestamp ON questions(timestamp)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    # 휴지통 - 삭제된 질문은 여기로 옮겨져 questions 테이블(조회 대상)에는 남지 않음
+    # (trash_id가 기본 키, 원래 질문 id는 일반 컬럼 → 같은 id가 여러 번 들어와도 덮어쓰지 않음)
+    trash_columns = [row[1] for row in cursor.execute('PRAGMA table_info(question_trash)')]
+    if trash_columns and 'trash_id' not in trash_columns:
+        # 예전 스키마(id가 기본 키)에서 옮김
+        cursor.execute('ALTER TABLE question_trash RENAME TO question_trash_old')
+        cursor.execute('DROP INDEX IF EXISTS idx_question_trash_deleted_at')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS question_trash (
+            trash_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            question TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            likes INTEGER DEFAULT 0,
+            deleted_at TEXT NOT NULL
+        )
+    ''')
+    if trash_columns and 'trash_id' not in trash_columns:
+        cursor.execute('''
+            INSERT INTO question_trash (id, name, question, timestamp, likes, deleted_at)
+            SELECT id, name, question, timestamp, likes, deleted_at FROM question_trash_old ORDER BY deleted_at, id
+        ''')
+        cursor.execute('DROP TABLE question_trash_old')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_question_trash_deleted_at ON question_trash(deleted_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_question_trash_id ON question_trash(id)')
+    conn.commit()
+    conn.close()
+
+
+def visits_counter_name(date=None):
+    """일별 조회수 카운터 이름"""
+    if date is None:
+        date = datetime.now().strftime("%Y-%m-%d")
+    return f"{VISITS_COUNTER_PREFIX}{date}"
+
+
+def refresh_question_counters(cursor):
+    """질문 수/좋아요 합계 카운터와 최대 id 기록 갱신 (호출한 쪽의 트랜잭션 안에서 실행)"""
+    cursor.execute('''
+        INSERT OR REPLACE INTO counters (name, value)
+        SELECT ?, COUNT(*) FROM questions
+    ''', (COUNTER_TOTAL_QUESTIONS,))
+    cursor.execute('''
+        INSERT OR REPLACE INTO counters (name, value)
+        SELECT ?, COALESCE(SUM(likes), 0) FROM questions
+    ''', (COUNTER_TOTAL_LIKES,))
+    cursor.execute('''
+        INSERT OR REPLACE INTO counters (name, value)
+        SELECT ?, MAX(
+            COALESCE((SELECT value FROM counters WHERE name = ?), 0),
+            COALESCE((SELECT MAX(id) FROM questions), 0)
+        )
+    ''', (COUNTER_QUESTION_ID_HIGH_WATER, COUNTER_QUESTION_ID_HIGH_WATER))
+
+
+def _question_id_high_water(cursor):
+    """지금까지 쓴 가장 큰 질문 id (기록 / 현재 질문 / 휴지통 중 최댓값)"""
+    return cursor.execute('''
+        SELECT MAX(
+            COALESCE((SELECT value FROM counters WHERE name = ?), 0),
+            COALESCE((SELECT MAX(id) FROM questions), 0),
+            COALESCE((SELECT MAX(id) FROM question_trash), 0)
+        )
+    ''', (COUNTER_QUESTION_ID_HIGH_WATER,)).fetchone()[0]
+
+
+def _reserve_question_ids(cursor, count, at_least):
+    """새 질문 id를 count개 예약하고 첫 id 반환 (호출한 쪽의 트랜잭션 안에서 실행)"""
+    first = max(_question_id_high_water(cursor) + 1, int(at_least))
+    cursor.execute(
+        'INSERT OR REPLACE INTO counters (name, value) VALUES (?, ?)',
+        (COUNTER_QUESTION_ID_HIGH_WATER, first + count - 1)
+    )
+    return first
+
+
+def assign_question_ids(cursor, rows):
+    """
+    가져온 질문들의 id 확정 (호출한 쪽의 BEGIN IMMEDIATE 트랜잭션 안에서 실행)
+    - 적힌 id가 지금까지 쓴 최대 id보다 크고 서로 겹치지 않으면 그대로 사용
+    - 나머지는 새 id를 예약해서 부여
+    """
+    high_water = _question_id_high_water(cursor)
+    kept = set()
+    pending = []
+    for row in rows:
+        if row.get("id") is not None and row["id"] > high_water and row["id"] not in kept:
+            kept.add(row["id"])
+        else:
+            pending.append(row)
+    next_id = _reserve_question_ids(cursor, len(pending), max(kept, default=high_water) + 1)
+    for row in pending:
+        row["id"] = next_id
+        next_id += 1
+    return rows
+
+
+def get_question_id_high_water():
+    """지금까지 쓴 가장 큰 질문 id (SQLite를 쓸 수 없으면 0)"""
+    try:
+        init_db()
+        conn = connect()
+        try:
+            return _question_id_high_water(conn.cursor())
+        finally:
+            conn.close()
+    except Exception:
+        return 0
+
+
+def reserve_question_ids(count=1, at_least=1):
+    """
+    새 질문 id를 count개 예약하고 첫 id 반환
+    - 삭제된 질문의 id도 다시 주지 않음 (좋아요 기록 / 카드 캐시가 id 기준이라)
+    - at_least: 이 값보다 작은 id는 주지 않음 (Google Sheets에서 읽은 최대 id + 1 등)
+    - SQLite를 쓸 수 없으면 at_least 그대로 반환
+    """
+    try:
+        init_db()
+        conn = connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            first = _reserve_question_ids(cursor, count, at_least)
+            conn.commit()
+        finally:
+            conn.close()
+    except Exception:
+        return int(at_least)
+    invalidate_counters()
+    return first
+
+
+def invalidate_counters():
+    """메모리 카운터 캐시 무효화 (쓰기 트랜잭션 커밋 후 호출)"""
+    global _counters
+    with _counters_lock:
+        _counters = None
+
+
+def get_counters():
+    """카운터 전체 조회 (메모리 캐시, 변경 후 첫 조회에만 DB 읽기)"""
+    global _counters
+    with _counters_lock:
+        if _counters is not None:
+            return dict(_counters)
+        try:
+            init_db()
+            conn = connect()
+            cursor = conn.cursor()
+            cursor.execute('SELECT name, value FROM counters')
+            counters = dict(cursor.fetchall())
+            # 카운터 도입 전 DB라면 한 번만 집계해서 채워 둠
+            if COUNTER_TOTAL_QUESTIONS not in counters:
+                refresh_question_counters(cursor)
+                conn.commit()
+                cursor.execute('SELECT name, value FROM counters')
+                counters = dict(cursor.fetchall())
+            conn.close()
+        except Exception:
+            return {}
+        _counters = counters
+        return dict(_counters)
+
+
+def get_counter(name, default=0):
+    """카운터 하나 조회"""
+    return get_counters().get(name, default)
+
+
+def set_counter(name, value):
+    """카운터 값 설정 (DB와 메모리 캐시를 함께 갱신)"""
+    try:
+        init_db()
+        conn = connect()
+        conn.execute('INSERT OR REPLACE INTO counters (name, value) VALUES (?, ?)', (name, int(value)))
+        conn.commit()
+        conn.close()
+    except Exception:
+        invalidate_counters()
+        return
+    with _counters_lock:
+        if _counters is not None:
+            _counters[name] = int(value)
+
+
+def increment_question_likes(question_id):
+    """
+    좋아요 1 증가 (UPDATE 한 번 + 카운터 갱신을 한 트랜잭션으로 처리)
+    - 갱신된 질문 dict 반환, 질문이 없거나 SQLite를 쓸 수 없으면 None
+    """
+    try:
+        conn = connect()
+        cursor = conn.cursor()
+        cursor.execute('UPDATE questions SET likes = likes + 1 WHERE id = ?', (question_id,))
+        if cursor.rowcount == 0:
+            conn.rollback()
+            conn.close()
+            return None
+        cursor.execute('UPDATE counters SET value = value + 1 WHERE name = ?', (COUNTER_TOTAL_LIKES,))
+        cursor.execute('SELECT id, name, question, timestamp, likes FROM questions WHERE id = ?', (question_id,))
+        row = cursor.fetchone()
+        conn.commit()
+        conn.close()
+    except Exception:
+        return None
+
+    with _counters_lock:
+        if _counters is not None and COUNTER_TOTAL_LIKES in _counters:
+            _counters[COUNTER_TOTAL_LIKES] += 1
+    return {'id': row[0], 'name': row[1], 'question': row[2], 'timestamp': row[3], 'likes': row[4]}
+
+
+def iter_question_rows(chunk_size=1000):
+    """questions 테이블을 id 순으로 chunk 단위로 읽는 제너레이터 (id, name, question, timestamp, likes)"""
+    conn = connect()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('SELECT id, name, question, timestamp, likes FROM questions ORDER BY id')
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        conn.close()
+
+
+def count_questions():
+    """저장된 질문 수 (SQLite를 쓸 수 없으면 None)"""
+    try:
+        conn = connect()
+        count = conn.execute('SELECT COUNT(*) FROM questions').fetchone()[0]
+        conn.close()
+        return count
+    except Exception:
+        return None
+
+
+def _question_filter(search=None, min_likes=None):
+    """검색어/좋아요 조건을 WHERE 절과 파라미터로 변환"""
+    clauses = []
+    params = []
+    if search:
+        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        clauses.append("question LIKE ? ESCAPE '\\'")
+        params.append(f"%{escaped}%")
+    if min_likes:
+        clauses.append("likes >= ?")
+        params.append(int(min_likes))
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def count_filtered_questions(search=None, min_likes=None):
+    """조건에 맞는 질문 수"""
+    where, params = _question_filter(search, min_likes)
+    conn = connect()
+    try:
+        return conn.execute(f'SELECT COUNT(*) FROM questions {where}', params).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def fetch_questions_page(search=None, min_likes=None, limit=20, offset=0):
+    """조건에 맞는 질문 중 한 페이지만 조회 (id 순)"""
+    where, params = _question_filter(search, min_likes)
+    conn = connect()
+    try:
+        cursor = conn.execute(
+            f'SELECT id, name, question, timestamp, likes FROM questions {where} ORDER BY id LIMIT ? OFFSET ?',
+            params + [int(limit), int(offset)]
+        )
+        return [dict(zip(QUESTION_COLUMNS, row)) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+def _move_to_trash(cursor, where, params):
+    """조건에 맞는 질문을 휴지통으로 옮김 (호출한 쪽의 트랜잭션 안에서 실행)"""
+    cursor.execute(f'''
+        INSERT INTO question_trash (id, name, question, timestamp, likes, deleted_at)
+        SELECT id, name, question, timestamp, likes, ? FROM questions {where}
+    ''', [datetime.now().strftime("%Y-%m-%d %H:%M:%S")] + list(params))
+    cursor.execute(f'DELETE FROM questions {where}', params)
+    return cursor.rowcount
+
+
+def delete_questions_by_ids(ids):
+    """여러 질문을 한 트랜잭션에서 휴지통으로 옮김 (카운터 포함), 삭제된 개수 반환"""
+    ids = [int(i) for i in ids]
+    if not ids:
+        return 0
+    init_db()
+    conn = connect()
+    try:
+        cursor = conn.cursor()
+        deleted = _move_to_trash(
+            cursor, 'WHERE id IN (SELECT value FROM json_each(?))', [json.dumps(ids)]
+        )
+        refresh_question_counters(cursor)
+        conn.commit()
+    finally:
+        conn.close()
+    invalidate_counters()
+    return deleted
+
+
+def update_questions(rows):
+    """수정된 질문들(name, question, likes)을 한 트랜잭션에서 반영"""
+    if not rows:
+        return 0
+    conn = connect()
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(
+            'UPDATE questions SET name = ?, question = ?, likes = ? WHERE id = ?',
+            [(r['name'], r['question'], int(r['likes']), int(r['id'])) for r in rows]
+        )
+        refresh_question_counters(cursor)
+        conn.commit()
+    finally:
+        conn.close()
+    invalidate_counters()
+    return len(rows)
+
+
+def predicate_to_sql(predicate):
+    """
+    일괄 삭제 조건(dict)을 WHERE 절과 파라미터로 변환
+    - {"max_likes": n}: 좋아요 n개 이하
+    - {"older_than_days": n}: n일 이전 작성
+    - {"all": True}: 전체
+    """
+    clauses = []
+    params = []
+    if predicate.get("max_likes") is not None:
+        clauses.append("likes <= ?")
+        params.append(int(predicate["max_likes"]))
+    if predicate.get("older_than_days") is not None:
+        cutoff = datetime.now() - timedelta(days=int(predicate["older_than_days"]))
+        clauses.append("timestamp < ? AND timestamp GLOB ?")
+        params.extend([cutoff.strftime("%Y-%m-%d %H:%M:%S"), TIMESTAMP_GLOB])
+    if not clauses and not predicate.get("all"):
+        raise ValueError("삭제 조건이 비어 있습니다")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def count_matching_questions(predicate):
+    """조건에 맞는 질문 수 미리보기 (인덱스를 타는 COUNT)"""
+    where, params = predicate_to_sql(predicate)
+    conn = connect()
+    try:
+        return conn.execute(f'SELECT COUNT(*) FROM questions {where}', params).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def delete_matching_questions(predicate):
+    """조건에 맞는 질문을 한 트랜잭션에서 휴지통으로 옮김, 삭제된 id 목록 반환"""
+    where, params = predicate_to_sql(predicate)
+    init_db()
+    conn = connect()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute(f'SELECT id FROM questions {where}', params)
+        ids = [row[0] for row in cursor.fetchall()]
+        _move_to_trash(cursor, where, params)
+        refresh_question_counters(cursor)
+        conn.commit()
+    finally:
+        conn.close()
+    invalidate_counters()
+    return ids
+
+
+def count_trash():
+    """휴지통에 있는 질문 수"""
+    try:
+        init_db()
+        conn = connect()
+        count = conn.execute('SELECT COUNT(*) FROM question_trash').fetchone()[0]
+        conn.close()
+        return count
+    except Exception:
+        return 0
+
+
+def fetch_trash_page(limit=20, offset=0):
+    """휴지통 목록 한 페이지 조회 (최근 삭제 순, 각 항목은 trash_id로 구분)"""
+    init_db()
+    conn = connect()
+    try:
+        cursor = conn.execute(
+            '''SELECT trash_id, id, name, question, timestamp, likes, deleted_at FROM question_trash
+               ORDER BY deleted_at DESC, trash_id DESC LIMIT ? OFFSET ?''',
+            (int(limit), int(offset))
+        )
+        return [dict(zip(['trash_id'] + QUESTION_COLUMNS + ['deleted_at'], row)) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+def restore_questions(trash_ids):
+    """
+    휴지통의 질문(trash_id 목록)을 questions 테이블로 복원 (한 트랜잭션)
+    - 원래 id가 이미 쓰이고 있으면(같은 id가 휴지통에 여러 번 있던 경우 등) 새 id를 받아 복원
+    - 복원된 질문 dict 목록 반환
+    """
+    trash_ids = [int(i) for i in trash_ids]
+    if not trash_ids:
+        return []
+    init_db()
+    conn = connect()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute(
+            '''SELECT id, name, question, timestamp, likes FROM question_trash
+               WHERE trash_id IN (SELECT value FROM json_each(?)) ORDER BY trash_id''',
+            (json.dumps(trash_ids),)
+        )
+        restored = []
+        for row in cursor.fetchall():
+            q = dict(zip(QUESTION_COLUMNS, row))
+            taken = cursor.execute('SELECT 1 FROM questions WHERE id = ?', (q['id'],)).fetchone()
+            if taken:
+                q['id'] = _reserve_question_ids(cursor, 1, 1)
+            cursor.execute(
+                'INSERT INTO questions (id, name, question, timestamp, likes) VALUES (?, ?, ?, ?, ?)',
+                (q['id'], q['name'], q['question'], q['timestamp'], q['likes'])
+            )
+            restored.append(q)
+        cursor.execute(
+            'DELETE FROM question_trash WHERE trash_id IN (SELECT value FROM json_each(?))',
+            (json.dumps(trash_ids),)
+        )
+        refresh_question_counters(cursor)
+        conn.commit()
+    finally:
+        conn.close()
+    invalidate_counters()
+    return restored
+
+
+def purge_trash(trash_ids=None, older_than_days=None):
+    """
+    휴지통 비우기 (영구 삭제), 삭제된 개수 반환
+    - trash_ids: 지정한 항목만 / older_than_days: 보관 기간이 지난 질문만 / 둘 다 없으면 전체
+    """
+    if trash_ids is not None:
+        where, params = 'WHERE trash_id IN (SELECT value FROM json_each(?))', [json.dumps([int(i) for i in trash_ids])]
+    elif older_than_days is not None:
+        cutoff = datetime.now() - timedelta(days=int(older_than_days))
+        where, params = 'WHERE deleted_at < ?', [cutoff.strftime("%Y-%m-%d %H:%M:%S")]
+    else:
+        where, params = '', []
+    init_db()
+    conn = connect()
+    try:
+        cursor = conn.execute(f'DELETE FROM question_trash {where}', params)
+        purged = cursor.rowcount
+        conn.commit()
+    finally:
+        conn.close()
+    return purged
+
+
+def _purge_loop():
+    """보관 기간이 지난 휴지통 항목을 주기적으로 정리"""
+    while True:
+        try:
+            purge_trash(older_than_days=TRASH_RETENTION_DAYS)
+        except Exception:
+            pass
+        time.sleep(TRASH_PURGE_INTERVAL_SECONDS)
+
+
+def start_trash_purger():
+    """휴지통 정리 스레드 시작 (프로세스당 한 번만)"""
+    global _purger_thread
+    with _purger_lock:
+        if _purger_thread is not None and _purger_thread.is_alive():
+            return
+        _purger_thread = threading.Thread(target=_purge_loop, name="trash-purger", daemon=True)
+        _purger_thread.start()
+
+
+def get_question_metrics():
+    """질문 요약 지표 (총 질문 수, 총 좋아요, 익명 질문 수)를 한 번의 집계 쿼리로 조회"""
+    conn = connect()
+    try:
+        total, likes, anonymous = conn.execute('''
+            SELECT COUNT(*), COALESCE(SUM(likes), 0), COALESCE(SUM(name = '익명'), 0)
+            FROM questions
+        ''').fetchone()
+    finally:
+        conn.close()
+    return {"total": total, "likes": likes, "anonymous": anonymous}
+
+
+def get_author_stats():
+    """작성자별 질문 수 / 좋아요 합계 / 평균 (질문 수 많은 순)"""
+    conn = connect()
+    try:
+        cursor = conn.execute('''
+            SELECT name, COUNT(*) AS cnt, COALESCE(SUM(likes), 0), ROUND(AVG(likes), 1)
+            FROM questions
+            GROUP BY name
+            ORDER BY cnt DESC, name
+        ''')
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
+
+def get_hourly_question_counts():
+    """작성 시간대(시)별 질문 수 - 형식이 맞는 작성 시간만 집계"""
+    conn = connect()
+    try:
+        cursor = conn.execute('''
+            SELECT CAST(substr(timestamp, 12, 2) AS INTEGER) AS hour, COUNT(*)
+            FROM questions
+            WHERE timestamp GLOB ?
+            GROUP BY hour
+            ORDER BY hour
+        ''', (TIMESTAMP_GLOB,))
+        return cursor.fetchall()
+    finally:
+        conn.close()
@@ -0,0 +1,179 @@
+"""
+런치톡 기록 문서 파싱 / 캐시 유틸리티
+- summary: 섹션(제목 + Q/A 목록)으로 구조화, [MM:SS] 시간 표기는 Q/A별 시작 시간으로 보관
+- blog: 제목 + 본문 마크다운으로 변환
+- 파싱 결과는 (경로, 수정 시간, 크기, 내용 해시) 기준으로 프로세스 메모리에 보관
+  → 파일이 바뀌기 전까지 재실행마다 다시 읽거나 정규식을 돌리지 않음
+"""
+
+import hashlib
+import re
+import threading
+from pathlib import Path
+
+# 미리 컴파일한 정규식
+BR_TAG_RE = re.compile(r"<br\s*/?>")
+BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+SECTION_SPLIT_RE = re.compile(r"^## ", flags=re.MULTILINE)
+NUMBERED_HEADING_RE = re.compile(r"^\d(\. |\.\))")
+# 시간 표기: [09:44], [1:02:15]
+TIMESTAMP_MARKER_RE = re.compile(r"\[(?:(\d{1,2}):)?(\d{1,2}):(\d{2})\]")
+
+_lock = threading.Lock()
+_cache = {}  # (경로, 파서 이름) -> (수정 시간, 크기, 내용 해시, 파싱 결과)
+
+
+def extract_timestamps(text):
+    """
+    텍스트에서 [MM:SS] / [H:MM:SS] 시간 표기를 떼어냄
+    - 반환: (시간 표기를 지운 텍스트, [초, ...])
+    """
+    seconds = [
+        int(hours or 0) * 3600 + int(minutes) * 60 + int(secs)
+        for hours, minutes, secs in TIMESTAMP_MARKER_RE.findall(text)
+    ]
+    if not seconds:
+        return text, []
+    return TIMESTAMP_MARKER_RE.sub("", text).strip(), seconds
+
+
+def _normalize_qa_line(line):
+    """Q/A 판별용으로 앞뒤 공백과 굵게 표시(*) 제거"""
+    return line.strip().strip("*").strip()
+
+
+def parse_qa_blocks(body):
+    """
+    섹션 본문에서 Q/A 쌍 추출
+    - 반환: [(질문, [답변 줄, ...], 시작 시간(초) 또는 None), ...]
+    - 시작 시간은 질문/답변에서 처음 나온 시간 표기 (표기는 본문에서 지움)
+    """
+    lines = body.splitlines()
+    normalized = [_normalize_qa_line(line) for line in lines]
+    qa_blocks = []
+
+    i = 0
+    n = len(lines)
+    while i < n:
+        if not normalized[i].startswith("Q."):
+            i += 1
+            continue
+        q_text = normalized[i][2:].strip()
+        i += 1
+
+        # 공백 라인은 스킵
+        while i < n and not lines[i].strip():
+            i += 1
+
+        answer_parts = []
+        if i < n and normalized[i].startswith("A."):
+            first = normalized[i][2:].strip()
+            if first:
+                answer_parts.append(first)
+            i += 1
+
+        while i < n and not normalized[i].startswith("Q."):
+            answer_parts.append(lines[i])
+            i += 1
+
+        answer_lines = [ln.strip() for ln in "\n".join(answer_parts).strip().splitlines() if ln.strip()]
+        q_text, timestamps = extract_timestamps(q_text)
+        for index, answer_line in enumerate(answer_lines):
+            answer_lines[index], found = extract_timestamps(answer_line)
+            timestamps.extend(found)
+        qa_blocks.append((q_text, answer_lines, timestamps[0] if timestamps else None))
+    return qa_blocks
+
+
+def parse_summary(raw):
+    """
+    summary 텍스트 구조화
+    - 반환: {"preface": 첫 블록, "sections": [{"heading", "body", "qa"}], "timeline": [...]}
+    - timeline: 시간 표기가 있는 Q/A의 시간순 목록 [{"seconds", "question", "section"}, ...]
+    - HTML 줄바꿈 태그와 마크다운 굵게 표시는 제거
+    """
+    clean = BR_TAG_RE.sub("", raw)
+    clean = BOLD_RE.sub(r"\1", clean)
+    blocks = SECTION_SPLIT_RE.split(clean)
+
+    sections = []
+    for block in blocks[1:]:
+        lines = block.strip().splitlines()
+        if not lines:
+            continue
+        heading = lines[0].strip()
+        body = "\n".join(lines[1:]).strip()
+        if not body:
+            continue
+        sections.append({"heading": heading, "body": body, "qa": parse_qa_blocks(body)})
+
+    timeline = sorted(
+        (
+            {"seconds": seconds, "question": q_text, "section": section["heading"]}
+            for section in sections
+            for q_text, _, seconds in section["qa"]
+            if seconds is not None
+        ),
+        key=lambda entry: entry["seconds"],
+    )
+    return {"preface": blocks[0].strip(), "sections": sections, "timeline": timeline}
+
+
+def parse_blog(raw):
+    """
+    일반 텍스트 블로그 글을 제목 + 본문 마크다운으로 변환
+    - 첫 번째 비어있지 않은 줄: 제목
+    - 긴 구분선(----)은 마크다운 수평선으로
+    - '1. [Takeaway ...]' 같은 줄은 섹션 제목으로
+    """
+    lines = raw.splitlines()
+    title_idx = next((i for i, line in enumerate(lines) if line.strip()), None)
+    title = lines[title_idx].strip() if title_idx is not None else ""
+
+    body_parts = []
+    for i, line in enumerate(lines):
+        if i == title_idx:
+            continue
+        stripped = line.strip()
+        if len(stripped) >= 4 and set(stripped) == {"-"}:
+            body_parts.append("---")
+        elif NUMBERED_HEADING_RE.match(stripped):
+            body_parts.append(f"### {stripped}")
+        else:
+            body_parts.append(line)
+    return {"title": title, "body_md": "\n".join(body_parts).strip()}
+
+
+def load_document(path, parser):
+    """
+    파일을 읽어 parser로 변환한 결과 반환 (캐시)
+    - 수정 시간/크기가 그대로면 파일을 읽지 않음
+    - 수정 시간만 바뀌고 내용이 같으면 다시 파싱하지 않음
+    - 파일이 없거나 비어 있으면 None
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = (str(path.resolve()), parser.__name__)
+    with _lock:
+        cached = _cache.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[3]
+
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha256(data).hexdigest()
+    if cached and cached[2] == digest:
+        model = cached[3]
+    else:
+        text = data.decode("utf-8", errors="replace")
+        model = parser(text) if text.strip() else None
+
+    with _lock:
+        _cache[key] = (stat.st_mtime_ns, stat.st_size, digest, model)
+    return model
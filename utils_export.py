@@ -0,0 +1,100 @@
+"""
+데이터 내보내기 유틸리티
+- 다운로드를 요청했을 때만 파일 생성
+- 생성한 파일은 데이터 버전별로 캐시 (데이터가 그대로면 재생성하지 않음)
+- CSV / Excel / Parquet / JSONL 지원
+- 모든 형식을 SQLite에서 읽음 (다운로드가 저장소 쓰기를 일으키지 않도록)
+- Excel은 write-only 모드로 행을 chunk 단위로 흘려 써서 메모리 사용량을 일정하게 유지
+"""
+
+import json
+import tempfile
+from io import BytesIO
+
+import pandas as pd
+
+from utils_changes import cached_by_version
+from utils_db import count_questions, iter_question_rows
+
+EXPORT_COLUMNS = ['id', 'name', 'question', 'timestamp', 'likes']
+
+# 이 크기를 넘으면 임시 파일을 디스크로 넘김
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# 형식별 표시 이름 / MIME / 확장자
+EXPORT_FORMATS = {
+    "csv": {"label": "📄 CSV", "mime": "text/csv", "ext": "csv"},
+    "xlsx": {
+        "label": "📊 Excel",
+        "mime": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "ext": "xlsx",
+    },
+    "parquet": {"label": "🧱 Parquet", "mime": "application/vnd.apache.parquet", "ext": "parquet"},
+    "jsonl": {"label": "🧾 JSONL", "mime": "application/jsonl", "ext": "jsonl"},
+}
+
+
+def _to_dataframe(rows):
+    """(id, name, question, timestamp, likes) 행을 내보내기용 DataFrame으로 변환"""
+    return pd.DataFrame.from_records(rows, columns=EXPORT_COLUMNS)
+
+
+def write_xlsx_stream(sheets):
+    """
+    write-only 워크북으로 Excel bytes 생성
+    - sheets: [(시트 이름, 헤더 목록, 행 iterable)]
+    - 행은 한 줄씩 기록되므로 전체 데이터를 메모리에 올리지 않음
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for sheet_name, header, rows in sheets:
+        worksheet = workbook.create_sheet(title=sheet_name)
+        worksheet.append(header)
+        for row in rows:
+            worksheet.append(list(row))
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as output:
+        workbook.save(output)
+        output.seek(0)
+        return output.read()
+
+
+def build_export(fmt, rows):
+    """형식에 맞는 파일 bytes 생성 (rows: (id, name, question, timestamp, likes) 행 iterable)"""
+    if fmt == "csv":
+        return _to_dataframe(rows).to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig')
+    if fmt == "xlsx":
+        return write_xlsx_stream([('질문목록', EXPORT_COLUMNS, rows)])
+    if fmt == "parquet":
+        # pyarrow 또는 fastparquet 필요 (없으면 ImportError)
+        output = BytesIO()
+        _to_dataframe(rows).to_parquet(output, index=False)
+        return output.getvalue()
+    if fmt == "jsonl":
+        lines = (json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) for row in rows)
+        return ("\n".join(lines) + "\n").encode('utf-8')
+    raise ValueError(f"지원하지 않는 내보내기 형식: {fmt}")
+
+
+def get_export(fmt):
+    """
+    내보내기 파일 bytes 반환 (데이터 버전별 캐시)
+    - 모든 형식이 SQLite 커서에서 바로 읽음 (Google Sheets를 읽거나 SQLite를 다시 쓰지 않음)
+    - 내보낼 질문이 없으면 None
+    """
+    def builder():
+        if not count_questions():
+            return None
+        return build_export(fmt, iter_question_rows())
+
+    return cached_by_version(("export", fmt), builder)
+
+
+def export_visits_xlsx(stats):
+    """방문 기록을 Excel bytes로 내보내기 (write-only 스트리밍)"""
+    if not stats:
+        return None
+    columns = ['session_id', 'date', 'first_visit', 'last_visit', 'visit_count']
+    rows = ([s.get(col) for col in columns] for s in stats)
+    return write_xlsx_stream([('방문기록', columns, rows)])
@@ -0,0 +1,180 @@
+"""
+저장소 상태 점검 유틸리티
+- Google Sheets(Service Account / CSV export), SQLite, JSON 백업 경로를 백그라운드에서 주기적으로 점검
+- 점검마다 제한 시간을 두어 네트워크가 멈춰도 기다리지 않음
+- 이전 점검이 아직 끝나지 않은 대상은 새로 실행하지 않음 (멈춘 점검이 작업 스레드를 계속 차지하지 않도록)
+- Google Sheets는 첫 행만 읽음 (시트 크기만큼 할당량을 쓰지 않도록)
+- 저장소별 최근 N회 응답 시간과 오류 상태를 보관 (관리자 페이지는 캐시된 결과만 표시)
+"""
+
+import os
+import threading
+import time
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
+
+from utils_db import connect
+
+# 점검 주기 / 점검 하나당 제한 시간 / 보관할 기록 수
+HEALTH_CHECK_INTERVAL_SECONDS = 60
+HEALTH_CHECK_TIMEOUT_SECONDS = 5
+HEALTH_HISTORY_SIZE = 30
+
+# CSV export 점검 때 읽을 최대 크기 (시트 전체를 받지 않음)
+CSV_PROBE_BYTES = 1024
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+_lock = threading.Lock()
+_probes = {}    # 이름 -> 점검 함수 (성공 시 설명 문자열 반환, 실패 시 예외)
+_results = {}   # 이름 -> 최근 결과
+_inflight = {}  # 이름 -> 아직 끝나지 않았을 수 있는 점검 future
+_monitor_thread = None
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+
+
+def probe_sqlite():
+    """SQLite 읽기 점검"""
+    conn = connect()
+    try:
+        conn.execute('SELECT 1 FROM questions LIMIT 1').fetchall()
+    finally:
+        conn.close()
+    return "읽기 가능"
+
+
+def make_json_probe(path):
+    """JSON 백업 파일 점검 함수 생성 (파일이 있으면 크기, 없으면 폴더 쓰기 권한 확인)"""
+    def probe():
+        if os.path.exists(path):
+            return f"{os.path.getsize(path):,} bytes"
+        folder = os.path.dirname(os.path.abspath(path))
+        if not os.access(folder, os.W_OK):
+            raise PermissionError(f"쓰기 권한 없음: {folder}")
+        return "파일 없음 (생성 가능)"
+    return probe
+
+
+def make_csv_export_probe(csv_export_url):
+    """공개 시트 CSV export URL 점검 함수 생성 (앞부분만 읽음)"""
+    def probe():
+        with urllib.request.urlopen(csv_export_url, timeout=HEALTH_CHECK_TIMEOUT_SECONDS) as response:
+            data = response.read(CSV_PROBE_BYTES)
+        return f"HTTP {response.status}, {len(data)} bytes 수신"
+    return probe
+
+
+def make_sheets_probe(read_first_row):
+    """Service Account 시트 읽기 점검 함수 생성 (read_first_row: 시트의 첫 행만 DataFrame으로 읽는 함수)"""
+    def probe():
+        df = read_first_row()
+        columns = 0 if df is None else len(df.columns)
+        return f"첫 행 읽기 가능 ({columns}개 열)"
+    return probe
+
+
+def configure_health_checks(probes):
+    """점검 대상 설정 (이름 -> 점검 함수), 빠진 대상의 기록은 정리"""
+    with _lock:
+        _probes.clear()
+        _probes.update(probes)
+        for name in list(_results):
+            if name not in _probes:
+                del _results[name]
+
+
+def _record(name, status, latency_ms, detail):
+    """점검 결과 기록 (lock 안에서 호출)"""
+    result = _results.get(name)
+    if result is None:
+        result = {"history": deque(maxlen=HEALTH_HISTORY_SIZE), "errors": 0}
+        _results[name] = result
+    result["status"] = status
+    result["latency_ms"] = latency_ms
+    result["detail"] = detail
+    result["checked_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    result["history"].append(latency_ms if status == STATUS_OK else None)
+    if status == STATUS_ERROR:
+        result["errors"] += 1
+
+
+def run_health_checks():
+    """설정된 점검을 모두 한 번 실행 (각 점검은 제한 시간 안에 끝나지 않으면 실패로 기록)"""
+    with _lock:
+        probes = dict(_probes)
+
+    started = {}
+    for name, probe in probes.items():
+        with _lock:
+            previous = _inflight.get(name)
+            if previous is not None and not previous.done():
+                # 이전 점검이 아직 멈춰 있음 → 새로 제출하지 않고 실패로 기록
+                _record(name, STATUS_ERROR, None, "이전 점검이 아직 끝나지 않음 (응답 없음)")
+                continue
+            future = _executor.submit(probe)
+            _inflight[name] = future
+        started[name] = (time.perf_counter(), future)
+
+    for name, (start, future) in started.items():
+        try:
+            detail = future.result(timeout=HEALTH_CHECK_TIMEOUT_SECONDS)
+            status = STATUS_OK
+        except FutureTimeoutError:
+            future.cancel()  # 아직 대기 중이면 취소 (이미 실행 중이면 다음 주기에 건너뜀)
+            detail = f"{HEALTH_CHECK_TIMEOUT_SECONDS}초 안에 응답 없음"
+            status = STATUS_ERROR
+        except Exception as e:
+            detail = str(e)
+            status = STATUS_ERROR
+        latency_ms = round((time.perf_counter() - start) * 1000, 1)
+        with _lock:
+            if name in _probes:
+                _record(name, status, latency_ms, detail)
+
+
+def _monitor_loop():
+    """주기적으로 점검 실행"""
+    while True:
+        try:
+            run_health_checks()
+        except Exception:
+            pass
+        time.sleep(HEALTH_CHECK_INTERVAL_SECONDS)
+
+
+def start_health_monitor():
+    """점검 스레드 시작 (프로세스당 한 번만)"""
+    global _monitor_thread
+    with _lock:
+        if _monitor_thread is not None and _monitor_thread.is_alive():
+            return
+        _monitor_thread = threading.Thread(target=_monitor_loop, name="health-monitor", daemon=True)
+        _monitor_thread.start()
+
+
+def get_health_results():
+    """최근 점검 결과 목록 (관리자 페이지용, 아직 점검 전인 대상은 대기 상태)"""
+    with _lock:
+        rows = []
+        for name in _probes:
+            result = _results.get(name)
+            if result is None:
+                rows.append({
+                    "저장소": name, "상태": "⏳ 대기", "응답 시간(ms)": None, "최근 응답 시간": [],
+                    "오류 횟수": 0, "마지막 점검": "", "내용": "",
+                })
+                continue
+            rows.append({
+                "저장소": name,
+                "상태": "✅ 정상" if result["status"] == STATUS_OK else "❌ 오류",
+                "응답 시간(ms)": result["latency_ms"],
+                "최근 응답 시간": [v for v in result["history"] if v is not None],
+                "오류 횟수": result["errors"],
+                "마지막 점검": result["checked_at"],
+                "내용": result["detail"],
+            })
+        return rows
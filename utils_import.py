@@ -0,0 +1,270 @@
+"""
+질문 일괄 가져오기 유틸리티
+- 업로드된 CSV / Excel / JSONL 파일을 한 행씩 읽어 처리 (파일 전체를 메모리에 올리지 않음)
+- JSON 배열 파일은 형식상 한 번에 읽음
+- 행마다 id / name / question / timestamp / likes 검증 및 변환 (JSONL의 깨진 줄도 잘못된 행으로 집계)
+- 기존 질문 및 파일 안의 중복 제거 후 batch 단위 트랜잭션으로 저장
+"""
+
+import csv
+import hashlib
+import io
+import json
+from datetime import datetime
+
+from utils_db import assign_question_ids, connect, init_db, invalidate_counters, refresh_question_counters
+
+IMPORT_BATCH_SIZE = 500
+
+# 업로드 허용 확장자 -> 형식
+IMPORT_FORMATS = {
+    "csv": "csv",
+    "xlsx": "xlsx",
+    "json": "json",
+    "jsonl": "jsonl",
+    "ndjson": "jsonl",
+}
+
+# 작성 시간으로 받아들이는 형식 (저장은 "%Y-%m-%d %H:%M:%S")
+TIMESTAMP_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y.%m.%d %H:%M:%S",
+    "%Y-%m-%d",
+]
+
+# 오류 메시지는 앞쪽 일부만 보관
+MAX_IMPORT_ERRORS = 20
+
+
+def detect_import_format(file_name):
+    """파일 이름 확장자로 형식 판별 (지원하지 않으면 None)"""
+    ext = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else ""
+    return IMPORT_FORMATS.get(ext)
+
+
+def _file_size(file):
+    """업로드 파일 크기 (진행률 계산용)"""
+    size = getattr(file, "size", None)
+    if size is None:
+        position = file.tell()
+        file.seek(0, io.SEEK_END)
+        size = file.tell()
+        file.seek(position)
+    return size or 0
+
+
+def iter_raw_rows(file, fmt):
+    """
+    파일에서 원본 행(dict)을 하나씩 읽는 제너레이터
+    - (행, 진행률 0~1 또는 None) 튜플을 반환
+    - JSONL에서 읽을 수 없는 줄은 행 대신 ValueError 객체를 반환 (coerce_row에서 잘못된 행으로 처리)
+    """
+    file.seek(0)
+    size = _file_size(file)
+
+    if fmt == "csv":
+        text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        try:
+            for row in csv.DictReader(text):
+                yield row, (file.tell() / size if size else None)
+        finally:
+            text.detach()
+    elif fmt == "jsonl":
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                row = ValueError(f"JSON 형식 오류: {getattr(e, 'msg', e)}")
+            yield row, (file.tell() / size if size else None)
+    elif fmt == "json":
+        data = json.load(file)
+        if isinstance(data, dict):
+            data = data.get("questions", [])
+        total = len(data)
+        for index, row in enumerate(data, 1):
+            yield row, index / total
+    elif fmt == "xlsx":
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.worksheets[0]
+            rows = worksheet.iter_rows(values_only=True)
+            header = [str(h).strip() if h is not None else "" for h in next(rows, [])]
+            total = (worksheet.max_row or 0) - 1
+            for index, values in enumerate(rows, 1):
+                if values is None or all(v is None for v in values):
+                    continue
+                yield dict(zip(header, values)), (min(1.0, index / total) if total > 0 else None)
+        finally:
+            workbook.close()
+    else:
+        raise ValueError(f"지원하지 않는 가져오기 형식: {fmt}")
+
+
+def _parse_timestamp(value):
+    """
+    작성 시간을 저장 형식 문자열로 변환
+    - 비어 있으면 빈 문자열 (현재 시간을 넣으면 같은 파일을 다시 가져올 때 중복 판별이 안 됨)
+    """
+    if value is None or str(value).strip() == "":
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    text = str(value).strip()
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            continue
+    raise ValueError(f"작성 시간 형식 오류: {text}")
+
+
+def _parse_int(value, field, default=None):
+    """정수 변환 (엑셀의 3.0 같은 값도 허용)"""
+    if value is None or str(value).strip() == "":
+        return default
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} 값이 숫자가 아닙니다: {value}")
+    try:
+        is_integer = number == int(number)
+    except (OverflowError, ValueError):  # inf / nan
+        raise ValueError(f"{field} 값이 숫자가 아닙니다: {value}")
+    if not is_integer:
+        raise ValueError(f"{field} 값이 정수가 아닙니다: {value}")
+    return int(number)
+
+
+def coerce_row(raw):
+    """원본 행을 질문 dict로 변환 (잘못된 행은 ValueError)"""
+    if isinstance(raw, ValueError):
+        raise raw
+    if not isinstance(raw, dict):
+        raise ValueError("행 형식 오류")
+    question = str(raw.get("question") or "").strip()
+    if not question:
+        raise ValueError("질문 내용이 비어 있습니다")
+    name = str(raw.get("name") or "").strip() or "익명"
+    likes = _parse_int(raw.get("likes"), "likes", 0)
+    if likes < 0:
+        raise ValueError(f"likes 값이 음수입니다: {likes}")
+    question_id = _parse_int(raw.get("id"), "id")
+    if question_id is not None and question_id <= 0:
+        question_id = None
+    return {
+        "id": question_id,
+        "name": name,
+        "question": question,
+        "timestamp": _parse_timestamp(raw.get("timestamp")),
+        "likes": likes,
+    }
+
+
+def _row_key(name, question, timestamp):
+    """중복 판별 키 (작성자 + 질문 + 작성 시간)"""
+    return hashlib.blake2b(f"{name}\x1f{question}\x1f{timestamp}".encode("utf-8"), digest_size=16).digest()
+
+
+def _existing_keys(cursor):
+    """저장된 질문들의 중복 판별 키 집합"""
+    keys = set()
+    cursor.execute('SELECT name, question, timestamp FROM questions')
+    while True:
+        rows = cursor.fetchmany(1000)
+        if not rows:
+            break
+        for name, question, timestamp in rows:
+            keys.add(_row_key(name, question, timestamp))
+    return keys
+
+
+def _insert_batch(conn, batch):
+    """
+    한 batch를 한 트랜잭션으로 저장
+    - BEGIN IMMEDIATE로 쓰기 잠금을 잡은 뒤 id를 예약 → 동시에 등록된 질문과 id가 겹치지 않음
+    - 저장한 id 목록 반환
+    """
+    cursor = conn.cursor()
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        assign_question_ids(cursor, batch)
+        cursor.executemany(
+            'INSERT INTO questions (id, name, question, timestamp, likes) VALUES (?, ?, ?, ?, ?)',
+            [(q["id"], q["name"], q["question"], q["timestamp"], q["likes"]) for q in batch]
+        )
+        refresh_question_counters(cursor)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return [q["id"] for q in batch]
+
+
+def import_questions(file, fmt, batch_size=IMPORT_BATCH_SIZE, progress=None):
+    """
+    업로드 파일을 읽어 질문 추가
+    - 기존 질문과 내용이 같은 행은 건너뜀, id가 이미 쓰였거나 삭제된 질문의 id면 새 id 부여
+    - progress(진행률, 처리한 행 수): batch마다 호출
+    - 결과 요약 dict 반환 (inserted, duplicates, invalid, errors, ids, failed)
+    - 도중에 오류가 나면 그때까지 저장한 batch는 그대로 두고 failed에 오류 메시지를 담아 반환
+      (호출한 쪽이 이미 저장된 행을 미러/변경 피드에 반영할 수 있도록)
+    """
+    init_db()
+    conn = connect()
+    summary = {"inserted": 0, "duplicates": 0, "invalid": 0, "errors": [], "ids": [], "failed": None}
+    try:
+        keys = _existing_keys(conn.cursor())
+        batch = []
+        processed = 0
+        fraction = None
+
+        def flush():
+            if not batch:
+                return
+            summary["ids"].extend(_insert_batch(conn, batch))
+            summary["inserted"] += len(batch)
+            batch.clear()
+            if progress:
+                progress(fraction, processed)
+
+        try:
+            for line_no, (raw, fraction) in enumerate(iter_raw_rows(file, fmt), 1):
+                processed += 1
+                try:
+                    q = coerce_row(raw)
+                except ValueError as e:
+                    summary["invalid"] += 1
+                    if len(summary["errors"]) < MAX_IMPORT_ERRORS:
+                        summary["errors"].append(f"{line_no}번째 행: {e}")
+                    continue
+
+                key = _row_key(q["name"], q["question"], q["timestamp"])
+                if key in keys:
+                    summary["duplicates"] += 1
+                    continue
+                keys.add(key)
+                batch.append(q)
+
+                if len(batch) >= batch_size:
+                    flush()
+            flush()
+        except ImportError:
+            if not summary["inserted"]:
+                raise
+            summary["failed"] = "필요한 패키지가 없어 가져오기가 중단되었습니다"
+        except Exception as e:
+            summary["failed"] = f"{processed}번째 행 처리 중 중단: {e}"
+    finally:
+        conn.close()
+        invalidate_counters()
+    if progress:
+        progress(1.0, summary["inserted"] + summary["duplicates"] + summary["invalid"])
+    return summary
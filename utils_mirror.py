@@ -0,0 +1,68 @@
+"""
+Google Sheets 미러 지연 쓰기 유틸리티
+- 좋아요처럼 자주 일어나는 변경은 SQLite에만 바로 저장하고, 시트는 잠시 모았다가 한 번에 덮어씀
+  (시트는 워크시트 단위로만 쓸 수 있어서 클릭마다 쓰면 매번 전체를 다시 보냄)
+- 시트를 다시 읽기 전에는 밀린 쓰기를 먼저 반영 → 예전 시트 값으로 SQLite를 덮어쓰지 않음
+- 프로세스 종료 시에도 밀린 쓰기를 반영
+"""
+
+import atexit
+import logging
+import threading
+
+from utils_db import QUESTION_COLUMNS, iter_question_rows
+
+# 마지막 변경 후 시트에 반영하기까지 기다리는 시간 (이 사이의 변경은 한 번에 반영)
+MIRROR_DELAY_SECONDS = 10
+
+logger = logging.getLogger(__name__)
+
+_write_lock = threading.Lock()  # 시트 쓰기 직렬화
+_state_lock = threading.Lock()
+_state = {"writer": None, "timer": None, "dirty": False}
+
+
+def configure_mirror(writer):
+    """시트 쓰기 함수 등록 - writer(rows): SQLite의 전체 질문 목록(dict)을 시트에 덮어씀"""
+    with _state_lock:
+        _state["writer"] = writer
+
+
+def schedule_mirror():
+    """미러 쓰기 예약 (이미 예약되어 있으면 그때 함께 반영)"""
+    with _state_lock:
+        if _state["writer"] is None:
+            return
+        _state["dirty"] = True
+        if _state["timer"] is None:
+            timer = threading.Timer(MIRROR_DELAY_SECONDS, flush_mirror)
+            timer.daemon = True
+            _state["timer"] = timer
+            timer.start()
+
+
+def flush_mirror():
+    """
+    밀린 미러 쓰기를 지금 반영
+    - 반영할 것이 없으면 False
+    - 쓰기에 실패하면 로그를 남기고 다시 예약
+    """
+    with _write_lock:
+        with _state_lock:
+            if _state["timer"] is not None:
+                _state["timer"].cancel()
+                _state["timer"] = None
+            if not _state["dirty"] or _state["writer"] is None:
+                return False
+            _state["dirty"] = False
+            writer = _state["writer"]
+        try:
+            writer([dict(zip(QUESTION_COLUMNS, row)) for row in iter_question_rows()])
+        except Exception:
+            logger.exception("Google Sheets 미러 쓰기 실패 - 다시 예약")
+            schedule_mirror()
+            return False
+    return True
+
+
+atexit.register(flush_mirror)
@@ -0,0 +1,24 @@
+"""
+PDF 뷰어 커스텀 컴포넌트
+- pdf.js를 컴포넌트 폴더(components/pdf_viewer/pdfjs)에서 제공 (외부 CDN 없이 동작)
+- PDF는 정적 파일 URL로 전달하고, pdf.js가 Range 요청으로 보고 있는 페이지만 받아옴
+"""
+
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+COMPONENT_DIR = Path(__file__).parent / "components" / "pdf_viewer"
+COMPONENT_AVAILABLE = (COMPONENT_DIR / "index.html").exists()
+
+_pdf_viewer = None
+if COMPONENT_AVAILABLE:
+    _pdf_viewer = components.declare_component("pdf_viewer", path=str(COMPONENT_DIR))
+
+
+def pdf_viewer(url, height=820, key=None):
+    """PDF 뷰어 컴포넌트 렌더링 (컴포넌트를 쓸 수 없으면 False 반환)"""
+    if _pdf_viewer is None:
+        return False
+    _pdf_viewer(url=url, height=height, key=key, default=None)
+    return True
@@ -0,0 +1,64 @@
+"""
+질문 목록 커스텀 컴포넌트
+- 질문 스냅샷을 압축된 JSON(행 배열)으로 한 번 전달
+- 정렬 / 검색 / 페이지 이동은 브라우저에서 처리
+- 서버로는 좋아요 이벤트만 전달
+"""
+
+import threading
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+COMPONENT_DIR = Path(__file__).parent / "components" / "question_list"
+COMPONENT_AVAILABLE = (COMPONENT_DIR / "index.html").exists()
+
+# 화면 정렬 옵션 -> 컴포넌트 정렬 키
+SORT_KEYS = {
+    "👍 좋아요 순": "likes",
+    "🕒 최신순": "latest",
+    "📝 작성자순": "author",
+}
+
+_question_list = None
+if COMPONENT_AVAILABLE:
+    _question_list = components.declare_component("question_list", path=str(COMPONENT_DIR))
+
+_rows_lock = threading.Lock()
+_rows_cache = {"version": None, "rows": None}
+
+
+def build_snapshot_rows(version, questions):
+    """질문 목록을 [id, name, question, timestamp, likes] 행으로 변환 (데이터 버전별 1회)"""
+    with _rows_lock:
+        if _rows_cache["version"] == version and _rows_cache["rows"] is not None:
+            return _rows_cache["rows"]
+    rows = [
+        [q.get("id"), q.get("name", "익명"), q.get("question", ""), q.get("timestamp", ""), q.get("likes", 0)]
+        for q in questions
+    ]
+    with _rows_lock:
+        _rows_cache["version"] = version
+        _rows_cache["rows"] = rows
+    return rows
+
+
+def question_list(version, questions, liked_ids, sort_option="👍 좋아요 순", new_id=None, page_size=20,
+                  like_seq=None, key=None):
+    """
+    질문 목록 컴포넌트 렌더링
+    - like_seq: 서버가 마지막으로 처리한 좋아요 이벤트 번호 (화면에 먼저 반영한 좋아요를 서버 결과로 맞춤)
+    - 반환값: 마지막 좋아요 이벤트 {"id": 질문 id, "seq": 이벤트 번호} 또는 None
+    """
+    if _question_list is None:
+        return None
+    return _question_list(
+        rows=build_snapshot_rows(version, questions),
+        liked=sorted(liked_ids),
+        sort=SORT_KEYS.get(sort_option, "likes"),
+        new_id=new_id,
+        page_size=page_size,
+        like_seq=like_seq,
+        key=key,
+        default=None,
+    )
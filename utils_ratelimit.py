@@ -0,0 +1,128 @@
+"""
+세션별 요청 제한 (토큰 버킷) 유틸리티
+- 프로세스 전역에서 (세션, 동작) 단위로 버킷 관리
+- secrets의 [rate_limits.<동작>]으로 속도/버스트 조정 가능
+- 허용/차단 횟수는 관리자 페이지에서 확인
+"""
+
+import threading
+import time
+
+import streamlit as st
+
+# 기본 제한값 (per_minute: 분당 충전 토큰 수, burst: 연속 허용 횟수)
+DEFAULT_RATE_LIMITS = {
+    "submit": {"per_minute": 6, "burst": 3},
+    "like": {"per_minute": 60, "burst": 10},
+}
+
+# 이 시간(초) 이상 사용되지 않은 버킷은 정리
+BUCKET_IDLE_SECONDS = 600
+MAX_BUCKETS = 10000
+
+
+class TokenBucket:
+    """토큰 버킷 (rate: 초당 충전량, burst: 최대 토큰 수)"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def consume(self, amount=1):
+        """토큰 사용 시도 - (허용 여부, 다시 시도까지 남은 초)"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True, 0.0
+        if self.rate <= 0:
+            return False, float("inf")
+        return False, (amount - self.tokens) / self.rate
+
+
+_lock = threading.Lock()
+_buckets = {}
+_hit_counters = {}
+
+
+def get_rate_limits():
+    """동작별 제한값 (secrets 설정이 있으면 기본값을 덮어씀)"""
+    limits = {action: dict(cfg) for action, cfg in DEFAULT_RATE_LIMITS.items()}
+    try:
+        overrides = st.secrets.get("rate_limits", {})
+        for action, cfg in overrides.items():
+            limits.setdefault(action, {}).update(dict(cfg))
+    except Exception:
+        pass
+    return limits
+
+
+def get_session_key():
+    """현재 Streamlit 세션 식별자"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            return ctx.session_id
+    except Exception:
+        pass
+    return "anonymous"
+
+
+def _prune_buckets(now):
+    """오래 사용되지 않은 버킷 정리 (lock 안에서 호출)"""
+    idle = [key for key, bucket in _buckets.items() if now - bucket.updated > BUCKET_IDLE_SECONDS]
+    for key in idle:
+        del _buckets[key]
+
+
+def check_rate_limit(action, session_key=None):
+    """
+    요청 허용 여부 확인 - (허용 여부, 다시 시도까지 남은 초)
+    제한 설정이 없는 동작은 항상 허용
+    """
+    cfg = get_rate_limits().get(action)
+    if not cfg:
+        return True, 0.0
+    if session_key is None:
+        session_key = get_session_key()
+
+    rate = float(cfg.get("per_minute", 60)) / 60.0
+    burst = max(1, int(cfg.get("burst", 1)))
+    key = (session_key, action)
+
+    with _lock:
+        bucket = _buckets.get(key)
+        if bucket is None or bucket.rate != rate or bucket.burst != burst:
+            if len(_buckets) >= MAX_BUCKETS:
+                _prune_buckets(time.monotonic())
+            bucket = TokenBucket(rate, burst)
+            _buckets[key] = bucket
+        allowed, retry_after = bucket.consume()
+
+        counters = _hit_counters.setdefault(action, {"allowed": 0, "throttled": 0})
+        counters["allowed" if allowed else "throttled"] += 1
+    return allowed, retry_after
+
+
+def get_rate_limit_stats():
+    """동작별 허용/차단 횟수 및 활성 버킷 수 (관리자 페이지용)"""
+    limits = get_rate_limits()
+    with _lock:
+        active = {}
+        for _, action in _buckets:
+            active[action] = active.get(action, 0) + 1
+        return [
+            {
+                "동작": action,
+                "분당 허용": cfg.get("per_minute"),
+                "버스트": cfg.get("burst"),
+                "허용": _hit_counters.get(action, {}).get("allowed", 0),
+                "차단": _hit_counters.get(action, {}).get("throttled", 0),
+                "활성 세션": active.get(action, 0),
+            }
+            for action, cfg in limits.items()
+        ]
@@ -0,0 +1,88 @@
+"""
+정적 파일(PDF 등) 서빙 유틸리티
+- 파일 내용 해시로 이름을 붙여 static/assets 폴더에 한 번만 복사 (내용이 바뀌면 이름도 바뀜)
+- Streamlit 정적 파일 경로(app/static/...)로 제공 → 브라우저가 URL 단위로 캐시
+- ?v=해시 를 붙이면 장기 캐시 헤더, ETag / Range 요청은 Streamlit(tornado)이 처리
+- 해시는 (경로, 수정 시간, 크기) 기준으로 프로세스 메모리에 보관해 재실행마다 다시 읽지 않음
+
+.streamlit/config.toml 의 [server] enableStaticServing = true 필요
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).parent / "static"
+ASSET_DIR = STATIC_DIR / "assets"
+STATIC_URL_PREFIX = "app/static"
+
+HASH_CHUNK_SIZE = 1024 * 1024
+HASH_LENGTH = 16
+
+_lock = threading.Lock()
+_published = {}  # 원본 경로 -> (수정 시간, 크기, URL)
+_digests = {}    # 원본 경로 -> (수정 시간, 크기, 해시)
+
+
+def file_digest(path):
+    """파일 내용 해시 (chunk 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def cached_file_digest(path):
+    """파일 내용 해시 (수정 시간/크기가 그대로면 다시 읽지 않음), 파일이 없으면 None"""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = str(path.resolve())
+    with _lock:
+        cached = _digests.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+    digest = file_digest(path)
+    with _lock:
+        _digests[key] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def publish_static_asset(path):
+    """
+    파일을 내용 해시 이름으로 static/assets에 복사하고 URL 반환
+    - 같은 내용이면 다시 복사하지 않음
+    - 파일이 없으면 None
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = str(path.resolve())
+    with _lock:
+        cached = _published.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+    digest = cached_file_digest(path)
+    if digest is None:
+        return None
+    asset_name = f"{digest}{path.suffix.lower()}"
+    asset_path = ASSET_DIR / asset_name
+    if not asset_path.exists():
+        ASSET_DIR.mkdir(parents=True, exist_ok=True)
+        partial_path = ASSET_DIR / f".{asset_name}.{os.getpid()}.partial"
+        shutil.copyfile(path, partial_path)
+        os.replace(partial_path, asset_path)
+
+    url = f"{STATIC_URL_PREFIX}/assets/{asset_name}?v={digest}"
+    with _lock:
+        _published[key] = (stat.st_mtime_ns, stat.st_size, url)
+    return url
@@ -9,6 +9,8 @@ import pandas as pd
 from datetime import datetime
 from pathlib import Path
 
+from utils_db import set_counter, visits_counter_name
+
 # 통계 데이터 파일 경로
 STATS_FILE = "stats.json"
 STATS_WORKSHEET = "stats"
@@ -43,8 +45,19 @@ def load_stats():
             return []
     return []
 
+def update_visit_counter(stats):
+    """오늘 조회수 카운터를 통계 데이터와 맞춤 (헤더 KPI는 이 카운터만 읽음)"""
+    try:
+        today = datetime.now().strftime("%Y-%m-%d")
+        today_visits = sum(s.get('visit_count', 0) for s in stats if s.get('date') == today)
+        set_counter(visits_counter_name(today), today_visits)
+    except:
+        pass
+
 def save_stats(stats):
     """통계 데이터 저장"""
+    update_visit_counter(stats)
+    
     # Google Sheets 사용 시도
     try:
         from st_gsheets_connection import GSheetsConnection
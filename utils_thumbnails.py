@@ -0,0 +1,150 @@
+"""
+PDF 페이지 썸네일 유틸리티
+- lunch_talk_record의 PDF를 페이지별 이미지(WebP, Pillow가 없으면 PNG)로 미리 렌더링
+- 여러 너비로 만들어 srcset으로 제공 (모바일은 작은 이미지만 받음)
+- 파일 내용 해시로 이름을 붙여 static/assets/thumbs에 보관 → PDF가 바뀌면 자동으로 새로 생성
+- 앱 시작 시 백그라운드 스레드로 렌더링, 또는 빌드 때 `python utils_thumbnails.py` 실행
+
+PyMuPDF(pymupdf)가 설치되어 있을 때만 동작 (없으면 THUMBNAILS_ENABLED = False)
+"""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+from utils_static import ASSET_DIR, STATIC_URL_PREFIX, cached_file_digest
+
+try:
+    import fitz  # PyMuPDF
+    THUMBNAILS_ENABLED = True
+except ImportError:
+    THUMBNAILS_ENABLED = False
+
+try:
+    from PIL import Image
+    THUMBNAIL_FORMAT = "webp"
+except ImportError:
+    Image = None
+    THUMBNAIL_FORMAT = "png"
+
+THUMB_DIR = ASSET_DIR / "thumbs"
+THUMB_URL_PREFIX = f"{STATIC_URL_PREFIX}/assets/thumbs"
+
+# 렌더링할 이미지 너비(px) / 최대 페이지 수 / WebP 품질
+THUMBNAIL_WIDTHS = (320, 640, 960)
+THUMBNAIL_MAX_PAGES = 20
+THUMBNAIL_QUALITY = 80
+
+RECORD_DIR = Path(__file__).parent / "lunch_talk_record"
+
+_lock = threading.Lock()
+_prerender_thread = None
+
+
+def _manifest_path(digest):
+    """썸네일 목록 파일 경로"""
+    return THUMB_DIR / f"{digest}.json"
+
+
+def _save_pixmap(pixmap, target):
+    """렌더링 결과를 이미지 파일로 저장"""
+    partial = target.with_name(f".{target.name}.{os.getpid()}.partial")
+    if Image is not None:
+        image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+        image.save(partial, format="WEBP", quality=THUMBNAIL_QUALITY, method=4)
+    else:
+        pixmap.save(str(partial), output="png")
+    os.replace(partial, target)
+
+
+def render_thumbnails(path, widths=THUMBNAIL_WIDTHS, max_pages=THUMBNAIL_MAX_PAGES):
+    """
+    PDF 페이지 이미지 생성 (이미 있으면 건너뜀)
+    - 반환: {"pages": [{너비: 파일 이름}, ...]} 또는 None (PyMuPDF 없음 / 파일 없음)
+    """
+    if not THUMBNAILS_ENABLED:
+        return None
+    digest = cached_file_digest(path)
+    if digest is None:
+        return None
+    manifest_path = _manifest_path(digest)
+    if manifest_path.exists():
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    THUMB_DIR.mkdir(parents=True, exist_ok=True)
+    pages = []
+    with fitz.open(str(path)) as document:
+        for page_index in range(min(len(document), max_pages)):
+            page = document[page_index]
+            images = {}
+            for width in widths:
+                zoom = width / page.rect.width
+                pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+                name = f"{digest}_p{page_index + 1}_w{width}.{THUMBNAIL_FORMAT}"
+                _save_pixmap(pixmap, THUMB_DIR / name)
+                images[str(width)] = name
+            pages.append(images)
+
+    manifest = {"pages": pages}
+    partial = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.partial")
+    partial.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(partial, manifest_path)
+    return manifest
+
+
+def get_thumbnail_srcset(path, page=1):
+    """
+    렌더링이 끝난 페이지 이미지의 (기본 URL, srcset 문자열)
+    - 아직 렌더링 전이거나 사용할 수 없으면 None (여기서는 렌더링하지 않음)
+    """
+    digest = cached_file_digest(path)
+    if digest is None:
+        return None
+    manifest_path = _manifest_path(digest)
+    if not manifest_path.exists():
+        return None
+    try:
+        pages = json.loads(manifest_path.read_text(encoding="utf-8"))["pages"]
+        images = pages[page - 1]
+    except (ValueError, KeyError, IndexError):
+        return None
+    widths = sorted(images, key=int)
+    srcset = ", ".join(f"{THUMB_URL_PREFIX}/{images[w]} {w}w" for w in widths)
+    default_width = widths[len(widths) // 2]
+    return f"{THUMB_URL_PREFIX}/{images[default_width]}", srcset
+
+
+def prerender_thumbnails(paths):
+    """여러 PDF의 썸네일 렌더링 (실패한 파일은 건너뜀)"""
+    for path in paths:
+        try:
+            render_thumbnails(path)
+        except Exception:
+            pass
+
+
+def start_thumbnail_prerender(paths):
+    """썸네일 렌더링 스레드 시작 (프로세스당 한 번만, PyMuPDF가 없으면 아무 것도 하지 않음)"""
+    global _prerender_thread
+    if not THUMBNAILS_ENABLED:
+        return
+    with _lock:
+        if _prerender_thread is not None:
+            return
+        _prerender_thread = threading.Thread(
+            target=prerender_thumbnails, args=(list(paths),), name="pdf-thumbnails", daemon=True
+        )
+        _prerender_thread.start()
+
+
+if __name__ == "__main__":
+    # 빌드 단계에서 미리 렌더링: python utils_thumbnails.py [PDF 폴더]
+    if not THUMBNAILS_ENABLED:
+        print("PyMuPDF가 설치되어 있지 않아 썸네일을 만들 수 없습니다 (pip install pymupdf)")
+        sys.exit(0)
+    folder = Path(sys.argv[1]) if len(sys.argv) > 1 else RECORD_DIR
+    for pdf_path in sorted(folder.glob("*.pdf")):
+        manifest = render_thumbnails(pdf_path)
+        print(f"{pdf_path.name}: {len(manifest['pages']) if manifest else 0}쪽")
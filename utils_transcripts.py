@@ -0,0 +1,374 @@
+"""
+런치톡 녹취록 검색 유틸리티
+- 녹취록을 `MM:SS 화자 N` (또는 `H:MM:SS 화자 N`) 헤더 기준으로 구간(segment)으로 나눔
+- 구간은 SQLite FTS5(trigram 토크나이저) 테이블에 저장 → 한국어 부분 문자열 검색
+- 파일 내용 해시가 바뀐 파일만 다시 색인
+- 검색 결과는 관련도 순, 검색어를 <mark>로 강조한 짧은 발췌문으로 반환
+- 녹취록 보기용 구간 위치(byte offset) 색인: 파일을 한 번 훑어 구간 시작 위치만 기억하고,
+  화면에 보이는 구간만 mmap으로 읽음 (파일 크기와 관계없이 메모리 / 렌더링 비용은 보이는 범위만큼)
+"""
+
+import bisect
+import html
+import mmap
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from utils_static import cached_file_digest
+
+# 색인 DB (원본 텍스트에서 언제든 다시 만들 수 있는 파생 데이터라 questions.db와 분리)
+TRANSCRIPT_DB_FILE = Path(__file__).parent / "transcripts.db"
+RECORD_DIR = Path(__file__).parent / "lunch_talk_record"
+
+# 녹취록 구간 헤더: "00:52 화자 1", "01:18:07 화자 2"
+SEGMENT_HEADER_RE = re.compile(r"^(?:(\d{1,2}):)?(\d{1,2}):(\d{2})\s+(화자\s*\d+)\s*$", re.MULTILINE)
+
+# trigram 토크나이저는 3글자 이상만 색인 검색 가능 (더 짧으면 LIKE로 검색)
+TRIGRAM_MIN_LENGTH = 3
+SNIPPET_TOKENS = 24
+DEFAULT_SEARCH_LIMIT = 20
+
+# 발췌문 강조 표시 (HTML 이스케이프 후 <mark>로 바꿈)
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+
+# 헤더 없이 길게 이어지는 구간은 이 크기마다 줄 단위로 나눔 (한 페이지가 너무 커지지 않도록)
+MAX_SEGMENT_BYTES = 16 * 1024
+
+_lock = threading.Lock()
+_indexed = {}  # 파일 경로 -> 색인에 반영된 내용 해시
+_offset_indexes = {}  # 파일 경로 -> (내용 해시, 구간 위치 목록)
+
+
+def connect():
+    """색인 DB 연결"""
+    return sqlite3.connect(TRANSCRIPT_DB_FILE, timeout=10)
+
+
+def init_transcript_db(conn):
+    """색인 테이블 생성"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS transcript_files (
+            path TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            digest TEXT NOT NULL,
+            segments INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS transcript_fts USING fts5(
+            text,
+            path UNINDEXED,
+            seq UNINDEXED,
+            start_seconds UNINDEXED,
+            speaker UNINDEXED,
+            tokenize = 'trigram'
+        )
+    ''')
+    conn.commit()
+
+
+def format_timestamp(seconds):
+    """초를 MM:SS (1시간 이상이면 H:MM:SS) 형식으로"""
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def split_segments(text):
+    """
+    녹취록 텍스트를 구간으로 나눔
+    - 반환: [{"start_seconds", "speaker", "text"}, ...] (헤더가 없으면 전체를 한 구간으로)
+    """
+    headers = list(SEGMENT_HEADER_RE.finditer(text))
+    if not headers:
+        stripped = text.strip()
+        return [{"start_seconds": 0, "speaker": "", "text": stripped}] if stripped else []
+
+    segments = []
+    for index, match in enumerate(headers):
+        hours, minutes, seconds, speaker = match.groups()
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        body = text[match.end():end].strip()
+        if not body:
+            continue
+        segments.append({
+            "start_seconds": int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds),
+            "speaker": re.sub(r"\s+", " ", speaker),
+            "text": body,
+        })
+    return segments
+
+
+def transcript_files():
+    """녹취록 파일 목록 (구간 헤더가 있는 텍스트 파일)"""
+    files = []
+    for path in sorted(RECORD_DIR.glob("*.txt")):
+        try:
+            with path.open(encoding="utf-8") as f:
+                head = f.read(200)
+        except (OSError, UnicodeDecodeError):
+            continue
+        if SEGMENT_HEADER_RE.search(head):
+            files.append(path)
+    return files
+
+
+def ensure_transcript_index(paths=None):
+    """
+    내용이 바뀐 녹취록만 다시 색인 (재실행마다 호출해도 파일 해시만 비교)
+    - 반환: 다시 색인한 파일 수
+    """
+    if paths is None:
+        paths = transcript_files()
+    pending = []
+    for path in paths:
+        digest = cached_file_digest(path)
+        key = str(Path(path).resolve())
+        with _lock:
+            if digest is None or _indexed.get(key) == digest:
+                continue
+        pending.append((key, Path(path), digest))
+    if not pending:
+        return 0
+
+    reindexed = 0
+    conn = connect()
+    try:
+        init_transcript_db(conn)
+        for key, path, digest in pending:
+            row = conn.execute('SELECT digest FROM transcript_files WHERE path = ?', (key,)).fetchone()
+            if row is None or row[0] != digest:
+                segments = split_segments(path.read_text(encoding="utf-8"))
+                conn.execute('DELETE FROM transcript_fts WHERE path = ?', (key,))
+                conn.executemany(
+                    'INSERT INTO transcript_fts (text, path, seq, start_seconds, speaker) VALUES (?, ?, ?, ?, ?)',
+                    [(s["text"], key, seq, s["start_seconds"], s["speaker"]) for seq, s in enumerate(segments)]
+                )
+                conn.execute(
+                    'INSERT OR REPLACE INTO transcript_files (path, name, digest, segments) VALUES (?, ?, ?, ?)',
+                    (key, path.name, digest, len(segments))
+                )
+                conn.commit()
+                reindexed += 1
+            with _lock:
+                _indexed[key] = digest
+    finally:
+        conn.close()
+    return reindexed
+
+
+def segments_at(path, seconds_list):
+    """
+    녹취록에서 각 시간이 속한 구간 (시작 시간이 seconds 이하인 마지막 구간)
+    - 연결 하나로 한 번에 조회 (화면의 Q/A 카드마다 연결을 열지 않음)
+    - 반환: {seconds: {"timestamp", "start_seconds", "speaker", "text"}} (색인 전이거나 구간이 없는 시간은 빠짐)
+    """
+    key = str(Path(path).resolve())
+    segments = {}
+    conn = connect()
+    try:
+        for seconds in sorted(set(int(s) for s in seconds_list)):
+            row = conn.execute('''
+                SELECT start_seconds, speaker, text
+                FROM transcript_fts
+                WHERE path = ? AND CAST(start_seconds AS INTEGER) <= ?
+                ORDER BY CAST(start_seconds AS INTEGER) DESC, CAST(seq AS INTEGER) DESC
+                LIMIT 1
+            ''', (key, seconds)).fetchone()
+            if row is not None:
+                start_seconds, speaker, text = row
+                segments[seconds] = {
+                    "timestamp": format_timestamp(start_seconds),
+                    "start_seconds": int(start_seconds),
+                    "speaker": speaker,
+                    "text": text,
+                }
+    except sqlite3.OperationalError:
+        # 아직 색인 테이블이 없음
+        return {}
+    finally:
+        conn.close()
+    return segments
+
+
+def _highlight(text):
+    """강조 표시 문자를 <mark>로 바꾼 안전한 HTML"""
+    return html.escape(text).replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+def _like_snippet(text, query, width=60):
+    """LIKE 검색 결과용 발췌문 (첫 일치 위치 주변)"""
+    position = text.lower().find(query.lower())
+    if position < 0:
+        return text[:width * 2]
+    start = max(0, position - width)
+    end = min(len(text), position + len(query) + width)
+    snippet = (
+        text[start:position] + _MARK_START + text[position:position + len(query)] + _MARK_END
+        + text[position + len(query):end]
+    )
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(text) else "")
+
+
+def search_transcripts(query, limit=DEFAULT_SEARCH_LIMIT, paths=None):
+    """
+    녹취록 검색
+    - paths: 검색할 녹취록 파일 (None이면 색인된 전체)
+    - 반환: [{"file", "timestamp", "start_seconds", "speaker", "snippet_html"}, ...] (관련도 순)
+    """
+    terms = query.split()
+    if not terms:
+        return []
+    path_filter = ""
+    path_params = []
+    if paths is not None:
+        path_params = [str(Path(path).resolve()) for path in paths]
+        if not path_params:
+            return []
+        path_filter = f" AND t.path IN ({', '.join('?' * len(path_params))})"
+    conn = connect()
+    try:
+        init_transcript_db(conn)
+        if all(len(term) >= TRIGRAM_MIN_LENGTH for term in terms):
+            # 띄어쓰기로 나눈 단어가 모두 들어간 구간 (FTS 문법 문자는 따옴표로 감쌈)
+            phrase = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+            rows = conn.execute(f'''
+                SELECT f.name, t.start_seconds, t.speaker,
+                       snippet(transcript_fts, 0, ?, ?, '…', {SNIPPET_TOKENS})
+                FROM transcript_fts AS t
+                JOIN transcript_files AS f ON f.path = t.path
+                WHERE transcript_fts MATCH ?{path_filter}
+                ORDER BY rank
+                LIMIT ?
+            ''', [_MARK_START, _MARK_END, phrase, *path_params, int(limit)]).fetchall()
+        else:
+            patterns = [
+                "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                for term in terms
+            ]
+            where = " AND ".join(["t.text LIKE ? ESCAPE '\\'"] * len(patterns))
+            rows = [
+                (name, start_seconds, speaker, _like_snippet(text, terms[0]))
+                for name, start_seconds, speaker, text in conn.execute(f'''
+                    SELECT f.name, t.start_seconds, t.speaker, t.text
+                    FROM transcript_fts AS t
+                    JOIN transcript_files AS f ON f.path = t.path
+                    WHERE {where}{path_filter}
+                    ORDER BY f.name, CAST(t.seq AS INTEGER)
+                    LIMIT ?
+                ''', patterns + path_params + [int(limit)]).fetchall()
+            ]
+    finally:
+        conn.close()
+
+    return [
+        {
+            "file": name,
+            "timestamp": format_timestamp(start_seconds),
+            "start_seconds": int(start_seconds),
+            "speaker": speaker,
+            "snippet_html": _highlight(snippet),
+        }
+        for name, start_seconds, speaker, snippet in rows
+    ]
+
+
+def build_offset_index(path):
+    """
+    녹취록 구간 위치 색인 (파일을 줄 단위로 한 번 훑음, 본문은 보관하지 않음)
+    - 반환: [(구간 시작 byte, 본문 시작 byte, 본문 끝 byte, 시작 시간(초), 화자), ...]
+    - 본문이 빈 구간은 제외
+    """
+    entries = []
+    current = None  # [구간 시작, 본문 시작, 시작 시간, 화자, 본문 여부]
+    offset = 0
+
+    def close(end):
+        if current is not None and current[4]:
+            entries.append((current[0], current[1], end, current[2], current[3]))
+
+    with open(path, "rb") as f:
+        for raw_line in f:
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            match = SEGMENT_HEADER_RE.match(line)
+            if match:
+                close(offset)
+                hours, minutes, seconds, speaker = match.groups()
+                start_seconds = int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+                current = [offset, offset + len(raw_line), start_seconds, re.sub(r"\s+", " ", speaker), False]
+            elif line:
+                if current is None:
+                    current = [offset, offset, 0, "", False]
+                elif current[4] and offset - current[1] >= MAX_SEGMENT_BYTES:
+                    # 너무 긴 구간은 같은 시간 / 화자로 이어지는 구간으로 나눔
+                    close(offset)
+                    current = [offset, offset, current[2], current[3], False]
+                current[4] = True
+            offset += len(raw_line)
+    close(offset)
+    return entries
+
+
+def get_offset_index(path):
+    """구간 위치 색인 (파일 내용 해시가 그대로면 메모리의 색인을 재사용), 파일이 없으면 []"""
+    digest = cached_file_digest(path)
+    if digest is None:
+        return []
+    key = str(Path(path).resolve())
+    with _lock:
+        cached = _offset_indexes.get(key)
+    if cached and cached[0] == digest:
+        return cached[1]
+    entries = build_offset_index(path)
+    with _lock:
+        _offset_indexes[key] = (digest, entries)
+    return entries
+
+
+def count_segments(path):
+    """녹취록 구간 수"""
+    return len(get_offset_index(path))
+
+
+def read_segments(path, start, count):
+    """
+    start번째 구간부터 count개 구간 읽기 (해당 byte 범위만 mmap으로 읽음)
+    - 반환: [{"index", "timestamp", "start_seconds", "speaker", "text"}, ...]
+    """
+    entries = get_offset_index(path)[max(0, start):max(0, start) + count]
+    if not entries:
+        return []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return [
+            {
+                "index": max(0, start) + offset,
+                "timestamp": format_timestamp(start_seconds),
+                "start_seconds": start_seconds,
+                "speaker": speaker,
+                "text": view[body_start:body_end].decode("utf-8", errors="replace").strip(),
+            }
+            for offset, (_, body_start, body_end, start_seconds, speaker) in enumerate(entries)
+        ]
+
+
+def segment_index_at(path, seconds):
+    """해당 시간이 속한 구간 번호 (시작 시간이 seconds 이하인 마지막 구간)"""
+    entries = get_offset_index(path)
+    starts = [entry[3] for entry in entries]
+    return max(0, bisect.bisect_right(starts, int(seconds)) - 1)
+
+
+def parse_timestamp(text):
+    """'MM:SS' / 'H:MM:SS' / 초 문자열을 초로 (형식이 틀리면 None)"""
+    parts = text.strip().split(":")
+    if not parts or len(parts) > 3 or not all(part.isdigit() for part in parts):
+        return None
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds